@@ -22,13 +22,18 @@ __version__ = "1.0.0"
 from .pitch import TennisCourt
 from .theme import THEMES, SCATTER_STYLES
 from .grid import create_court_grid
+from .shots import ShotTable
+from .hexagg import HexAggregate
+from .live import LiveCourt
+from .atlas import CourtAtlas
+from .export import export_figures
 
 # =============================================================================
 # Advanced Visualizations
 # =============================================================================
 from .joint import joint_plot
 from .pizza import pizza_chart, pizza
-from .sonar import sonar_chart, sonar_from_shots, create_zone_grid
+from .sonar import sonar_chart, sonar_from_shots, create_zone_grid, SonarAggregate, SonarAccumulator
 from .radar import Radar
 
 # =============================================================================
@@ -46,7 +51,19 @@ from .chart import (
 # =============================================================================
 # Data Processing & Statistics
 # =============================================================================
-from .stats import transform_coordinate, classify_serve_zone, classify_shot_depth
+from .stats import (
+    transform_coordinate,
+    classify_serve_zone,
+    classify_shot_depth,
+    SERVE_ZONES,
+    SERVE_SIDES,
+    SHOT_DEPTHS
+)
+
+# =============================================================================
+# Match Loading
+# =============================================================================
+from .game import Game, load_game
 
 # =============================================================================
 # Public API
@@ -57,6 +74,11 @@ __all__ = [
     'THEMES',
     'SCATTER_STYLES',
     'create_court_grid',
+    'ShotTable',
+    'HexAggregate',
+    'LiveCourt',
+    'CourtAtlas',
+    'export_figures',
     
     # Advanced Viz
     'joint_plot',
@@ -65,6 +87,8 @@ __all__ = [
     'sonar_chart',
     'sonar_from_shots',
     'create_zone_grid',
+    'SonarAggregate',
+    'SonarAccumulator',
     'Radar',
     
     # Charts
@@ -79,4 +103,11 @@ __all__ = [
     'transform_coordinate',
     'classify_serve_zone',
     'classify_shot_depth',
+    'SERVE_ZONES',
+    'SERVE_SIDES',
+    'SHOT_DEPTHS',
+    
+    # Loading
+    'Game',
+    'load_game',
 ]
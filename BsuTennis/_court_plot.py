@@ -1,12 +1,222 @@
 
+from collections import OrderedDict
+from functools import lru_cache
+
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib import rcParams
+from matplotlib.artist import Artist
+from matplotlib.colors import to_rgba_array
+from matplotlib.font_manager import FontProperties
 from matplotlib.patches import Rectangle
+from matplotlib.backends.backend_agg import RendererAgg
+from matplotlib.path import Path
+from matplotlib.textpath import TextPath, text_to_path
+from matplotlib.transforms import Bbox, IdentityTransform
+from matplotlib.collections import LineCollection
 from matplotlib.colors import LinearSegmentedColormap
-from scipy.stats import gaussian_kde
 
 from .dimension import (WIDTH_SINGLES, WIDTH_DOUBLES, HALF_LENGTH, 
                         SERVICE_LINE_DISTANCE, ALLEY_WIDTH)
+from .shots import ShotTable, as_plot_xy
+from .kde import density_2d
+from .hexagg import HexAggregate
+from .live import LiveCourt
+
+@lru_cache(maxsize=None)
+def _court_segments(court_type, half, orientation):
+    """
+    Court line segments (and the net, last) in plot coordinates.
+    
+    Returns
+    -------
+    ndarray, shape (n_segments, 2, 2)
+        Read-only; shared by every draw of the same court layout.
+    """
+    w = (WIDTH_DOUBLES if court_type == 'doubles' else WIDTH_SINGLES) / 2
+    l = HALF_LENGTH
+    
+    lines = []
+    
+    # Helper: Add line segment ((x1, y1), (x2, y2))
+    def add_line(p1, p2):
+        lines.append((p1, p2))
+        
+    sw = WIDTH_SINGLES / 2
+    sl = SERVICE_LINE_DISTANCE
+    
+    # Baseline (Bottom)
+    if not half:
+        add_line((-w, -l), (w, -l))
+        # Baseline (Top)
+        add_line((-w, l), (w, l))
+        # Sides
+        add_line((-w, -l), (-w, l))
+        add_line((w, -l), (w, l))
+        # Singles Sidelines (Only draw if Doubles court, otherwise they overlap Sides)
+        if court_type == 'doubles':
+            add_line((-sw, -l), (-sw, l))
+            add_line((sw, -l), (sw, l))
+        
+        # Service Lines
+        add_line((-sw, -sl), (sw, -sl))
+        add_line((-sw, sl), (sw, sl))
+        # Center Service Line
+        add_line((0, -sl), (0, sl))
+        # Center Marks
+        add_line((0, -l), (0, -l + 0.1)) # Small mark
+        add_line((0, l), (0, l - 0.1))
+        
+    else:
+        # Half Court
+        # BaseLine
+        add_line((-w, l), (w, l))
+        # Sides
+        add_line((-w, 0), (-w, l))
+        add_line((w, 0), (w, l))
+        # Singles Sides
+        if court_type == 'doubles':
+            add_line((-sw, 0), (-sw, l))
+            add_line((sw, 0), (sw, l))
+        # Service Line
+        add_line((-sw, sl), (sw, sl))
+        # Center Service Line
+        add_line((0, 0), (0, sl))
+        # Center Mark
+        add_line((0, l), (0, l - 0.15))
+    
+    # Net Logic
+    # "Reality": Net posts are 0.914m outside the DOUBLES sidelines for a standard court.
+    # Even for singles matches on a standard court, the net is the doubles net supported by singles sticks.
+    # So we draw the full realistic net width always.
+    net_w = (WIDTH_DOUBLES / 2) + 0.914
+    add_line((-net_w, 0), (net_w, 0))
+    
+    segments = np.array(lines, dtype=float)
+    if orientation == 'horizontal':
+        segments = segments[:, :, ::-1].copy()
+    segments.flags.writeable = False
+    return segments
+
+
+# Pre-rendered court backgrounds, keyed by style, geometry and pixel size (LRU)
+_BACKGROUND_CACHE = OrderedDict()
+_BACKGROUND_CACHE_SIZE = 32
+
+
+def clear_background_cache():
+    """Drop all cached court background rasters."""
+    _BACKGROUND_CACHE.clear()
+
+
+# Default arrowhead length in collection mode, as a fraction of the singles width
+_ARROW_HEAD_FRACTION = 0.05
+
+# Value statistics supported by heatmap(values=...)
+HEATMAP_STATISTICS = ('sum', 'mean', 'median', 'std', 'min', 'max')
+
+
+class _CellLabels(Artist):
+    """
+    Many short, centered labels drawn by one artist.
+
+    Looks like one ``ax.text(..., ha='center', va='center')`` per label
+    without a Text artist (layout, bbox pass) per label. On vector backends
+    (PDF, SVG, PS) each label is one ``renderer.draw_text`` call, so it
+    stays real, selectable text. On Agg, where rasterizing text is the
+    cost, each distinct character is converted to an outline once and all
+    labels of a color are filled as a single path.
+    """
+
+    def __init__(self, x, y, labels, fontsize=8, color=None, fontweight='normal',
+                 fontfamily=None, fontstyle='normal'):
+        super().__init__()
+        self._xy = np.column_stack([x, y])
+        self._labels = list(labels)
+        self._prop = FontProperties(family=fontfamily, style=fontstyle, size=fontsize,
+                                    weight=fontweight)
+        self._glyphs = {}
+        self.set_zorder(3)  # Text default
+
+        # One color, or one per label; outlines are filled one path per color
+        colors = to_rgba_array(rcParams['text.color'] if color is None else color)
+        if len(colors) == 1:
+            self._colors, self._color_index = colors, np.zeros(len(self._labels), dtype=np.intp)
+        elif len(colors) == len(self._labels):
+            self._colors, self._color_index = np.unique(colors, axis=0, return_inverse=True)
+            self._color_index = self._color_index.ravel()
+        else:
+            raise ValueError(f"Got {len(colors)} colors for {len(self._labels)} labels")
+
+    def _glyph(self, char):
+        """Outline (in points, pen at the origin) and advance of ``char``."""
+        if char not in self._glyphs:
+            outline = TextPath((0, 0), char, prop=self._prop)
+            # Advance = pen movement, measured between two reference glyphs
+            measure = text_to_path.get_text_width_height_descent
+            advance = (measure('0' + char + '0', self._prop, ismath=False)[0]
+                       - measure('00', self._prop, ismath=False)[0])
+            self._glyphs[char] = (outline.vertices, outline.codes, advance)
+        return self._glyphs[char]
+
+    def _layout(self, renderer):
+        """Per label: baseline-left display position, width, line height and descent."""
+        measure = renderer.get_text_width_height_descent
+        # Text centers the line box, which is at least as tall as "lp"
+        _, lp_h, lp_d = measure('lp', self._prop, ismath=False)
+        drop = (lp_h - 2 * lp_d) / 2
+        widths = {label: measure(label, self._prop, ismath=False)[0]
+                  for label in set(self._labels)}
+        points = self.get_transform().transform(self._xy)
+        return [(px - widths[label] / 2, py - drop, widths[label], lp_h, lp_d)
+                for (px, py), label in zip(points, self._labels)]
+
+    def get_window_extent(self, renderer=None):
+        if not self._labels:
+            return Bbox.null()
+        if renderer is None:
+            renderer = self.figure._get_renderer()
+        return Bbox.union([Bbox.from_bounds(x, y - d, w, h)
+                           for x, y, w, h, d in self._layout(renderer)])
+
+    def _draw_outlines(self, renderer, gc):
+        scale = renderer.points_to_pixels(1.0)
+        vertices = [[] for _ in self._colors]
+        codes = [[] for _ in self._colors]
+        for (x, y, *_), label, group in zip(self._layout(renderer), self._labels,
+                                            self._color_index):
+            pen = x
+            for char in label:
+                glyph_vertices, glyph_codes, advance = self._glyph(char)
+                vertices[group].append(glyph_vertices * scale + (pen, y))
+                codes[group].append(glyph_codes)
+                pen += advance * scale
+
+        gc.set_linewidth(0)
+        for color, group_vertices, group_codes in zip(self._colors, vertices, codes):
+            if group_vertices:
+                path = Path(np.concatenate(group_vertices), np.concatenate(group_codes))
+                renderer.draw_path(gc, path, IdentityTransform(), tuple(color))
+
+    def draw(self, renderer):
+        if not self.get_visible() or not self._labels:
+            return
+        renderer.open_group('cell_labels', gid=self.get_gid())
+        gc = renderer.new_gc()
+        gc.set_alpha(self.get_alpha())
+        gc.set_url(self.get_url())
+        self._set_gc_clip(gc)
+        if isinstance(renderer, RendererAgg):
+            self._draw_outlines(renderer, gc)
+        else:
+            for (x, y, *_), label, group in zip(self._layout(renderer), self._labels,
+                                                self._color_index):
+                gc.set_foreground(tuple(self._colors[group]), isRGBA=True)
+                renderer.draw_text(gc, x, y, label, self._prop, 0)
+        gc.restore()
+        renderer.close_group('cell_labels')
+        self.stale = False
+
 
 class CourtPlotMixin:
     """
@@ -29,9 +239,6 @@ class CourtPlotMixin:
         pc = self.pitch_color
         lw = self.linewidth
         
-        w = self.width / 2
-        l = HALF_LENGTH
-        
         # Draw Background (Rectangle instead of set_facecolor because axis('off') hides it)
         # Draw Background (Rectangle covering extent + padding for 'outer border' effect)
         if pc:
@@ -54,80 +261,16 @@ class CourtPlotMixin:
             # Additional Outer Border/Edge if requested (User asked for circle/perimeter for theme)
             # This large rectangle acts as that 'colored' area.
             
-        # LINES GENERATION
-        # ... (lines generation logic unchanged here, but we need to ensure flow)
-        
-        lines = []
-        
-        # Helper: Add line segment ((x1, y1), (x2, y2))
-        def add_line(p1, p2):
-            lines.append((p1, p2))
-            
-        sw = WIDTH_SINGLES / 2
-        sl = SERVICE_LINE_DISTANCE
-        
-        # Baseline (Bottom)
-        if not self.half:
-            add_line((-w, -l), (w, -l))
-            # Baseline (Top)
-            add_line((-w, l), (w, l))
-            # Sides
-            add_line((-w, -l), (-w, l))
-            add_line((w, -l), (w, l))
-            # Singles Sidelines (Only draw if Doubles court, otherwise they overlap Sides)
-            if self.court_type == 'doubles':
-                add_line((-sw, -l), (-sw, l))
-                add_line((sw, -l), (sw, l))
-            
-            # Service Lines
-            add_line((-sw, -sl), (sw, -sl))
-            add_line((-sw, sl), (sw, sl))
-            # Center Service Line
-            add_line((0, -sl), (0, sl))
-            # Center Marks
-            add_line((0, -l), (0, -l + 0.1)) # Small mark
-            add_line((0, l), (0, l - 0.1))
-            
-        else:
-            # Half Court
-            # BaseLine
-            add_line((-w, l), (w, l))
-            # Sides
-            add_line((-w, 0), (-w, l))
-            add_line((w, 0), (w, l))
-            # Singles Sides
-            if self.court_type == 'doubles':
-                add_line((-sw, 0), (-sw, l))
-                add_line((sw, 0), (sw, l))
-            # Service Line
-            add_line((-sw, sl), (sw, sl))
-            # Center Service Line
-            add_line((0, 0), (0, sl))
-            # Center Mark
-            add_line((0, l), (0, l - 0.15))
-            
-            
-        # Draw Lines
-        for p1, p2 in lines:
-            x_pts = [p1[0], p2[0]]
-            y_pts = [p1[1], p2[1]]
-            
-            if self.orientation == 'horizontal':
-                ax.plot(y_pts, x_pts, color=lc, linewidth=lw, **kwargs)
-            else:
-                ax.plot(x_pts, y_pts, color=lc, linewidth=lw, **kwargs)
-
-        # Net Logic
-        # "Reality": Net posts are 0.914m outside the DOUBLES sidelines for a standard court.
-        # Even for singles matches on a standard court, the net is the doubles net supported by singles sticks.
-        # So we draw the full realistic net width always.
+        # LINES (+ net) as one LineCollection; geometry is cached per court layout
+        segments = _court_segments(self.court_type, self.half, self.orientation)
         
-        net_w = (WIDTH_DOUBLES / 2) + 0.914
-
-        if self.orientation == 'horizontal':
-            ax.plot([0, 0], [-net_w, net_w], color=lc, linestyle='-', linewidth=lw)
-        else:
-            ax.plot([-net_w, net_w], [0, 0], color=lc, linestyle='-', linewidth=lw)
+        # The net keeps a solid line whatever linestyle the court lines use
+        ls = kwargs.pop('linestyle', kwargs.pop('ls', '-'))
+        kwargs.setdefault('capstyle', 'projecting')  # Match ax.plot line ends
+        kwargs.setdefault('zorder', 2)               # Line2D default, above data collections
+        lines = LineCollection(segments, colors=lc, linewidths=lw,
+                               linestyles=[ls] * (len(segments) - 1) + ['-'], **kwargs)
+        ax.add_collection(lines)
             
         # Limits
         if self.orientation == 'horizontal':
@@ -143,6 +286,115 @@ class CourtPlotMixin:
         if not self.axis:
             ax.axis('off')
             
+    def live(self, ax=None, **kwargs):
+        """
+        Start a live view that adds shots without redrawing the court.
+        
+        The court is drawn once; ``LiveCourt.add`` then blits only the new
+        shots (and an optional rolling heatmap), so each update takes the
+        same time in the first game and the third set.
+        
+        Parameters
+        ----------
+        ax : matplotlib.axes.Axes, optional
+            The axes to draw on.
+        **kwargs : dict
+            Passed to ``LiveCourt`` (``trail``, ``heatmap``, ``window``, ``bins``, ...).
+        
+        Returns
+        -------
+        LiveCourt
+        """
+        return LiveCourt(self, ax=ax, **kwargs)
+
+    def draw_background(self, ax=None, guides=None):
+        """
+        Draw the court from a cached raster instead of vector artists.
+        
+        The background (pitch, lines, net and optional guides) is rendered
+        once per court style, theme and pixel size and reused as a single
+        image, so figures generated in bulk only render their data layers.
+        Create the figure at the dpi it will be saved with so the raster is
+        not resampled.
+        
+        Parameters
+        ----------
+        ax : matplotlib.axes.Axes, optional
+            The axes to draw on (final size/layout should already be set).
+        guides : dict, optional
+            Keyword arguments for ``draw_guides`` to bake into the background,
+            e.g. ``{'service_vertical_lines': 2, 'backcourt_line': True}``.
+        
+        Returns
+        -------
+        image : matplotlib.image.AxesImage
+        """
+        if ax is None:
+            ax = plt.gca()
+        
+        xlim, ylim, width_px, height_px = self._pixel_grid(ax)
+        dpi = ax.figure.dpi
+        
+        key = (self.court_type, self.half, self.orientation, self.line_color, self.pitch_color,
+               self.linewidth, width_px, height_px, dpi,
+               tuple(sorted(guides.items())) if guides else None)
+        if key in _BACKGROUND_CACHE:
+            _BACKGROUND_CACHE.move_to_end(key)
+            raster = _BACKGROUND_CACHE[key]
+        else:
+            raster = self._render_background(width_px, height_px, dpi, guides)
+            _BACKGROUND_CACHE[key] = raster
+            if len(_BACKGROUND_CACHE) > _BACKGROUND_CACHE_SIZE:
+                _BACKGROUND_CACHE.popitem(last=False)
+        
+        image = ax.imshow(raster, extent=(xlim[0], xlim[1], ylim[0], ylim[1]),
+                          origin='upper', interpolation='nearest', zorder=0)
+        ax.set_aspect('equal')
+        ax.set_xlim(*xlim)
+        ax.set_ylim(*ylim)
+        if not self.axis:
+            ax.axis('off')
+        return image
+    
+    def _pixel_grid(self, ax, padding=2):
+        """
+        Padded court limits and their size in pixels once the axes box is
+        shrunk to equal aspect (as done by ``draw``).
+        
+        Returns
+        -------
+        xlim, ylim : tuple
+        width_px, height_px : int
+        """
+        xlim = (self.extent[0] - padding, self.extent[1] + padding)
+        ylim = (self.extent[2] - padding, self.extent[3] + padding)
+        scale = min(ax.bbox.width / (xlim[1] - xlim[0]), ax.bbox.height / (ylim[1] - ylim[0]))
+        width_px = max(int(round((xlim[1] - xlim[0]) * scale)), 1)
+        height_px = max(int(round((ylim[1] - ylim[0]) * scale)), 1)
+        return xlim, ylim, width_px, height_px
+    
+    def _render_background(self, width_px, height_px, dpi, guides):
+        """Render the vector court offscreen into a read-only RGBA array."""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        fig = Figure(figsize=(width_px / dpi, height_px / dpi), dpi=dpi)
+        canvas = FigureCanvasAgg(fig)
+        fig.patch.set_alpha(0)
+        ax = fig.add_axes([0, 0, 1, 1])
+        ax.patch.set_alpha(0)
+        self.draw(ax=ax)
+        if guides:
+            self.draw_guides(ax, **guides)
+        # Fill the whole canvas with the padded court extent
+        ax.set_aspect('auto')
+        ax.axis('off')
+        canvas.draw()
+        
+        raster = np.asarray(canvas.buffer_rgba()).copy()
+        raster.flags.writeable = False
+        return raster
+
     def draw_guides(self, ax, service_vertical_lines=0, backcourt_line=False, color='grey', linestyle='--', linewidth=0.8, alpha=0.5):
         """
         Draw guide lines on top of the court.
@@ -211,9 +463,46 @@ class CourtPlotMixin:
         """Deprecated: Use draw_guides instead."""
         self.draw_guides(ax, **kwargs)
 
-    def scatter(self, ax, x, y, style=None, **kwargs):
+    def scatter(self, ax, x, y=None, style=None, mode='points', by=None,
+                cmap='Blues', how='log', resolution=None, **kwargs):
+        """
+        Scatter shot locations.
+        
+        Parameters
+        ----------
+        ax : matplotlib.axes.Axes
+            The axes to draw on.
+        x, y : array-like or ShotTable
+            Coordinates (in standard vertical court coords), or a ShotTable
+            passed as ``x`` (``y`` omitted).
+        style : str, optional
+            Preset from ``SCATTER_STYLES``.
+        mode : str, default 'points'
+            'points': one marker per shot (``ax.scatter``).
+            'density': points are binned to the output pixel grid and drawn as
+            a single image, shaded by count or colored by ``by``. Renders
+            millions of points in about a second with constant file size.
+        by : str or array-like, optional
+            Density mode: category per point (or a ShotTable column name such
+            as 'outcome'). Categories found in ``SCATTER_STYLES`` use their
+            colors; pixels blend the colors of the points they contain.
+        cmap : str or Colormap, default 'Blues'
+            Density mode: colormap for counts (ignored when ``by`` is given).
+        how : str, default 'log'
+            Density mode: count scaling, 'log' or 'linear'.
+        resolution : tuple of int, optional
+            Density mode: ``(width, height)`` of the bin grid. Defaults to the
+            axes size in pixels.
+        **kwargs : dict
+            Additional arguments passed to ax.scatter() (or ax.imshow()).
+        """
         from .theme import SCATTER_STYLES
         
+        if mode == 'density':
+            return self._density_scatter(ax, x, y, by, cmap, how, resolution, **kwargs)
+        if mode != 'points':
+            raise ValueError(f"mode must be 'points' or 'density', got {mode!r}")
+        
         plot_kwargs = {}
         if style:
              if isinstance(style, str) and style in SCATTER_STYLES:
@@ -221,18 +510,82 @@ class CourtPlotMixin:
         
         plot_kwargs.update(kwargs)
         
-        if self.orientation == 'horizontal':
-             plot_x, plot_y = y, x 
-             # Wait, Input X,Y logic. 
-             # If input is Standard Vertical (X=Width), then Horizontal X=Length=Y_input.
-             # So we plot (y, x).
-             # BUT usually users pass (x,y) in the coord system of the visual?
-             # Or (x,y) in data system?
-             # BaseCourt assumes data logic?
-             # Let's assume input X, Y are ALWAYS Standard Vertical (Data).
-             ax.scatter(y, x, **plot_kwargs)
+        # Input X, Y are ALWAYS Standard Vertical (Data).
+        # Horizontal courts plot length (data Y) along X.
+        px, py = as_plot_xy(x, y, self.orientation)
+        return ax.scatter(px, py, **plot_kwargs)
+
+    def _density_scatter(self, ax, x, y, by, cmap, how, resolution, **kwargs):
+        """Datashader-style aggregation of points onto the pixel grid."""
+        import pandas as pd
+        from matplotlib import colormaps
+        from matplotlib.colors import LogNorm, Normalize
+        from .theme import SCATTER_STYLES
+        
+        if how not in ('log', 'linear'):
+            raise ValueError(f"how must be 'log' or 'linear', got {how!r}")
+        
+        px, py = as_plot_xy(x, y, self.orientation)
+        xlim, ylim, width, height = self._pixel_grid(ax)
+        if resolution is not None:
+            width, height = resolution
+        
+        # Flat pixel index per point; points off the grid are dropped
+        ix = np.floor((px - xlim[0]) / (xlim[1] - xlim[0]) * width).astype(np.int64)
+        iy = np.floor((py - ylim[0]) / (ylim[1] - ylim[0]) * height).astype(np.int64)
+        valid = (ix >= 0) & (ix < width) & (iy >= 0) & (iy < height)
+        pixel = iy[valid] * width + ix[valid]
+        
+        kwargs.setdefault('interpolation', 'nearest')
+        kwargs.setdefault('zorder', 1)  # Same layer as ax.scatter
+        extent = (xlim[0], xlim[1], ylim[0], ylim[1])
+        
+        if by is None:
+            counts = np.bincount(pixel, minlength=width * height).reshape(height, width)
+            counts = np.ma.masked_equal(counts, 0)  # Empty pixels stay transparent
+            # No points on the grid: every pixel is masked, keep valid limits
+            vmax = counts.max() if counts.count() else 1
+            if how == 'log':
+                norm = LogNorm(vmin=1, vmax=max(vmax, 2))
+            else:
+                norm = Normalize(vmin=0, vmax=vmax)
+            return ax.imshow(counts, origin='lower', extent=extent, cmap=cmap, norm=norm,
+                             aspect=ax.get_aspect(), **kwargs)
+        
+        if isinstance(by, str) and isinstance(x, ShotTable):
+            by = x[by]
+        categories = pd.Categorical(by)
+        codes = np.asarray(categories.codes)[valid]
+        n_cat = len(categories.categories)
+        keep = codes >= 0
+        
+        # Counts per (pixel, category) in one bincount
+        counts = np.bincount(pixel[keep] * n_cat + codes[keep],
+                             minlength=width * height * n_cat).reshape(width * height, n_cat)
+        
+        default_colors = colormaps['tab10'].colors
+        palette = []
+        for i, name in enumerate(categories.categories):
+            style = SCATTER_STYLES.get(name, {})
+            color = style.get('facecolor', 'None')
+            if isinstance(color, str) and color.lower() == 'none':
+                color = style.get('edgecolor', default_colors[i % len(default_colors)])
+            palette.append(color)
+        palette = to_rgba_array(palette)[:, :3]
+        
+        # Blend category colors by count; opacity follows the total count
+        total = counts.sum(axis=1)
+        rgba = np.zeros((width * height, 4))
+        filled = total > 0
+        rgba[filled, :3] = (counts[filled] @ palette) / total[filled, None]
+        if how == 'log':
+            level = np.log1p(total[filled]) / np.log1p(total.max())
         else:
-             ax.scatter(x, y, **plot_kwargs)
+            level = total[filled] / total.max()
+        rgba[filled, 3] = 0.35 + 0.65 * level
+        
+        return ax.imshow(rgba.reshape(height, width, 4), origin='lower', extent=extent,
+                         aspect=ax.get_aspect(), **kwargs)
 
     def annotate(self, ax, x, y, text, fontsize=10, color='white', 
                  ha='center', va='center', bbox=None, **kwargs):
@@ -272,9 +625,11 @@ class CourtPlotMixin:
         return ax.text(plot_x, plot_y, text, fontsize=fontsize, color=color,
                        ha=ha, va=va, bbox=bbox, **kwargs)
 
-    def arrows(self, ax, x_start, y_start, x_end, y_end, 
+    def arrows(self, ax, x_start, y_start=None, x_end=None, y_end=None, 
                color='black', linewidth=2, linestyle='solid', 
-               arrow_style='fancy', alpha=1.0, **kwargs):
+               arrow_style='fancy', alpha=1.0, method='patch',
+               values=None, cmap='viridis', norm=None, head_length=None, head_width=None,
+               **kwargs):
         """
         Draw arrows for shot trajectories.
         
@@ -283,7 +638,8 @@ class CourtPlotMixin:
         ax : matplotlib.axes.Axes
             The axes to draw on.
         x_start, y_start : array-like
-            Starting coordinates.
+            Starting coordinates. A ShotTable with end coordinates may be
+            passed as ``x_start`` instead of all four arrays.
         x_end, y_end : array-like
             Ending coordinates.
         color : str, default 'black'
@@ -296,15 +652,38 @@ class CourtPlotMixin:
             Arrow head style: 'fancy', 'simple', 'wedge', 'curve'.
         alpha : float, default 1.0
             Transparency (0-1).
+        method : str, default 'patch'
+            'patch': one FancyArrowPatch per arrow.
+            'collection': all shafts in one LineCollection and all heads in
+            one PolyCollection (filled heads; ``arrow_style`` is ignored).
+            Handles 100k+ arrows and keeps vector output small.
+        values : array-like, optional
+            Collection mode: per-arrow numbers mapped to colors with ``cmap``
+            and ``norm`` (overrides ``color``).
+        cmap : str or Colormap, default 'viridis'
+            Colormap for ``values``.
+        norm : matplotlib.colors.Normalize, optional
+            Normalization for ``values``.
+        head_length, head_width : float or array-like, optional
+            Collection mode: head size in court units (meters). Defaults to
+            5% of the singles court width (about 0.41 m, independent of
+            ``linewidth``) and ``0.6 * head_length``.
+        
+        In collection mode ``color`` may also be a sequence of colors and
+        ``linewidth`` an array, one entry per arrow.
+        
+        Returns
+        -------
+        list of FancyArrowPatch, or (LineCollection, PolyCollection)
         """
         from matplotlib.patches import FancyArrowPatch
         
-        if self.orientation == 'horizontal':
-            sx, sy = np.array(y_start), np.array(x_start)
-            ex, ey = np.array(y_end), np.array(x_end)
+        if isinstance(x_start, ShotTable):
+            sx, sy = x_start.plot_xy(self.orientation)
+            ex, ey = x_start.plot_end_xy(self.orientation)
         else:
-            sx, sy = np.array(x_start), np.array(y_start)
-            ex, ey = np.array(x_end), np.array(y_end)
+            sx, sy = as_plot_xy(x_start, y_start, self.orientation)
+            ex, ey = as_plot_xy(x_end, y_end, self.orientation)
         
         # Arrow style mapping
         arrow_styles = {
@@ -324,7 +703,12 @@ class CourtPlotMixin:
         }
         ls = ls_map.get(linestyle, linestyle)
         
+        if method == 'collection':
+            return self._arrow_collection(ax, sx, sy, ex, ey, color, linewidth, ls, alpha,
+                                          values, cmap, norm, head_length, head_width, **kwargs)
+        
         # Draw each arrow
+        patches = []
         for i in range(len(sx)):
             arrow = FancyArrowPatch(
                 posA=(sx[i], sy[i]),
@@ -340,8 +724,97 @@ class CourtPlotMixin:
                 **kwargs
             )
             ax.add_patch(arrow)
+            patches.append(arrow)
+        return patches
+
+    def _arrow_collection(self, ax, sx, sy, ex, ey, color, linewidth, linestyle, alpha,
+                          values, cmap, norm, head_length, head_width, **kwargs):
+        """Vectorized arrows: one LineCollection (shafts) + one PolyCollection (heads)."""
+        from matplotlib.collections import PolyCollection
+        
+        sx, sy, ex, ey = (np.asarray(a, dtype=float) for a in (sx, sy, ex, ey))
+        n = len(sx)
+        lw = np.broadcast_to(np.asarray(linewidth, dtype=float), (n,))
+        if head_length is None:
+            head_length = _ARROW_HEAD_FRACTION * WIDTH_SINGLES  # A data-space size, like the arrows
+        hl = np.broadcast_to(np.asarray(head_length, dtype=float), (n,))
+        hw = 0.6 * hl if head_width is None else np.broadcast_to(np.asarray(head_width, dtype=float), (n,))
+        
+        if values is not None:
+            from matplotlib import colormaps
+            from matplotlib.colors import Normalize
+            values = np.asarray(values, dtype=float)
+            norm = norm or Normalize(np.nanmin(values), np.nanmax(values))
+            colors = colormaps[cmap](norm(values)) if isinstance(cmap, str) else cmap(norm(values))
+        else:
+            colors = to_rgba_array(color)
+        
+        # Unit direction of each arrow (zero-length arrows get no head)
+        dx, dy = ex - sx, ey - sy
+        length = np.hypot(dx, dy)
+        safe = np.where(length > 0, length, 1)
+        ux, uy = dx / safe, dy / safe
+        
+        # Shaft stops at the base of the head so it does not poke through the tip
+        shaft = np.minimum(hl, length)
+        bx, by = ex - ux * shaft, ey - uy * shaft
+        segments = np.stack([np.column_stack([sx, sy]), np.column_stack([bx, by])], axis=1)
+        
+        # Triangle heads: tip, and the two base corners either side of the shaft
+        px, py = -uy * hw / 2, ux * hw / 2
+        heads = np.stack([np.column_stack([ex, ey]),
+                          np.column_stack([bx + px, by + py]),
+                          np.column_stack([bx - px, by - py])], axis=1)
+        
+        zorder = kwargs.pop('zorder', 2)
+        shafts = LineCollection(segments, colors=colors, linewidths=lw, linestyles=linestyle,
+                                alpha=alpha, zorder=zorder, capstyle='butt', **kwargs)
+        tips = PolyCollection(heads[length > 0], facecolors=colors if len(colors) == 1 else colors[length > 0],
+                              edgecolors='none', alpha=alpha, zorder=zorder)
+        ax.add_collection(shafts)
+        ax.add_collection(tips)
+        return shafts, tips
 
-    def kdeplot(self, ax, x, y, cmap='bsu_green', levels=100, clip=None, **kwargs):
+    def kdeplot(self, ax, x, y=None, cmap='bsu_green', levels=100, clip=None,
+                method='exact', bw_method=None, weights=None, render='contourf',
+                rasterized=None, **kwargs):
+        """
+        Kernel density plot of shot locations.
+        
+        Parameters
+        ----------
+        ax : matplotlib.axes.Axes
+            The axes to draw on.
+        x, y : array-like or ShotTable
+            Coordinates (in standard vertical court coords), or a ShotTable.
+        cmap : str or Colormap, default 'bsu_green'
+            Colormap ('bsu_green', 'bsu_red', 'bsu_blue' or any matplotlib cmap).
+        levels : int, default 100
+            Number of contour levels.
+        clip : tuple, optional
+            ``((xmin, xmax), (ymin, ymax))`` in plot coords; density outside is zeroed.
+        method : str, default 'exact'
+            'exact' (gaussian_kde on every grid node) or 'binned' (FFT
+            convolution, scales to millions of points; see ``BsuTennis.kde``).
+        bw_method : str, scalar or callable, optional
+            Bandwidth rule, as for ``scipy.stats.gaussian_kde``.
+        weights : array-like, optional
+            Per-point weights.
+        render : str, default 'contourf'
+            'contourf': filled contours (``levels`` polygons per level).
+            'image': a single ``imshow`` raster of the density grid.
+            'mesh': ``pcolormesh`` with Gouraud shading.
+            The image modes ignore ``levels`` and keep SVG/PDF size and save
+            time constant.
+        rasterized : bool, optional
+            Rasterize the density layer inside vector outputs (SVG/PDF).
+            Defaults to True for 'mesh' (tens of thousands of quads) and
+            False otherwise.
+        
+        Returns
+        -------
+        QuadContourSet, AxesImage or QuadMesh
+        """
         # Custom cmaps
         cmaps = {
             'bsu_green': LinearSegmentedColormap.from_list("bsu_green", ['#ffffff', '#92e3da'], N=100),
@@ -350,35 +823,42 @@ class CourtPlotMixin:
         }
         if cmap in cmaps: cmap = cmaps[cmap]
         
-        x = np.array(x); y = np.array(y)
-        
         # Grid bounds
         # BaseCourt extent is useful here
         # But we need grid in PLOT coordinates
-        if self.orientation == 'horizontal':
-             px, py = y, x
-             xmin, xmax = self.extent[0], self.extent[1]
-             ymin, ymax = self.extent[2], self.extent[3]
-        else:
-             px, py = x, y
-             xmin, xmax = self.extent[0], self.extent[1]
-             ymin, ymax = self.extent[2], self.extent[3]
+        px, py = as_plot_xy(x, y, self.orientation)
+        xmin, xmax = self.extent[0], self.extent[1]
+        ymin, ymax = self.extent[2], self.extent[3]
              
         buff = 1
-        xx, yy = np.mgrid[xmin-buff:xmax+buff:200j, ymin-buff:ymax+buff:200j]
-        positions = np.vstack([xx.ravel(), yy.ravel()])
-        values = np.vstack([px, py])
-        
-        kernel = gaussian_kde(values)
-        f = np.reshape(kernel(positions).T, xx.shape)
+        xgrid = np.linspace(xmin - buff, xmax + buff, 200)
+        ygrid = np.linspace(ymin - buff, ymax + buff, 200)
+        xx, yy = np.meshgrid(xgrid, ygrid, indexing='ij')
+        f = density_2d(px, py, xgrid, ygrid, method=method, bw_method=bw_method, weights=weights)
         
         if clip:
              # Assume clip is in plot coords for now
              cx, cy = clip
              mask = (xx < cx[0]) | (xx > cx[1]) | (yy < cy[0]) | (yy > cy[1])
              f[mask] = 0
-             
-        return ax.contourf(xx, yy, f, levels=levels, cmap=cmap, **kwargs)
+        
+        if render == 'image':
+            dx = xgrid[1] - xgrid[0]
+            dy = ygrid[1] - ygrid[0]
+            kwargs.setdefault('interpolation', 'bilinear')
+            return ax.imshow(f.T, origin='lower', cmap=cmap, aspect=ax.get_aspect(),
+                             extent=(xgrid[0] - dx / 2, xgrid[-1] + dx / 2,
+                                     ygrid[0] - dy / 2, ygrid[-1] + dy / 2),
+                             rasterized=bool(rasterized), **kwargs)
+        if render == 'mesh':
+            if rasterized is None:
+                rasterized = True
+            return ax.pcolormesh(xgrid, ygrid, f.T, cmap=cmap, shading='gouraud',
+                                 rasterized=rasterized, **kwargs)
+        if render != 'contourf':
+            raise ValueError(f"render must be 'contourf', 'image' or 'mesh', got {render!r}")
+        
+        return ax.contourf(xx, yy, f, levels=levels, cmap=cmap, rasterized=bool(rasterized), **kwargs)
 
     def _get_extent(self, half):
         # Determine effective half flag
@@ -397,28 +877,96 @@ class CourtPlotMixin:
             else:
                 return [self.x_min, self.x_max, self.y_min, self.y_max]
 
-    def heatmap(self, ax, x, y, bins=10, statistic='count', cmap='coolwarm', annot=False, fmt='.0f', half=None, gridsize=None, **kwargs):
-        x = np.array(x); y = np.array(y)
+    def heatmap(self, ax, x, y=None, bins=10, statistic='count', cmap='coolwarm', annot=False, fmt='.0f', half=None, gridsize=None,
+                values=None, annot_kws=None, **kwargs):
+        """
+        Binned 2-D heatmap of shot locations or of a per-shot value.
         
+        Parameters
+        ----------
+        ax : matplotlib.axes.Axes
+            The axes to draw on.
+        x, y : array-like or ShotTable
+            Coordinates (in standard vertical court coords), or a ShotTable
+            passed as ``x`` (``y`` omitted).
+        bins : int or [int, int], default 10
+            Number of cells (along plot x and y).
+        statistic : str, default 'count'
+            'count' or 'frequency' (% of all shots), or, with ``values``,
+            'sum', 'mean', 'median', 'std', 'min' or 'max' of the values in
+            each cell, computed in one pass with
+            ``scipy.stats.binned_statistic_2d``.
+        cmap : str or Colormap, default 'coolwarm'
+            Colormap.
+        annot : bool, default False
+            Write each non-empty cell's value at its center. All labels are
+            drawn by a single artist.
+        fmt : str, default '.0f'
+            Format spec for the annotations.
+        half : bool, optional
+            Restrict the grid to one half of the court.
+        gridsize : int, optional
+            Alias for ``bins`` (consistency with hexbin).
+        values : array-like or str, optional
+            Per-shot value to aggregate (e.g. ball speed, or 1/0 for point
+            won, where 'mean' gives the win rate). With a ShotTable, a column
+            name. Shots with NaN values are ignored.
+        annot_kws : dict, optional
+            Label properties: ``fontsize`` (default 8), ``color``,
+            ``fontweight``, ``fontfamily`` and ``fontstyle``. Other Text
+            properties (rotation, bbox, alignment, ...) are not supported,
+            since the labels are not individual Text artists.
+        **kwargs : dict
+            Additional arguments passed to ax.pcolormesh().
+        """
         # Gridsize alias for bins (consistency with hexbin)
         if gridsize is not None:
             bins = gridsize
 
-        if self.orientation == 'horizontal':
-            px, py = y, x
-        else:
-            px, py = x, y
+        px, py = as_plot_xy(x, y, self.orientation)
             
         extent = self._get_extent(half)
         # histogram2d expects range=[[xmin, xmax], [ymin, ymax]]
         bounds = [[extent[0], extent[1]], [extent[2], extent[3]]]
 
-        H, xedges, yedges = np.histogram2d(px, py, bins=bins, range=bounds)
-        H = H.T
-        
-        if statistic == 'frequency':
-             H = H / np.sum(H) * 100
-             if fmt=='.0f': fmt='.1f'
+        if statistic in ('count', 'frequency'):
+            H, xedges, yedges = np.histogram2d(px, py, bins=bins, range=bounds)
+            H = H.T
+            
+            if statistic == 'frequency':
+                 H = H / np.sum(H) * 100
+                 if fmt=='.0f': fmt='.1f'
+            filled = H > 0
+        elif statistic in HEATMAP_STATISTICS:
+            if values is None:
+                raise ValueError(f"statistic={statistic!r} needs values")
+            from scipy.stats import binned_statistic_2d
+            
+            if isinstance(values, str) and isinstance(x, ShotTable):
+                values = x[values]
+            values = np.asarray(values, dtype=float)
+            if values.shape != px.shape:
+                raise ValueError(f"values has shape {values.shape}, expected {px.shape}")
+            known = ~np.isnan(values)
+            if not known.all():
+                px, py, values = px[known], py[known], values[known]
+            
+            H, xedges, yedges, binnumber = binned_statistic_2d(px, py, values, statistic=statistic,
+                                                               bins=bins, range=bounds)
+            # Shots per cell from the same binning (bin numbers index the
+            # grid padded by one outlier cell on each side)
+            shape = (len(xedges) + 1, len(yedges) + 1)
+            occupancy = np.bincount(binnumber, minlength=shape[0] * shape[1])
+            occupancy = occupancy.reshape(shape)[1:-1, 1:-1].T
+            H = H.T
+            # Leave empty cells uncolored ('sum' gives 0 there, which is
+            # also a real total, so go by the shot count)
+            filled = occupancy > 0
+            H = np.ma.masked_array(H, mask=~filled)
+            if fmt=='.0f': fmt='.1f'
+        else:
+            raise ValueError(f"statistic must be 'count', 'frequency' or one of "
+                             f"{HEATMAP_STATISTICS}, got {statistic!r}")
              
         if 'edgecolor' not in kwargs: kwargs['edgecolor'] = 'white'
         if 'linewidth' not in kwargs: kwargs['linewidth'] = 0.5
@@ -428,13 +976,36 @@ class CourtPlotMixin:
         if annot:
             xc = (xedges[:-1] + xedges[1:])/2
             yc = (yedges[:-1] + yedges[1:])/2
-            for i in range(len(xc)):
-                for j in range(len(yc)):
-                     if H[j, i] > 0:
-                         ax.text(xc[i], yc[j], format(H[j,i], fmt), ha='center', va='center', fontsize=8)
+            rows, cols = np.nonzero(filled)
+            labels = [format(v, fmt) for v in np.asarray(H)[rows, cols]]
+            ax.add_artist(_CellLabels(xc[cols], yc[rows], labels, **(annot_kws or {})))
         return mesh
 
-    def hexbin(self, ax, x, y, gridsize=20, cmap='Blues', edgecolors='white', mincnt=1, half=None, **kwargs):
+    def hexbin(self, ax, x, y=None, gridsize=20, cmap='Blues', edgecolors='white', mincnt=1, half=None, **kwargs):
+        """
+        Hexagonal binning of shot locations.
+        
+        Parameters
+        ----------
+        ax : matplotlib.axes.Axes
+            The axes to draw on.
+        x, y : array-like, ShotTable or HexAggregate
+            Coordinates (in standard vertical court coords), a ShotTable, or
+            a precomputed ``HexAggregate`` (drawn without re-binning;
+            ``gridsize`` and ``half`` are then taken from the aggregate).
+        gridsize : int, default 20
+            Number of hexagons along the plot x-axis.
+        cmap : str or Colormap, default 'Blues'
+            Colormap ('bsu_green', 'bsu_red', 'bsu_blue' or any matplotlib cmap).
+        edgecolors : color, default 'white'
+            Hexagon edge color.
+        mincnt : int, default 1
+            Minimum count for a cell to be drawn.
+        half : bool, optional
+            Restrict the grid to one half of the court.
+        **kwargs : dict
+            Additional arguments passed to ax.hexbin() (or HexAggregate.plot()).
+        """
         # Resolve bsu cmaps if needed
         cmaps = {
             'bsu_green': LinearSegmentedColormap.from_list("bsu_green", ['#ffffff', '#92e3da'], N=100),
@@ -443,13 +1014,43 @@ class CourtPlotMixin:
         }
         if cmap in cmaps: cmap = cmaps[cmap]
         
-        x = np.array(x); y = np.array(y)
-        if self.orientation == 'horizontal':
-             px, py = y, x
-        else:
-             px, py = x, y
+        if isinstance(x, HexAggregate):
+            return x.plot(ax, cmap=cmap, edgecolors=edgecolors, mincnt=mincnt, **kwargs)
+        
+        px, py = as_plot_xy(x, y, self.orientation)
         
         # Extent order: xmin, xmax, ymin, ymax
         extent = self._get_extent(half)
         
         return ax.hexbin(px, py, gridsize=gridsize, cmap=cmap, edgecolors=edgecolors, mincnt=mincnt, extent=extent, **kwargs)
+
+    def hex_aggregate(self, x, y=None, gridsize=20, half=None, weights=None):
+        """
+        Bin shots onto this court's hexbin grid once, for reuse.
+        
+        The result can be drawn repeatedly with ``hexbin`` (any colormap),
+        subset with a boolean mask, summed across matches and differenced
+        between players, all without re-binning the raw points.
+        
+        Parameters
+        ----------
+        x, y : array-like or ShotTable
+            Coordinates (in standard vertical court coords), or a ShotTable
+            passed as ``x`` (``y`` omitted).
+        gridsize : int, default 20
+            Number of hexagons along the plot x-axis.
+        half : bool, optional
+            Use the half-court extent.
+        weights : array-like or str, optional
+            Per-shot weights (or a ShotTable column name); cells then hold
+            summed weights instead of counts.
+        
+        Returns
+        -------
+        HexAggregate
+        """
+        if isinstance(weights, str) and isinstance(x, ShotTable):
+            weights = x[weights]
+        px, py = as_plot_xy(x, y, self.orientation)
+        return HexAggregate.from_points(px, py, gridsize=gridsize, extent=self._get_extent(half),
+                                        weights=weights)
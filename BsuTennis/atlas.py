@@ -0,0 +1,347 @@
+"""
+Small-Multiples Atlas
+
+``CourtAtlas`` draws one small court per group (player, match, set, ...)
+for a whole roster. Shots are grouped and binned for every group in one
+vectorized pass, the colour scale is shared across all cells, and the
+cells are laid out on pages of ``nrows`` x ``ncols`` figures.
+
+Each cell reuses the same court geometry: the court itself is the cached
+``draw_background`` raster (rendered once per cell size), and axes are
+placed directly instead of through a GridSpec, so a page costs the same
+whether it is the first or the tenth.
+"""
+
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import LinearSegmentedColormap, Normalize
+
+from .pitch import TennisCourt
+from .shots import ShotTable, as_plot_xy
+from .kde import KDE_METHODS, density_2d
+from .hexagg import HexAggregate
+
+ATLAS_KINDS = ('scatter', 'heatmap', 'hexbin', 'kde')
+
+# Default colormap and grid resolution per kind
+_DEFAULT_CMAPS = {'heatmap': 'Reds', 'hexbin': 'Blues', 'kde': 'bsu_green'}
+_DEFAULT_GRIDSIZE = {'heatmap': 10, 'hexbin': 20, 'kde': 100}
+
+# Figure layout, in inches
+_TITLE_HEIGHT = 0.25
+_COLORBAR_WIDTH = 0.8
+
+
+class CourtAtlas:
+    """
+    Paginated small multiples of one court plot per group.
+
+    Parameters
+    ----------
+    data : DataFrame, DataFrameGroupBy or ShotTable
+        Shots. A DataFrame or ShotTable is grouped by ``by``; an existing
+        ``df.groupby(...)`` is used as is.
+    by : str, list of str or array-like, optional
+        Grouping column(s) (DataFrame), column name or per-shot labels
+        (ShotTable). Not needed for a DataFrameGroupBy.
+    kind : str, default 'heatmap'
+        'scatter', 'heatmap', 'hexbin' or 'kde'.
+    x, y : str, default 'x', 'y'
+        Coordinate columns of a DataFrame (standard vertical court coords).
+    court : TennisCourt, optional
+        Court drawn in every cell. Defaults to a vertical half court.
+    nrows, ncols : int, default 5, 6
+        Cells per page.
+    cell_size : (float, float), optional
+        Width and height of one cell in inches (title excluded). Defaults
+        to 2 inches wide with the height of the drawn court.
+    statistic : str, default 'count'
+        'count' or 'frequency' (% of the group's shots) for heatmap/hexbin.
+    gridsize : int or (int, int), optional
+        Heatmap cells (default 10), hexagons along x (default 20) or KDE grid
+        nodes (default 100).
+    method : str, default 'binned'
+        KDE backend ('binned' or 'exact', see ``BsuTennis.kde``).
+    cmap : str or Colormap, optional
+        Colormap ('bsu_green', 'bsu_red', 'bsu_blue' or any matplotlib cmap).
+    share_norm : bool, default True
+        One colour scale for the whole atlas (shown as a colorbar on each
+        page); otherwise each cell is scaled on its own.
+    order : list, optional
+        Group labels to draw, in order (default: all groups, sorted).
+    title : str, default '{label} ({n})'
+        Cell title format (``label`` and ``n`` = shots); None for no titles.
+    **kwargs : dict
+        Passed to the cell artists (``ax.scatter``, ``ax.pcolormesh``,
+        ``HexAggregate.plot`` or ``ax.imshow``).
+
+    Examples
+    --------
+    >>> atlas = CourtAtlas(df, by='player', kind='hexbin', statistic='frequency')
+    >>> len(atlas)                       # pages
+    10
+    >>> fig = atlas.page(0)
+    >>> atlas.save('roster_{page:02d}.png', dpi=150)
+    """
+
+    def __init__(self, data, by=None, kind='heatmap', x='x', y='y', court=None,
+                 nrows=5, ncols=6, cell_size=None, statistic='count', gridsize=None,
+                 method='binned', cmap=None, share_norm=True, order=None,
+                 title='{label} ({n})', **kwargs):
+        if kind not in ATLAS_KINDS:
+            raise ValueError(f"kind must be one of {ATLAS_KINDS}, got {kind!r}")
+        if statistic not in ('count', 'frequency'):
+            raise ValueError(f"statistic must be 'count' or 'frequency', got {statistic!r}")
+        if method not in KDE_METHODS:
+            raise ValueError(f"method must be one of {KDE_METHODS}, got {method!r}")
+
+        self.court = court if court is not None else TennisCourt(half=True)
+        self.kind = kind
+        self.nrows = nrows
+        self.ncols = ncols
+        if cell_size is None:
+            # draw_background pads the court by 2 m on every side
+            xmin, xmax, ymin, ymax = self.court.extent
+            cell_size = (2.0, 2.0 * (ymax - ymin + 4) / (xmax - xmin + 4))
+        self.cell_size = cell_size
+        self.statistic = statistic
+        self.gridsize = gridsize if gridsize is not None else _DEFAULT_GRIDSIZE.get(kind)
+        self.method = method
+        self.cmap = _resolve_cmap(cmap if cmap is not None else _DEFAULT_CMAPS.get(kind))
+        self.title = title
+        self.kwargs = kwargs
+
+        px, py, indices = _group_points(data, by, x, y, self.court.orientation)
+        if order is not None:
+            missing = [label for label in order if label not in indices]
+            if missing:
+                raise ValueError(f"Unknown groups in order: {missing[:5]}")
+            indices = {label: indices[label] for label in order}
+        self.groups = list(indices)
+        self.counts = np.array([len(idx) for idx in indices.values()])
+        self._px, self._py = px, py
+        self._indices = list(indices.values())
+
+        self._values = self._aggregate()
+        self.norm = None
+        if share_norm and self._values is not None:
+            vmax = max((np.nanmax(v) for v in self._values if v is not None and v.size), default=1)
+            self.norm = Normalize(0, vmax if vmax > 0 else 1)
+
+    def __len__(self):
+        per_page = self.nrows * self.ncols
+        return -(-len(self.groups) // per_page)
+
+    def __repr__(self):
+        return (f"CourtAtlas(kind={self.kind!r}, groups={len(self.groups)}, "
+                f"pages={len(self)}, layout={self.nrows}x{self.ncols})")
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.page(i)
+
+    # -------------------------------------------------------------------------
+    # Aggregation (all groups at once)
+    # -------------------------------------------------------------------------
+    def _group_codes(self):
+        codes = np.full(len(self._px), -1, dtype=np.int64)
+        for k, idx in enumerate(self._indices):
+            codes[idx] = k
+        return codes
+
+    def _aggregate(self):
+        """Per-group cell values for the gridded kinds (None for scatter)."""
+        n_groups = len(self.groups)
+        xmin, xmax, ymin, ymax = self.court._get_extent(None)
+
+        if self.kind == 'heatmap':
+            nx, ny = self.gridsize if np.iterable(self.gridsize) else (self.gridsize,) * 2
+            self._edges = (np.linspace(xmin, xmax, nx + 1), np.linspace(ymin, ymax, ny + 1))
+            ix = np.floor((self._px - xmin) / (xmax - xmin) * nx)
+            iy = np.floor((self._py - ymin) / (ymax - ymin) * ny)
+            # Points on the far edges belong to the last cell (as histogram2d)
+            ix[self._px == xmax] = nx - 1
+            iy[self._py == ymax] = ny - 1
+            valid = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+            cells = (iy * nx + ix)[valid].astype(np.int64)
+            codes = self._group_codes()[valid]
+            keep = codes >= 0
+            values = np.bincount(codes[keep] * (nx * ny) + cells[keep],
+                                 minlength=n_groups * nx * ny).reshape(n_groups, ny, nx)
+            values = values.astype(float)
+        elif self.kind == 'hexbin':
+            self._template = HexAggregate.from_points([], [], gridsize=self.gridsize,
+                                                      extent=(xmin, xmax, ymin, ymax))
+            n_cells = len(self._template)
+            cells = self._template._assign(self._px, self._py).astype(np.int64)
+            codes = self._group_codes()
+            keep = (cells >= 0) & (codes >= 0)
+            values = np.bincount(codes[keep] * n_cells + cells[keep],
+                                 minlength=n_groups * n_cells).reshape(n_groups, n_cells)
+            values = values.astype(float)
+        elif self.kind == 'kde':
+            self._grid = (np.linspace(xmin, xmax, self.gridsize), np.linspace(ymin, ymax, self.gridsize))
+            return [self._density(idx) for idx in self._indices]
+        else:
+            return None
+
+        if self.statistic == 'frequency':
+            totals = values.reshape(n_groups, -1).sum(axis=1)
+            shape = (n_groups,) + (1,) * (values.ndim - 1)
+            values = values / np.where(totals > 0, totals, 1).reshape(shape) * 100
+        return list(values)
+
+    def _density(self, idx):
+        # Fewer than 3 shots, or all on one line, have no 2-D bandwidth
+        if len(idx) < 3:
+            return None
+        try:
+            return density_2d(self._px[idx], self._py[idx], *self._grid, method=self.method)
+        except np.linalg.LinAlgError:
+            return None
+
+    # -------------------------------------------------------------------------
+    # Rendering
+    # -------------------------------------------------------------------------
+    def page(self, i):
+        """
+        Render page ``i`` as a new figure.
+
+        Returns
+        -------
+        matplotlib.figure.Figure
+        """
+        if not 0 <= i < len(self):
+            raise IndexError(f"page {i} out of range for {len(self)} pages")
+        per_page = self.nrows * self.ncols
+        members = range(i * per_page, min((i + 1) * per_page, len(self.groups)))
+        rows = -(-len(members) // self.ncols)
+
+        cell_w, cell_h = self.cell_size
+        title_h = _TITLE_HEIGHT if self.title else 0
+        bar_w = _COLORBAR_WIDTH if self.norm is not None else 0
+        fig_w = self.ncols * cell_w + bar_w
+        fig_h = rows * (cell_h + title_h)
+        fig = plt.figure(figsize=(fig_w, fig_h))
+
+        for slot, k in enumerate(members):
+            r, c = divmod(slot, self.ncols)
+            bottom = fig_h - (r + 1) * (cell_h + title_h)
+            ax = fig.add_axes([c * cell_w / fig_w, bottom / fig_h, cell_w / fig_w, cell_h / fig_h])
+            self.court.draw_background(ax)
+            self._draw_cell(ax, k)
+            if self.title:
+                # Figure text, not ax.set_title: titles would lay out every
+                # cell's (hidden) tick labels on each draw
+                fig.text((c + 0.5) * cell_w / fig_w, (bottom + cell_h + 0.05) / fig_h,
+                         self.title.format(label=_label(self.groups[k]), n=self.counts[k]),
+                         ha='center', va='bottom', fontsize=8)
+
+        if self.norm is not None:
+            cax = fig.add_axes([(fig_w - bar_w + 0.15) / fig_w, 0.1, 0.12 / fig_w, 0.8])
+            colorbar = fig.colorbar(ScalarMappable(norm=self.norm, cmap=self.cmap), cax=cax)
+            colorbar.ax.tick_params(labelsize=7)
+        return fig
+
+    def _draw_cell(self, ax, k):
+        kwargs = dict(self.kwargs)
+        idx = self._indices[k]
+        if self.kind == 'scatter':
+            kwargs.setdefault('s', 6)
+            kwargs.setdefault('c', '#3a86ff')
+            kwargs.setdefault('alpha', 0.6)
+            kwargs.setdefault('edgecolors', 'none')
+            return ax.scatter(self._px[idx], self._py[idx], zorder=3, **kwargs)
+
+        values = self._values[k]
+        if values is None:
+            return None
+        if self.kind == 'heatmap':
+            kwargs.setdefault('edgecolor', 'white')
+            kwargs.setdefault('linewidth', 0.5)
+            return ax.pcolormesh(*self._edges, np.ma.masked_equal(values, 0), cmap=self.cmap,
+                                 norm=self.norm, **kwargs)
+        if self.kind == 'hexbin':
+            agg = HexAggregate(values, self.gridsize, self._template.extent)
+            # Any non-empty cell is drawn (frequencies can be below 1)
+            kwargs.setdefault('mincnt', 1e-12)
+            return agg.plot(ax, cmap=self.cmap, norm=self.norm, **kwargs)
+
+        xgrid, ygrid = self._grid
+        dx, dy = xgrid[1] - xgrid[0], ygrid[1] - ygrid[0]
+        kwargs.setdefault('interpolation', 'bilinear')
+        kwargs.setdefault('alpha', 0.8)
+        return ax.imshow(values.T, origin='lower', cmap=self.cmap, norm=self.norm,
+                         aspect=ax.get_aspect(),
+                         extent=(xgrid[0] - dx / 2, xgrid[-1] + dx / 2,
+                                 ygrid[0] - dy / 2, ygrid[-1] + dy / 2), **kwargs)
+
+    def save(self, path, close=True, **savefig_kws):
+        """
+        Render and save every page.
+
+        Parameters
+        ----------
+        path : str
+            File name pattern with a ``{page}`` field, e.g. 'atlas_{page:02d}.png'.
+        close : bool, default True
+            Close each figure after saving, so memory stays flat however
+            many pages there are.
+        **savefig_kws : dict
+            Passed to ``Figure.savefig``.
+
+        Returns
+        -------
+        list of str
+            Written file names.
+        """
+        if '{page' not in path:
+            raise ValueError("path must contain a '{page}' field, e.g. 'atlas_{page:02d}.png'")
+        written = []
+        for i in range(len(self)):
+            fig = self.page(i)
+            name = path.format(page=i + 1)
+            fig.savefig(name, **savefig_kws)
+            if close:
+                plt.close(fig)
+            written.append(name)
+        return written
+
+
+def _group_points(data, by, x, y, orientation):
+    """Plot coordinates of all shots and positional indices per group."""
+    if hasattr(data, 'indices') and hasattr(data, 'obj'):
+        # Already grouped: df.groupby(...)
+        df, indices = data.obj, data.indices
+        px, py = as_plot_xy(df[x].to_numpy(float), df[y].to_numpy(float), orientation)
+    elif isinstance(data, ShotTable):
+        if by is None:
+            raise ValueError("by is required to group a ShotTable")
+        keys = data[by] if isinstance(by, str) else by
+        keys = pd.Series(keys, name='group')
+        if len(keys) != len(data):
+            raise ValueError(f"by has length {len(keys)}, expected {len(data)}")
+        indices = keys.to_frame().groupby('group', observed=True).indices
+        px, py = as_plot_xy(data, None, orientation)
+    elif isinstance(data, pd.DataFrame):
+        if by is None:
+            raise ValueError("by is required to group a DataFrame")
+        indices = data.groupby(by, observed=True).indices
+        px, py = as_plot_xy(data[x].to_numpy(float), data[y].to_numpy(float), orientation)
+    else:
+        raise ValueError(f"data must be a DataFrame, DataFrameGroupBy or ShotTable, "
+                         f"got {type(data).__name__}")
+    return np.asarray(px, dtype=float), np.asarray(py, dtype=float), indices
+
+
+def _label(key):
+    return ' / '.join(map(str, key)) if isinstance(key, tuple) else str(key)
+
+
+def _resolve_cmap(cmap):
+    bsu = {'bsu_green': '#92e3da', 'bsu_red': '#ff3b3b', 'bsu_blue': '#2437ff'}
+    if isinstance(cmap, str) and cmap in bsu:
+        return LinearSegmentedColormap.from_list(cmap, ['#ffffff', bsu[cmap]], N=100)
+    return plt.get_cmap(cmap)
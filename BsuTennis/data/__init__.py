@@ -0,0 +1,32 @@
+"""
+BsuTennis.data
+~~~~~~~~~~~~~~
+Loaders for tennis match, point-by-point and tracking data.
+"""
+
+from .atp import load_atp, read_atp_csv, ATP_DTYPES
+from .ao import iter_ao_points, iter_ao_matches, load_ao_matches, AO_POINT_DTYPES
+from .rg import (load_rg_tracking, open_rg_tracking, iter_rg_frames,
+                 tracking_dtype, RG_TRACKING_FIELDS)
+from .bulk import load_many, load_tracking_many
+from .cache import DatasetCache, default_cache_dir, file_hash
+
+__all__ = [
+    'load_atp',
+    'read_atp_csv',
+    'ATP_DTYPES',
+    'iter_ao_points',
+    'iter_ao_matches',
+    'load_ao_matches',
+    'AO_POINT_DTYPES',
+    'load_rg_tracking',
+    'open_rg_tracking',
+    'iter_rg_frames',
+    'tracking_dtype',
+    'RG_TRACKING_FIELDS',
+    'load_many',
+    'load_tracking_many',
+    'DatasetCache',
+    'default_cache_dir',
+    'file_hash',
+]
@@ -0,0 +1,246 @@
+"""
+Australian Open Point-by-Point Loader
+
+Streams Grand Slam point-by-point CSVs (``YYYY-ausopen-points.csv`` with a
+companion ``YYYY-ausopen-matches.csv``) in fixed-size chunks with typed
+columns, so aggregations can run over a full event without materializing
+millions of rows at once.
+"""
+
+import os
+
+import pandas as pd
+
+from .cache import file_hash
+
+# Compact dtypes for the point-by-point schema. Nullable integers tolerate
+# the blank cells that appear in older events.
+_FLAG_COLUMNS = ['Ace', 'Winner', 'DoubleFault', 'UnfErr', 'NetPoint', 'NetPointWon',
+                 'BreakPoint', 'BreakPointWon', 'BreakPointMissed', 'FirstSrvIn',
+                 'FirstSrvWon', 'SecondSrvIn', 'SecondSrvWon', 'ForcedError']
+
+AO_POINT_DTYPES = {
+    'match_id': 'string',
+    'ElapsedTime': 'string',
+    'SetNo': 'Int8',
+    'P1GamesWon': 'Int8',
+    'P2GamesWon': 'Int8',
+    'SetWinner': 'Int8',
+    'GameNo': 'Int8',
+    'GameWinner': 'Int8',
+    'PointNumber': 'string',  # Tiebreak markers such as '0X' appear in some events
+    'PointWinner': 'Int8',
+    'PointServer': 'Int8',
+    'Speed_KMH': 'Int16',
+    'Rally': 'Int16',
+    'P1Score': 'string',
+    'P2Score': 'string',
+    'P1PointsWon': 'Int16',
+    'P2PointsWon': 'Int16',
+    'P1Momentum': 'Int8',
+    'P2Momentum': 'Int8',
+    'ServeIndicator': 'Int8',
+    'ServeNumber': 'Int8',
+    'P1DistanceRun': 'float32',
+    'P2DistanceRun': 'float32',
+    'RallyCount': 'Int16',
+    'ServeWidth': pd.CategoricalDtype(['B', 'BC', 'BW', 'C', 'W']),
+    'ServeDepth': pd.CategoricalDtype(['CTL', 'NCTL']),
+    'ReturnDepth': pd.CategoricalDtype(['D', 'ND']),
+    'WinnerType': pd.CategoricalDtype(['0', 'A', 'B', 'C', 'D', 'E']),
+    'WinnerShotType': pd.CategoricalDtype(['0', 'B', 'F']),
+}
+for _player in ('P1', 'P2'):
+    AO_POINT_DTYPES.update({f'{_player}{flag}': 'Int8' for flag in _FLAG_COLUMNS})
+
+
+def load_ao_matches(matches_path, cache=None):
+    """
+    Load the (small) match table of an Australian Open event.
+
+    Parameters
+    ----------
+    matches_path : str
+        Path to ``YYYY-ausopen-matches.csv``.
+    cache : DatasetCache, optional
+        Reuse the parsed table from this cache when the file is unchanged.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per match (``match_id``, ``player1``, ``player2``, ``round``, ...).
+    """
+    if cache is not None:
+        return cache.load(matches_path, load_ao_matches)
+    return pd.read_csv(matches_path, dtype={'match_id': 'string', 'player1': 'string',
+                                            'player2': 'string'})
+
+
+def iter_ao_points(points_path, matches_path=None, chunksize=100_000,
+                   players=None, rounds=None, columns=None, cache=None):
+    """
+    Stream point-by-point rows in fixed-size, typed chunks.
+
+    Player and round filters are resolved against the match table up front
+    and applied to each chunk as it is read, so unwanted points are never
+    accumulated.
+
+    Parameters
+    ----------
+    points_path : str
+        Path to ``YYYY-ausopen-points.csv``.
+    matches_path : str, optional
+        Path to the match table. Defaults to the ``-matches.csv`` file next
+        to ``points_path``; only needed for ``players`` / ``rounds``.
+    chunksize : int, default 100_000
+        Number of CSV rows read per chunk. Filtered chunks may be smaller;
+        empty chunks are skipped.
+    players : str or list of str, optional
+        Keep only matches involving any of these players.
+    rounds : int/str or list, optional
+        Keep only matches from these rounds (compared as strings).
+    columns : list of str, optional
+        Columns to read. ``match_id`` is always included.
+    cache : DatasetCache, optional
+        Serve the (filtered) points from this cache when the files and
+        arguments are unchanged. On a miss the points are collected while
+        they are yielded and stored once the file has been read to the
+        end, so they are held in memory once.
+
+    Yields
+    ------
+    pandas.DataFrame
+        A chunk of points.
+
+    Examples
+    --------
+    >>> from BsuTennis.data import iter_ao_points
+    >>> aces = 0
+    >>> for chunk in iter_ao_points('2019-ausopen-points.csv', players='Novak Djokovic'):
+    ...     aces += chunk['P1Ace'].sum() + chunk['P2Ace'].sum()
+    """
+    if cache is not None:
+        yield from _cached_points(cache, points_path, matches_path, chunksize,
+                                  players, rounds, columns)
+        return
+
+    match_ids = None
+    if players is not None or rounds is not None:
+        match_ids = _select_matches(points_path, matches_path, players, rounds)
+        if not match_ids:
+            return
+
+    usecols, dtypes = _read_plan(points_path, columns)
+    reader = pd.read_csv(points_path, usecols=usecols, dtype=dtypes, chunksize=chunksize)
+    with reader:
+        for chunk in reader:
+            if match_ids is not None:
+                chunk = chunk[chunk['match_id'].isin(match_ids)]
+            if len(chunk):
+                yield chunk
+
+
+def iter_ao_matches(points_path, matches_path=None, chunksize=100_000,
+                    players=None, rounds=None, columns=None, cache=None):
+    """
+    Stream points grouped by match.
+
+    Points are read in chunks (see ``iter_ao_points``); a match that spans
+    a chunk boundary is held back until it is complete, so at most one
+    chunk plus one match is in memory at a time. Assumes the points of a
+    match are contiguous in the file, as in the published data.
+
+    Parameters
+    ----------
+    points_path, matches_path, chunksize, players, rounds, columns, cache
+        See ``iter_ao_points``.
+
+    Yields
+    ------
+    match_id : str
+    points : pandas.DataFrame
+        All points of that match.
+    """
+    pending = None
+    for chunk in iter_ao_points(points_path, matches_path, chunksize=chunksize,
+                                players=players, rounds=rounds, columns=columns,
+                                cache=cache):
+        if pending is not None:
+            chunk = pd.concat([pending, chunk])
+        ids = chunk['match_id']
+        last_id = ids.iloc[-1]
+        complete = chunk[ids != last_id]
+        pending = chunk[ids == last_id]
+        for match_id, points in complete.groupby('match_id', sort=False):
+            yield match_id, points
+
+    if pending is not None and len(pending):
+        yield pending['match_id'].iloc[0], pending
+
+
+def _cached_points(cache, points_path, matches_path, chunksize, players, rounds, columns):
+    params = {'players': players, 'rounds': rounds, 'columns': columns}
+    if players is not None or rounds is not None:
+        # The filters are resolved against the match table, so it is part of the key
+        matches_path = matches_path or _default_matches_path(points_path)
+        params['matches'] = file_hash(matches_path)
+    key, loader_name = cache._loader_key(points_path, iter_ao_points, **params)
+
+    points = cache.get(key)
+    if points is not None:
+        for start in range(0, len(points), chunksize):
+            yield points.iloc[start:start + chunksize]
+        return
+
+    chunks = []
+    for chunk in iter_ao_points(points_path, matches_path, chunksize=chunksize,
+                                players=players, rounds=rounds, columns=columns):
+        chunks.append(chunk.copy(deep=False))  # Unaffected by columns the caller adds
+        yield chunk
+    # Only reached once the caller has consumed every chunk
+    points = (pd.concat(chunks, ignore_index=True) if chunks
+              else _empty_points(points_path, columns))
+    cache.put(key, points, source=os.path.abspath(points_path), loader_name=loader_name)
+
+
+def _read_plan(points_path, columns):
+    """``usecols`` and typed ``dtype`` arguments for reading ``points_path``."""
+    header = pd.read_csv(points_path, nrows=0).columns
+    usecols = None
+    if columns is not None:
+        wanted = set(columns) | {'match_id'}
+        usecols = [col for col in header if col in wanted]
+    present = header if usecols is None else usecols
+    dtypes = {col: dtype for col, dtype in AO_POINT_DTYPES.items() if col in present}
+    return usecols, dtypes
+
+
+def _empty_points(points_path, columns=None):
+    """Zero-row frame with the columns and dtypes ``iter_ao_points`` would yield."""
+    usecols, dtypes = _read_plan(points_path, columns)
+    return pd.read_csv(points_path, usecols=usecols, dtype=dtypes, nrows=0)
+
+
+def _select_matches(points_path, matches_path, players, rounds):
+    if matches_path is None:
+        matches_path = _default_matches_path(points_path)
+    if matches_path is None or not os.path.exists(matches_path):
+        raise ValueError("Filtering by players or rounds requires the matches file "
+                         "(pass matches_path).")
+
+    matches = load_ao_matches(matches_path)
+    keep = pd.Series(True, index=matches.index)
+    if players is not None:
+        players = [players] if isinstance(players, str) else list(players)
+        keep &= matches['player1'].isin(players) | matches['player2'].isin(players)
+    if rounds is not None:
+        rounds = [rounds] if isinstance(rounds, (str, int)) else list(rounds)
+        keep &= matches['round'].astype(str).isin([str(r) for r in rounds])
+    return set(matches.loc[keep, 'match_id'])
+
+
+def _default_matches_path(points_path):
+    folder, name = os.path.split(points_path)
+    if '-points' not in name:
+        return None
+    return os.path.join(folder, name.replace('-points', '-matches'))
@@ -0,0 +1,268 @@
+"""
+ATP Match Data Loader
+
+Reads ATP match/stats CSVs (``atp_matches_YYYY.csv`` layout: one row per
+match, ``winner_*`` / ``loser_*`` player columns, ``w_*`` / ``l_*`` serve
+stats) with explicit compact dtypes, and keeps a columnar cache (Parquet or
+Feather) next to the sources so later loads only read the requested columns
+and years.
+"""
+
+import os
+import glob
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from .cache import DatasetCache
+
+# Compact dtypes for the ATP match schema. Nullable integer types keep
+# missing stats (walkovers, older seasons) without falling back to float64.
+_PLAYER_DTYPES = {
+    'id': 'int32',
+    'seed': 'Int8',
+    'entry': 'category',
+    'name': 'category',
+    'hand': 'category',
+    'ht': 'Int16',
+    'ioc': 'category',
+    'age': 'float32',
+    'rank': 'Int16',
+    'rank_points': 'Int32',
+}
+
+_STAT_COLUMNS = ['ace', 'df', 'svpt', '1stIn', '1stWon', '2ndWon', 'SvGms', 'bpSaved', 'bpFaced']
+
+ATP_DTYPES = {
+    'tourney_id': 'category',
+    'tourney_name': 'category',
+    'surface': 'category',
+    'draw_size': 'Int16',
+    'tourney_level': 'category',
+    'match_num': 'Int16',
+    'score': 'category',
+    'best_of': 'Int8',
+    'round': 'category',
+    'minutes': 'Int16',
+}
+for _side in ('winner', 'loser'):
+    ATP_DTYPES.update({f'{_side}_{key}': dtype for key, dtype in _PLAYER_DTYPES.items()})
+for _prefix in ('w', 'l'):
+    ATP_DTYPES.update({f'{_prefix}_{stat}': 'Int16' for stat in _STAT_COLUMNS})
+
+_CACHE_FORMATS = {'parquet': '.parquet', 'feather': '.feather'}
+
+
+def load_atp(path, years=None, columns=None, cache=True, cache_dir=None,
+             cache_format='parquet', refresh=False):
+    """
+    Load ATP match data as a tidy DataFrame with compact dtypes.
+
+    On first load each CSV is parsed once and written to a columnar cache
+    file. Later loads read the cache, touching only the requested columns
+    (and, for Parquet, only the row groups of the requested years).
+
+    Parameters
+    ----------
+    path : str or list of str
+        A CSV file, a directory containing ``atp_matches_*.csv`` files,
+        or a list of CSV files.
+    years : int or list of int, optional
+        Seasons to keep (by ``tourney_date``). None loads all.
+    columns : list of str, optional
+        Columns to return. ``tourney_date`` and ``year`` are always included.
+    cache : bool or DatasetCache, default True
+        Use (and create) the columnar cache. Requires ``pyarrow``; without it
+        the CSVs are read directly with a warning. A ``DatasetCache`` stores
+        each parsed season there instead, keyed by the CSV's content, and
+        ``cache_dir`` / ``cache_format`` are ignored.
+    cache_dir : str, optional
+        Cache location. Defaults to a ``_cache`` folder next to each CSV.
+    cache_format : str, default 'parquet'
+        'parquet' or 'feather'.
+    refresh : bool, default False
+        Rebuild the cache even if it is up to date.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per match. ``tourney_date`` is a datetime64 column and
+        ``year`` an int16 column.
+
+    Examples
+    --------
+    >>> from BsuTennis.data import load_atp
+    >>> df = load_atp('tennis_atp/', years=[2022, 2023],
+    ...               columns=['surface', 'winner_name', 'loser_name', 'w_ace'])
+    """
+    if cache_format not in _CACHE_FORMATS:
+        raise ValueError(f"cache_format must be 'parquet' or 'feather', got {cache_format!r}")
+
+    files = _resolve_files(path)
+    if not files:
+        raise FileNotFoundError(f"No ATP match CSVs found at {path!r}")
+
+    if years is not None:
+        years = [int(year) for year in np.atleast_1d(years)]
+    if columns is not None:
+        columns = list(dict.fromkeys(['tourney_date', 'year'] + list(columns)))
+
+    shared = cache if isinstance(cache, DatasetCache) else None
+    if cache and not _has_pyarrow():
+        warnings.warn("pyarrow is not installed; reading ATP CSVs without the columnar cache.")
+        cache = shared = None
+
+    frames = []
+    for csv_path in files:
+        if shared is not None:
+            df = _restore_dtypes(shared.load(csv_path, read_atp_csv, refresh=refresh))
+            if years is not None:
+                df = df[df['year'].isin(years)]
+            if columns is not None:
+                df = df[[col for col in columns if col in df]]
+        elif cache:
+            cache_path = _cache_path(csv_path, cache_dir, cache_format)
+            if refresh or _is_stale(cache_path, csv_path):
+                _write_cache(read_atp_csv(csv_path), cache_path, cache_format)
+            df = _read_cache(cache_path, cache_format, columns, years)
+        else:
+            df = read_atp_csv(csv_path, columns=columns)
+            if years is not None:
+                df = df[df['year'].isin(years)]
+        frames.append(df)
+
+    return _concat(frames)
+
+
+def read_atp_csv(csv_path, columns=None):
+    """
+    Parse a single ATP match CSV with the compact ``ATP_DTYPES`` schema.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV.
+    columns : list of str, optional
+        Subset of columns to parse (unknown names are ignored).
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    header = pd.read_csv(csv_path, nrows=0).columns
+    usecols = None if columns is None else [col for col in header if col in columns]
+    present = header if usecols is None else usecols
+    dtypes = {col: dtype for col, dtype in ATP_DTYPES.items() if col in present}
+
+    df = pd.read_csv(csv_path, usecols=usecols, dtype=dtypes)
+    if 'tourney_date' in df:
+        df['tourney_date'] = pd.to_datetime(df['tourney_date'].astype('string'), format='%Y%m%d')
+        df['year'] = df['tourney_date'].dt.year.astype('int16')
+    return df
+
+
+def _resolve_files(path):
+    if isinstance(path, (list, tuple)):
+        return [str(p) for p in path]
+    path = str(path)
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, 'atp_matches_*.csv')))
+    return [path] if os.path.exists(path) else []
+
+
+def _has_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _cache_path(csv_path, cache_dir, cache_format):
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(csv_path)), '_cache')
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(cache_dir, stem + _CACHE_FORMATS[cache_format])
+
+
+def _is_stale(cache_path, csv_path):
+    return (not os.path.exists(cache_path)
+            or os.path.getmtime(cache_path) < os.path.getmtime(csv_path))
+
+
+def _write_cache(df, cache_path, cache_format):
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    # Write to a temp file first so an interrupted run never leaves a
+    # truncated cache behind
+    tmp_path = cache_path + '.tmp'
+    if cache_format == 'parquet':
+        _write_parquet_by_year(df, tmp_path)
+    else:
+        df.reset_index(drop=True).to_feather(tmp_path)
+    os.replace(tmp_path, cache_path)
+
+
+def _write_parquet_by_year(df, path):
+    # One row group per season, so a `years` filter skips whole row groups
+    # using their min/max statistics instead of decoding every row
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if 'year' not in df:
+        df.to_parquet(path, index=False)
+        return
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(path, schema) as writer:
+        for _, season in df.groupby('year', sort=True):
+            writer.write_table(pa.Table.from_pandas(season, schema=schema, preserve_index=False))
+
+
+def _read_cache(cache_path, cache_format, columns, years):
+    if cache_format == 'parquet':
+        import pyarrow.parquet as pq
+
+        if columns is not None:
+            available = pq.read_schema(cache_path).names
+            columns = [col for col in columns if col in available]
+        filters = None if years is None else [('year', 'in', years)]
+        df = pd.read_parquet(cache_path, columns=columns, filters=filters)
+    else:
+        if columns is not None:
+            import pyarrow.feather as feather
+
+            available = feather.read_table(cache_path, memory_map=True).column_names
+            columns = [col for col in columns if col in available]
+        df = pd.read_feather(cache_path, columns=columns)
+        if years is not None:
+            df = df[df['year'].isin(years)]
+    return _restore_dtypes(df)
+
+
+def _restore_dtypes(df):
+    # A column with no values at all (e.g. winner_entry in some seasons)
+    # loses its categorical type in the round trip; reapply the schema
+    dtypes = {col: dtype for col, dtype in ATP_DTYPES.items()
+              if col in df and str(df[col].dtype) != dtype}
+    return df.astype(dtypes) if dtypes else df
+
+
+def _concat(frames):
+    # Seasons filtered out by `years` come back empty
+    frames = [df for df in frames if len(df)] or frames[:1]
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True)
+
+    # Categories differ between seasons; union them so the result stays
+    # categorical instead of decaying to object columns. Seasons with no
+    # values at all carry no categories (of a different dtype) and are
+    # left out of the union
+    for col in frames[0].columns:
+        if isinstance(frames[0][col].dtype, pd.CategoricalDtype):
+            columns = [df[col] for df in frames if col in df]
+            columns = [c for c in columns if len(c.cat.categories)] or columns[:1]
+            categories = pd.api.types.union_categoricals(columns).categories
+            for df in frames:
+                if col in df:
+                    df[col] = df[col].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,184 @@
+"""
+Parallel Multi-Match Loading
+
+Fans file parsing out to a process pool. Workers write their parsed tables
+to Arrow IPC (Feather) files on disk and send back only the file path; the
+parent memory-maps and concatenates them, so large DataFrames are never
+pickled between processes.
+"""
+
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .atp import read_atp_csv
+from .ao import iter_ao_points, _empty_points
+from .rg import load_rg_tracking, open_rg_tracking
+
+
+def _read_ao_points(path, **kwargs):
+    chunks = list(iter_ao_points(path, **kwargs))
+    if not chunks:
+        # Nothing matched the filters: an empty, typed table keeps the file
+        # from failing the whole load
+        return _empty_points(path, kwargs.get('columns'))
+    return pd.concat(chunks, ignore_index=True)
+
+
+_LOADERS = {
+    'atp': read_atp_csv,
+    'ao': _read_ao_points,
+}
+
+
+def _parse_to_arrow(read, path, out_path, loader_kwargs):
+    """Worker: parse one file and write it as Arrow IPC. Returns (out_path, rows)."""
+    df = read(path, **loader_kwargs)
+    # A categorical with no values (e.g. winner_entry in some seasons) has
+    # no categories and would be written as a null dictionary that cannot
+    # be concatenated with the other files; give it string categories
+    for col in df.columns:
+        dtype = df[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype) and not len(dtype.categories):
+            df[col] = df[col].cat.set_categories(pd.Index([], dtype='str'))
+    df.reset_index(drop=True).to_feather(out_path)
+    return out_path, len(df)
+
+
+def _parse_tracking(path, out_path, loader_kwargs):
+    """Worker: stream one tracking file into a .npy. Returns out_path."""
+    load_rg_tracking(path, out=out_path, **loader_kwargs)
+    return out_path
+
+
+def _run(worker, jobs, workers):
+    if workers == 1:
+        return [worker(*job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(worker, *job) for job in jobs]
+        return [future.result() for future in futures]
+
+
+def _with_source(table, source_column, path):
+    """Append a dictionary-encoded column holding the file name."""
+    import pyarrow as pa
+
+    name = os.path.basename(path)
+    source = pa.DictionaryArray.from_arrays(pa.array(np.zeros(table.num_rows, dtype=np.int8)),
+                                            pa.array([name], type=pa.large_string()))
+    return table.append_column(source_column, source)
+
+
+def load_many(paths, loader='atp', workers=None, out_dir=None, as_arrow=False,
+              source_column='source', cache=None, **loader_kwargs):
+    """
+    Parse many files in parallel and return one concatenated table.
+
+    Parameters
+    ----------
+    paths : list of str
+        Files to parse (e.g. one per match or season).
+    loader : str or callable, default 'atp'
+        'atp' (``read_atp_csv``), 'ao' (full point-by-point file) or a
+        picklable top-level function ``f(path, **loader_kwargs) -> DataFrame``.
+    workers : int, optional
+        Number of worker processes. Defaults to ``os.cpu_count()``;
+        1 parses in the current process.
+    out_dir : str, optional
+        Where workers write their Arrow files. Defaults to a temporary
+        directory, removed after loading unless ``as_arrow=True``.
+    as_arrow : bool, default False
+        Return the memory-mapped ``pyarrow.Table`` (zero-copy) instead of
+        converting it to pandas.
+    source_column : str or None, default 'source'
+        Name of a column holding each row's source file name.
+    cache : DatasetCache, optional
+        Files already parsed with the same loader and arguments are read
+        from this cache (memory-mapped) instead of being sent to a worker;
+        new parses are added to it. Only the calling process touches the
+        cache.
+    **loader_kwargs : dict
+        Passed to the loader (e.g. ``columns=[...]``).
+
+    Returns
+    -------
+    pandas.DataFrame or pyarrow.Table
+
+    Examples
+    --------
+    >>> from glob import glob
+    >>> from BsuTennis.data import load_many
+    >>> df = load_many(sorted(glob('tennis_atp/atp_matches_20*.csv')), workers=8)
+    """
+    import pyarrow as pa
+
+    paths = [os.fspath(p) for p in paths]
+    if not paths:
+        raise ValueError("No files to load")
+    if isinstance(loader, str) and loader not in _LOADERS:
+        raise ValueError(f"Unknown loader {loader!r}; use one of {list(_LOADERS)} or a function")
+
+    cleanup = out_dir is None and not as_arrow
+    out_dir = out_dir or tempfile.mkdtemp(prefix='bsutennis_')
+    os.makedirs(out_dir, exist_ok=True)
+    read = _LOADERS[loader] if isinstance(loader, str) else loader
+
+    tables = [None] * len(paths)
+    keys = [None] * len(paths)
+    if cache is not None:
+        for i, path in enumerate(paths):
+            keys[i], loader_name = cache._loader_key(path, read, **loader_kwargs)
+            tables[i] = cache.get(keys[i], as_arrow=True)
+    missing = [i for i, table in enumerate(tables) if table is None]
+    jobs = [(read, paths[i], os.path.join(out_dir, f'{i:05d}.arrow'), loader_kwargs)
+            for i in missing]
+
+    try:
+        results = _run(_parse_to_arrow, jobs, workers or os.cpu_count())
+        for i, (out_path, _) in zip(missing, results):
+            tables[i] = pa.ipc.open_file(pa.memory_map(out_path)).read_all()
+            if cache is not None:
+                cache.put(keys[i], tables[i], source=os.path.abspath(paths[i]),
+                          loader_name=loader_name)
+        if source_column:
+            tables = [_with_source(table, source_column, path)
+                      for table, path in zip(tables, paths)]
+        table = pa.concat_tables(tables, promote_options='default')
+        if as_arrow:
+            return table
+        return table.to_pandas()
+    finally:
+        if cleanup:
+            shutil.rmtree(out_dir, ignore_errors=True)
+
+
+def load_tracking_many(paths, out_dir, workers=None, **loader_kwargs):
+    """
+    Convert many tracking files to memory-mapped ``.npy`` in parallel.
+
+    Parameters
+    ----------
+    paths : list of str
+        Tracking exports (see ``load_rg_tracking``).
+    out_dir : str
+        Directory for the ``.npy`` files (named after each source file).
+    workers : int, optional
+        Number of worker processes. Defaults to ``os.cpu_count()``.
+    **loader_kwargs : dict
+        Passed to ``load_rg_tracking`` (e.g. ``fields``).
+
+    Returns
+    -------
+    dict
+        Source path -> memory-mapped structured array.
+    """
+    paths = [os.fspath(p) for p in paths]
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(path, os.path.join(out_dir, os.path.splitext(os.path.basename(path))[0] + '.npy'),
+             loader_kwargs) for path in paths]
+    results = _run(_parse_tracking, jobs, workers or os.cpu_count())
+    return {path: open_rg_tracking(out_path) for path, out_path in zip(paths, results)}
@@ -0,0 +1,265 @@
+"""
+Content-Addressed Dataset Cache
+
+Stores parsed, normalized tables keyed by the hash of the source file plus
+the loader name, loader version and loader arguments, so a restarted
+notebook or report job reuses earlier parses instead of re-reading raw
+files. Entries are Arrow IPC (Feather) files; the cache is size-bounded
+with least-recently-used eviction.
+
+``load_atp``, ``load_many``, the Australian Open point/match loaders and
+``load_rg_tracking`` take a ``cache`` argument that routes them through a
+``DatasetCache``.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+import pandas as pd
+
+_INDEX_NAME = 'index.json'
+
+
+def default_cache_dir():
+    """``$BSUTENNIS_CACHE`` or ``~/.cache/bsutennis``."""
+    return os.environ.get('BSUTENNIS_CACHE',
+                          os.path.join(os.path.expanduser('~'), '.cache', 'bsutennis'))
+
+
+def file_hash(path, block_size=1 << 20):
+    """SHA-256 of a file's content, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DatasetCache:
+    """
+    Size-bounded, content-addressed cache of parsed tables.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        Cache location. Defaults to ``default_cache_dir()``.
+    max_bytes : int, default 2 GiB
+        Total size above which least-recently-used entries are evicted.
+
+    Examples
+    --------
+    >>> from BsuTennis.data import DatasetCache, read_atp_csv
+    >>> cache = DatasetCache(max_bytes=500 * 2**20)
+    >>> df = cache.load('atp_matches_2023.csv', read_atp_csv)   # parses
+    >>> df = cache.load('atp_matches_2023.csv', read_atp_csv)   # cache hit
+    >>> df = load_atp('tennis_atp/', years=2023, cache=cache)   # loaders take it too
+    >>> cache.info()
+    >>> cache.clear()
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=2 * 1024 ** 3):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._index_path = os.path.join(self.cache_dir, _INDEX_NAME)
+        self._index = self._read_index()
+
+    def __repr__(self):
+        return (f"DatasetCache({self.cache_dir!r}, entries={len(self._index['entries'])}, "
+                f"size={self.size_bytes()}/{self.max_bytes})")
+
+    # -------------------------------------------------------------------------
+    # Keys
+    # -------------------------------------------------------------------------
+    def source_hash(self, path):
+        """
+        Content hash of ``path``, memoized by (size, mtime) so unchanged
+        files are not re-hashed.
+        """
+        path = os.path.abspath(os.fspath(path))
+        stat = os.stat(path)
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        known = self._index['sources'].get(path)
+        if known is not None and known['stamp'] == stamp:
+            return known['hash']
+        digest = file_hash(path)
+        self._index['sources'][path] = {'stamp': stamp, 'hash': digest}
+        self._write_index()
+        return digest
+
+    def key(self, path, loader_name, version, params=None):
+        """Cache key for a source file parsed by a given loader version and arguments."""
+        payload = json.dumps([self.source_hash(path), loader_name, str(version), params or {}],
+                             sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _loader_key(self, path, loader, version=None, **params):
+        """``(key, loader_name)`` for ``loader(path, **params)``."""
+        from .. import __version__
+
+        loader_name = f'{loader.__module__}.{loader.__qualname__}'
+        if version is None:
+            version = getattr(loader, 'cache_version', __version__)
+        return self.key(path, loader_name, version, params), loader_name
+
+    # -------------------------------------------------------------------------
+    # Get / put
+    # -------------------------------------------------------------------------
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + '.arrow')
+
+    def get(self, key, as_arrow=False):
+        """
+        Cached table for ``key``, or None.
+
+        With ``as_arrow=True`` the entry is returned as a memory-mapped
+        ``pyarrow.Table`` instead of a DataFrame.
+        """
+        entry = self._index['entries'].get(key)
+        if entry is None:
+            return None
+        entry_path = self._entry_path(key)
+        if not os.path.exists(entry_path):
+            # Deleted behind our back: forget it
+            self._remove(key)
+            self._write_index()
+            return None
+        if as_arrow:
+            import pyarrow.feather as feather
+            data = feather.read_table(entry_path, memory_map=True)
+        else:
+            data = pd.read_feather(entry_path)
+        entry['last_access'] = time.time()
+        self._write_index()
+        return data
+
+    def put(self, key, data, source=None, loader_name=None):
+        """Store ``data`` (DataFrame or ``pyarrow.Table``) under ``key`` and evict old entries if over budget."""
+        import pyarrow.feather as feather
+
+        entry_path = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        tmp_path = entry_path + '.tmp'
+        if isinstance(data, pd.DataFrame):
+            data = data.reset_index(drop=True)
+        feather.write_feather(data, tmp_path)
+        os.replace(tmp_path, entry_path)
+
+        now = time.time()
+        self._index['entries'][key] = {
+            'source': source,
+            'loader': loader_name,
+            'size': os.path.getsize(entry_path),
+            'created': now,
+            'last_access': now,
+        }
+        self.evict()
+
+    def load(self, path, loader, version=None, refresh=False, **kwargs):
+        """
+        Return ``loader(path, **kwargs)``, from the cache when possible.
+
+        Parameters
+        ----------
+        path : str
+            Source file.
+        loader : callable
+            Parser returning a DataFrame (e.g. ``read_atp_csv``).
+        version : str, optional
+            Loader version; bump it when the parser output changes. Defaults
+            to the loader's ``cache_version`` attribute, then the package version.
+        refresh : bool, default False
+            Re-run the loader and replace the cached entry.
+        **kwargs : dict
+            Passed to the loader and included in the key.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        key, loader_name = self._loader_key(path, loader, version, **kwargs)
+        df = None if refresh else self.get(key)
+        if df is None:
+            df = loader(path, **kwargs)
+            self.put(key, df, source=os.path.abspath(os.fspath(path)), loader_name=loader_name)
+        return df
+
+    # -------------------------------------------------------------------------
+    # Inspection / eviction
+    # -------------------------------------------------------------------------
+    def size_bytes(self):
+        """Total size of all cached entries."""
+        return sum(entry['size'] for entry in self._index['entries'].values())
+
+    def info(self):
+        """
+        Cached entries, most recently used first.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Columns: key, source, loader, size, created, last_access.
+        """
+        rows = [dict(key=key, **entry) for key, entry in self._index['entries'].items()]
+        df = pd.DataFrame(rows, columns=['key', 'source', 'loader', 'size', 'created', 'last_access'])
+        for col in ('created', 'last_access'):
+            df[col] = pd.to_datetime(df[col], unit='s')
+        return df.sort_values('last_access', ascending=False, ignore_index=True)
+
+    def evict(self, max_bytes=None):
+        """
+        Remove least-recently-used entries until the cache fits ``max_bytes``.
+
+        Returns
+        -------
+        list of str
+            Evicted keys.
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        entries = self._index['entries']
+        total = self.size_bytes()
+        evicted = []
+        for key in sorted(entries, key=lambda k: entries[k]['last_access']):
+            if total <= budget:
+                break
+            total -= entries[key]['size']
+            self._remove(key)
+            evicted.append(key)
+        self._write_index()
+        return evicted
+
+    def clear(self, key=None):
+        """Remove the entry ``key``, or every cached entry."""
+        for key in list(self._index['entries']) if key is None else [key]:
+            self._remove(key)
+        self._write_index()
+
+    def _remove(self, key):
+        entry = self._index['entries'].pop(key, None)
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+        # Forget remembered source hashes that no remaining entry refers to
+        if entry is not None:
+            sources = {other['source'] for other in self._index['entries'].values()}
+            for source in set(self._index['sources']) - sources:
+                del self._index['sources'][source]
+
+    def _read_index(self):
+        try:
+            with open(self._index_path) as f:
+                index = json.load(f)
+        except (FileNotFoundError, ValueError):
+            index = {}
+        index.setdefault('entries', {})
+        index.setdefault('sources', {})
+        return index
+
+    def _write_index(self):
+        tmp_path = self._index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
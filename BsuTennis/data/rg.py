@@ -0,0 +1,284 @@
+"""
+Roland Garros Tracking Data Parser
+
+Ball/player tracking exports are large nested JSON files. Frames are decoded
+one at a time from a bounded read buffer and written straight into
+preallocated NumPy buffers, or into a memory-mapped ``.npy`` file that can be
+reopened later without re-parsing.
+
+Supported layouts:
+- a top-level JSON array of frames,
+- a JSON object holding the frames array under ``frames_key``,
+- JSON Lines (``.jsonl`` / ``.ndjson``), one frame per line.
+"""
+
+import io
+import json
+import os
+import re
+import struct
+
+import numpy as np
+import pandas as pd
+
+# Output column -> path into a frame. Integers index into lists.
+RG_TRACKING_FIELDS = {
+    't': ('t',),
+    'ball_x': ('ball', 'x'),
+    'ball_y': ('ball', 'y'),
+    'ball_z': ('ball', 'z'),
+    'p1_x': ('players', 0, 'x'),
+    'p1_y': ('players', 0, 'y'),
+    'p2_x': ('players', 1, 'x'),
+    'p2_y': ('players', 1, 'y'),
+}
+
+
+def iter_rg_frames(path, frames_key='frames', block_size=1 << 20):
+    """
+    Yield tracking frames one at a time without loading the whole file.
+
+    Parameters
+    ----------
+    path : str
+        JSON or JSON Lines tracking export.
+    frames_key : str, default 'frames'
+        Key of the frames array when the top level is an object.
+    block_size : int, default 1 MiB
+        Number of characters read per refill.
+
+    Yields
+    ------
+    dict
+        One decoded frame.
+    """
+    if os.path.splitext(path)[1] in ('.jsonl', '.ndjson'):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from _iter_array_items(f, frames_key, block_size)
+
+
+def _iter_array_items(f, frames_key, block_size):
+    decoder = json.JSONDecoder()
+    buf = f.read(block_size)
+    eof = len(buf) < block_size
+    pos = 0
+
+    def refill():
+        nonlocal buf, pos, eof
+        chunk = f.read(block_size)
+        eof = len(chunk) < block_size
+        buf = buf[pos:] + chunk
+        pos = 0
+        return bool(chunk)
+
+    # Locate the opening '[' of the frames array
+    while pos < len(buf) and buf[pos].isspace():
+        pos += 1
+    if pos >= len(buf):
+        return
+    if buf[pos] == '{':
+        pattern = re.compile(r'"%s"\s*:\s*\[' % re.escape(frames_key))
+        while True:
+            match = pattern.search(buf, pos)
+            if match:
+                pos = match.end()
+                break
+            if eof:
+                raise ValueError(f"No '{frames_key}' array found in tracking file")
+            # Keep a tail in case the key straddles the block boundary
+            pos = max(pos, len(buf) - len(frames_key) - 64)
+            refill()
+    elif buf[pos] == '[':
+        pos += 1
+    else:
+        raise ValueError("Tracking file must contain a JSON array or object")
+
+    # Decode one element at a time
+    while True:
+        while pos < len(buf) and (buf[pos].isspace() or buf[pos] == ','):
+            pos += 1
+        if pos >= len(buf):
+            if eof or not refill():
+                raise ValueError("Unexpected end of tracking file")
+            continue
+        if buf[pos] == ']':
+            return
+        try:
+            frame, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            # Frame is cut by the block boundary
+            if eof or not refill():
+                raise
+            continue
+        yield frame
+        pos = end
+        if pos > block_size:
+            buf = buf[pos:]
+            pos = 0
+
+
+def _extract(frame, path):
+    value = frame
+    for key in path:
+        try:
+            value = value[key]
+        except (KeyError, IndexError, TypeError):
+            return np.nan
+    return np.nan if value is None else value
+
+
+def tracking_dtype(fields=None, dtype=np.float32):
+    """Structured dtype with one ``dtype`` column per tracking field."""
+    fields = RG_TRACKING_FIELDS if fields is None else fields
+    return np.dtype([(name, dtype) for name in fields])
+
+
+def load_rg_tracking(path, out=None, fields=None, n_frames=None, chunk_frames=65536,
+                     dtype=np.float32, frames_key='frames', cache=None):
+    """
+    Parse a tracking export into a structured NumPy array in bounded memory.
+
+    Parameters
+    ----------
+    path : str
+        Tracking file (see module docstring for layouts).
+    out : str, optional
+        Path of a ``.npy`` file to stream the frames into. The result is
+        returned memory-mapped and can be reopened with ``open_rg_tracking``.
+        If None, frames go into an in-memory buffer.
+    fields : dict, optional
+        Output column -> path into a frame. Defaults to ``RG_TRACKING_FIELDS``.
+        Missing values become NaN.
+    n_frames : int, optional
+        Expected number of frames, used to preallocate the in-memory buffer
+        (it grows by doubling if exceeded).
+    chunk_frames : int, default 65536
+        Frames buffered before each write to ``out``.
+    dtype : numpy dtype, default float32
+        Storage type of every column.
+    frames_key : str, default 'frames'
+        Key of the frames array when the top level is an object.
+    cache : DatasetCache, optional
+        Reuse the parsed frames from this cache when the file and
+        ``fields`` / ``dtype`` are unchanged (written to ``out`` if given).
+
+    Returns
+    -------
+    numpy.ndarray or numpy.memmap
+        Structured array with one record per frame; access columns by name,
+        e.g. ``data['ball_x']``.
+
+    Examples
+    --------
+    >>> from BsuTennis.data import load_rg_tracking, open_rg_tracking
+    >>> data = load_rg_tracking('rg_final_tracking.json', out='rg_final.npy')
+    >>> data = open_rg_tracking('rg_final.npy')   # later: no re-parsing
+    """
+    fields = RG_TRACKING_FIELDS if fields is None else fields
+    paths = list(fields.values())
+    record = tracking_dtype(fields, dtype)
+    if cache is not None:
+        return _cached_tracking(cache, path, out, fields, record, n_frames, chunk_frames,
+                                dtype, frames_key)
+    frames = iter_rg_frames(path, frames_key=frames_key)
+
+    if out is not None:
+        return _stream_to_npy(frames, paths, record, out, chunk_frames)
+
+    buffer = np.empty(n_frames or chunk_frames, dtype=record)
+    n = 0
+    for frame in frames:
+        if n == len(buffer):
+            grown = np.empty(2 * len(buffer), dtype=record)
+            grown[:n] = buffer
+            buffer = grown
+        buffer[n] = tuple(_extract(frame, p) for p in paths)
+        n += 1
+    return buffer[:n]
+
+
+def _cached_tracking(cache, path, out, fields, record, n_frames, chunk_frames, dtype,
+                     frames_key):
+    key, loader_name = cache._loader_key(path, load_rg_tracking, fields=fields,
+                                         dtype=np.dtype(dtype).str, frames_key=frames_key)
+    table = cache.get(key, as_arrow=True)
+    if table is None:
+        data = load_rg_tracking(path, out=out, fields=fields, n_frames=n_frames,
+                                chunk_frames=chunk_frames, dtype=dtype, frames_key=frames_key)
+        columns = {name: np.asarray(data[name]) for name in record.names}
+        cache.put(key, pd.DataFrame(columns), source=os.path.abspath(path),
+                  loader_name=loader_name)
+        return data
+
+    data = np.empty(table.num_rows, dtype=record)
+    for name in record.names:
+        data[name] = table.column(name).to_numpy()
+    if out is None:
+        return data
+    np.save(out, data)
+    return open_rg_tracking(out)
+
+
+def _npy_header(record, n_frames, size=None):
+    header = io.BytesIO()
+    np.lib.format.write_array_header_1_0(
+        header, {'descr': np.lib.format.dtype_to_descr(record),
+                 'fortran_order': False, 'shape': (n_frames,)})
+    header = header.getvalue()
+    if size is not None and len(header) < size:
+        # Pad the header dict with spaces (before its trailing newline)
+        header = header[:-1] + b' ' * (size - len(header)) + b'\n'
+        header = header[:8] + struct.pack('<H', size - 10) + header[10:]
+    return header
+
+
+def _stream_to_npy(frames, paths, record, out, chunk_frames):
+    # Data goes after a header slot sized for the largest possible frame
+    # count; the real header is written once the count is known
+    header_size = len(_npy_header(record, np.iinfo(np.int64).max))
+    chunk = np.empty(chunk_frames, dtype=record)
+    n_total = 0
+    tmp_path = out + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(b'\0' * header_size)
+        n = 0
+        for frame in frames:
+            chunk[n] = tuple(_extract(frame, p) for p in paths)
+            n += 1
+            if n == chunk_frames:
+                f.write(chunk.tobytes())
+                n_total += n
+                n = 0
+        if n:
+            f.write(chunk[:n].tobytes())
+            n_total += n
+
+        f.seek(0)
+        f.write(_npy_header(record, n_total, size=header_size))
+    os.replace(tmp_path, out)
+    return open_rg_tracking(out)
+
+
+def open_rg_tracking(npy_path, mode='r'):
+    """
+    Reopen tracking data written by ``load_rg_tracking(..., out=npy_path)``.
+
+    Parameters
+    ----------
+    npy_path : str
+        Path to the ``.npy`` file.
+    mode : str, default 'r'
+        ``numpy.load`` memory-map mode.
+
+    Returns
+    -------
+    numpy.memmap
+        Structured array, memory-mapped (nothing is read until accessed).
+    """
+    return np.load(npy_path, mmap_mode=mode)
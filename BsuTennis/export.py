@@ -0,0 +1,204 @@
+"""
+Parallel Figure Export
+
+Renders many report figures in a process pool. Each spec names a plotting
+function, its data and keyword arguments, and the output file; workers
+render on the non-interactive Agg backend, save, close the figure and send
+back only timings. Workers are replaced after a fixed number of figures
+and can be given a memory cap, so a long nightly run stays flat in memory.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Columns of the timing table returned by export_figures
+_COLUMNS = ['path', 'plot_seconds', 'save_seconds', 'seconds', 'pid', 'error']
+
+
+def _init_worker(memory_limit):
+    """Worker setup: headless backend and optional address-space cap."""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    if memory_limit:
+        import resource
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            memory_limit = min(memory_limit, hard)  # Raising it would break the pool
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard))
+
+
+def _figure_of(result):
+    """Figure from a plotting function's return value (current figure if None)."""
+    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
+
+    if isinstance(result, (tuple, list, np.ndarray)) and len(result):
+        result = result[0]
+    if isinstance(result, np.ndarray):
+        result = result.flat[0]
+    if isinstance(result, Figure):
+        return result
+    if getattr(result, 'figure', None) is not None:
+        return result.figure
+    return plt.gcf()
+
+
+def _render(func, data, kwargs, path, savefig_kws, record_errors):
+    """Worker: draw one figure and save it. Returns its timing record."""
+    import matplotlib.pyplot as plt
+
+    record = {'path': path, 'plot_seconds': np.nan, 'save_seconds': np.nan,
+              'seconds': np.nan, 'pid': os.getpid(), 'error': None}
+    existing = set(plt.get_fignums())
+    fig = None
+    start = time.perf_counter()
+    try:
+        fig = _figure_of(func(data, **kwargs))
+        drawn = time.perf_counter()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fig.savefig(path, **savefig_kws)
+        done = time.perf_counter()
+        record.update(plot_seconds=drawn - start, save_seconds=done - drawn, seconds=done - start)
+    except Exception as exc:
+        if not record_errors:
+            raise
+        record.update(seconds=time.perf_counter() - start, error=f"{type(exc).__name__}: {exc}")
+    finally:
+        # Only close what this spec created
+        if fig is not None:
+            plt.close(fig)
+        for number in set(plt.get_fignums()) - existing:
+            plt.close(number)
+    return record
+
+
+def _parse_spec(spec):
+    if isinstance(spec, dict):
+        return spec['func'], spec.get('data'), spec.get('kwargs') or {}, os.fspath(spec['path'])
+    func, data, kwargs, path = spec
+    return func, data, kwargs or {}, os.fspath(path)
+
+
+def export_figures(specs, workers=None, max_tasks_per_child=50, memory_limit=None,
+                   on_error='raise', progress=None, **savefig_kws):
+    """
+    Render and save many figures in parallel on the Agg backend.
+
+    Parameters
+    ----------
+    specs : list of tuple or dict
+        ``(func, data, kwargs, path)`` per figure (or dicts with those
+        keys). ``func(data, **kwargs)`` draws the figure and returns it, a
+        tuple starting with it (e.g. ``joint_plot``), an Axes/artist on it,
+        or None for the current figure. ``func`` must be a picklable
+        top-level function.
+    workers : int, optional
+        Number of worker processes. Defaults to ``os.cpu_count()``. Even
+        with 1, figures are rendered in a worker (Agg, ``memory_limit``),
+        never in the calling process.
+    max_tasks_per_child : int or None, default 50
+        Replace the workers after about this many figures each (every
+        ``workers * max_tasks_per_child`` figures), releasing whatever
+        matplotlib, font or allocator state they have built up. The new
+        workers start on the next figures while the old ones finish theirs,
+        so a slow figure does not stall the others. None keeps the same
+        workers for the whole run.
+    memory_limit : int, optional
+        Per-worker address-space cap in bytes (``RLIMIT_AS``, POSIX only).
+        A figure that exceeds it fails with MemoryError instead of pushing
+        the machine into swap. Leave headroom: this limits virtual, not
+        resident, memory. Must not exceed the process's hard limit.
+    on_error : str, default 'raise'
+        'raise' re-raises the first failure; 'record' stores the message
+        in the ``error`` column and carries on with the other figures.
+    progress : callable, optional
+        Called with each figure's record as it completes.
+    **savefig_kws : dict
+        Passed to ``Figure.savefig`` (e.g. ``dpi=150``, ``bbox_inches='tight'``).
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per spec, in order: ``path``, ``plot_seconds``,
+        ``save_seconds``, ``seconds``, ``pid`` and ``error``.
+
+    Examples
+    --------
+    >>> from BsuTennis import export_figures, joint_plot
+    >>> specs = [(joint_plot, x, {'y1': y, 'kind': 'kde', 'half': True}, f'out/{name}.png')
+    ...          for name, (x, y) in players.items()]
+    >>> timings = export_figures(specs, workers=8, dpi=150)
+    >>> timings.seconds.describe()
+    """
+    if on_error not in ('raise', 'record'):
+        raise ValueError(f"on_error must be 'raise' or 'record', got {on_error!r}")
+    if memory_limit:
+        try:
+            import resource
+        except ImportError:
+            raise ValueError("memory_limit needs the POSIX resource module") from None
+        # Checked here: a failing worker initializer breaks the whole pool
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY and memory_limit > hard:
+            raise ValueError(f"memory_limit={memory_limit} exceeds the hard address-space "
+                             f"limit of {hard} bytes")
+    jobs = [_parse_spec(spec) + (savefig_kws, on_error == 'record') for spec in specs]
+    workers = workers or os.cpu_count()
+
+    records = [None] * len(jobs)
+    # Workers are recycled by moving on to a fresh pool after each
+    # `workers * max_tasks_per_child` figures rather than with
+    # ProcessPoolExecutor(max_tasks_per_child=...), which can deadlock when
+    # it replaces a worker on some Python versions. At most `workers`
+    # figures are in flight across pools, so the next pool takes over as
+    # the old one drains instead of waiting for its slowest figure
+    quota = workers * max_tasks_per_child if max_tasks_per_child else len(jobs)
+    pending = {}  # future -> (job index, pool)
+    pool, used, submitted = None, quota, 0
+    try:
+        while submitted < len(jobs) or pending:
+            while submitted < len(jobs) and len(pending) < workers:
+                if used >= quota:
+                    pool = ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context(),
+                                               initializer=_init_worker,
+                                               initargs=(memory_limit,))
+                    used = 0
+                pending[pool.submit(_render, *jobs[submitted])] = (submitted, pool)
+                submitted += 1
+                used += 1
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i, owner = pending.pop(future)
+                records[i] = future.result()
+                if progress is not None:
+                    progress(records[i])
+                if owner is not pool and all(other is not owner for _, other in pending.values()):
+                    owner.shutdown()  # Drained: let its workers exit
+    except BaseException:
+        # Don't render the rest before re-raising
+        for owner in ({owner for _, owner in pending.values()} | {pool}) - {None}:
+            owner.shutdown(wait=False, cancel_futures=True)
+        raise
+    if pool is not None:
+        pool.shutdown()
+    return pd.DataFrame(records, columns=_COLUMNS)
+
+
+@lru_cache(maxsize=None)
+def _pool_context():
+    # Recycled workers fork from a server that has already imported
+    # matplotlib and BsuTennis, so replacing one costs milliseconds. The
+    # preload list is process-wide, so it is set only on the first export
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return None
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload(['matplotlib', 'BsuTennis'])
+    return context
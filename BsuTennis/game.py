@@ -0,0 +1,188 @@
+"""
+Match Loading
+
+``load_game`` returns a ``Game`` whose event table and tracking arrays are
+read only when first accessed. Tracking data is memory-mapped, so long
+matches never have to fit in RAM.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .shots import ShotTable
+from .data.rg import load_rg_tracking, open_rg_tracking
+
+# ShotTable field -> default event column name (used when present)
+_SHOT_COLUMNS = {
+    'x': 'x',
+    'y': 'y',
+    'x_end': 'x_end',
+    'y_end': 'y_end',
+    'shot_type': 'shot_type',
+    'outcome': 'outcome',
+}
+
+
+class Game:
+    """
+    A single match with lazily loaded events and tracking data.
+
+    Parameters
+    ----------
+    events : str or pandas.DataFrame, optional
+        Event file (CSV, Parquet or Feather) or an already loaded table.
+        One row per shot/event; coordinates in standard vertical court coords.
+    tracking : str, optional
+        Tracking file: a ``.npy`` written by ``load_rg_tracking`` or a raw
+        JSON export, which is converted once to ``tracking_cache``.
+    tracking_cache : str, optional
+        Where to store the converted tracking ``.npy``. Defaults to the
+        tracking path with a ``.npy`` extension.
+    shot_columns : dict, optional
+        ShotTable field -> event column mapping (``x``, ``y``, ``x_end``,
+        ``y_end``, ``shot_type``, ``outcome``). Defaults to same-named columns.
+
+    Examples
+    --------
+    >>> game = load_game('final_events.csv', tracking='final_tracking.json')
+    >>> court.scatter(ax, game.shots)                # events -> ShotTable
+    >>> court.kdeplot(ax, game.ball_positions())     # tracking, memory-mapped
+    """
+
+    def __init__(self, events=None, tracking=None, tracking_cache=None, shot_columns=None):
+        self.events_source = events
+        self.tracking_source = tracking
+        self.tracking_cache = tracking_cache
+        self.shot_columns = dict(_SHOT_COLUMNS, **(shot_columns or {}))
+
+        self._events = None
+        self._tracking = None
+        self._shots = None
+
+    def __repr__(self):
+        state = []
+        if self.events_source is not None:
+            state.append('events=' + ('loaded' if self._events is not None else 'lazy'))
+        if self.tracking_source is not None:
+            state.append('tracking=' + ('mapped' if self._tracking is not None else 'lazy'))
+        return f"Game({', '.join(state)})"
+
+    @property
+    def events(self):
+        """Event table (pandas.DataFrame), read on first access."""
+        if self._events is None:
+            if self.events_source is None:
+                raise ValueError("Game has no event data")
+            self._events = _read_events(self.events_source)
+        return self._events
+
+    @property
+    def tracking(self):
+        """Tracking records (memory-mapped structured array), opened on first access."""
+        if self._tracking is None:
+            if self.tracking_source is None:
+                raise ValueError("Game has no tracking data")
+            self._tracking = self._open_tracking()
+        return self._tracking
+
+    @property
+    def shots(self):
+        """Events as a ShotTable, ready for TennisCourt plotting methods."""
+        if self._shots is None:
+            events = self.events
+            fields = {field: column for field, column in self.shot_columns.items()
+                      if column in events}
+            if 'x' not in fields or 'y' not in fields:
+                raise ValueError("Event table needs x/y columns (see shot_columns)")
+            self._shots = ShotTable.from_dataframe(
+                events, **{field: fields.get(field) for field in _SHOT_COLUMNS})
+        return self._shots
+
+    def ball_positions(self, dropna=True):
+        """
+        Ball positions from the tracking data as a ShotTable.
+
+        Parameters
+        ----------
+        dropna : bool, default True
+            Drop frames without a ball position (KDE cannot handle NaN).
+            With False the memory-mapped columns are used without copying.
+
+        Returns
+        -------
+        ShotTable
+        """
+        return self.player_positions('ball', dropna=dropna)
+
+    def player_positions(self, player, dropna=True):
+        """
+        Positions of ``player`` ('p1', 'p2' or 'ball') from the tracking data.
+
+        Parameters
+        ----------
+        player : str
+            Prefix of the ``<player>_x`` / ``<player>_y`` tracking columns.
+        dropna : bool, default True
+            Drop frames where the position is missing.
+
+        Returns
+        -------
+        ShotTable
+        """
+        tracking = self.tracking
+        x, y = tracking[f'{player}_x'], tracking[f'{player}_y']
+        if dropna:
+            valid = ~(np.isnan(x) | np.isnan(y))
+            x, y = x[valid], y[valid]
+        return ShotTable(x, y)
+
+    def _open_tracking(self):
+        path = os.fspath(self.tracking_source)
+        if path.endswith('.npy'):
+            return open_rg_tracking(path)
+
+        cache = self.tracking_cache or os.path.splitext(path)[0] + '.npy'
+        if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(path):
+            return open_rg_tracking(cache)
+        return load_rg_tracking(path, out=cache)
+
+
+def _read_events(source):
+    if isinstance(source, pd.DataFrame):
+        return source
+
+    path = os.fspath(source)
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.parquet':
+        return pd.read_parquet(path)
+    if ext == '.feather':
+        return pd.read_feather(path)
+
+    df = pd.read_csv(path)
+    # Event labels repeat heavily; store them as categoricals
+    for col in df.columns:
+        if df[col].dtype == object or pd.api.types.is_string_dtype(df[col]):
+            df[col] = df[col].astype('category')
+    return df
+
+
+def load_game(events=None, tracking=None, **kwargs):
+    """
+    Load a match. Nothing is read until the data is accessed.
+
+    Parameters
+    ----------
+    events : str or pandas.DataFrame, optional
+        Event file or table.
+    tracking : str, optional
+        Tracking file (``.npy`` or raw JSON export).
+    **kwargs : dict
+        Passed to ``Game`` (``tracking_cache``, ``shot_columns``).
+
+    Returns
+    -------
+    Game
+    """
+    return Game(events=events, tracking=tracking, **kwargs)
@@ -0,0 +1,302 @@
+"""
+Reusable Hexbin Aggregation
+
+``HexAggregate`` assigns points to hexagonal cells once (with the same
+lattice as ``matplotlib.axes.Axes.hexbin``) and keeps the per-point cell
+index and per-cell totals. Subsets, sums across matches and differences
+between players are then bincounts or array arithmetic on the totals, and
+plotting draws the stored totals without re-binning the raw points.
+"""
+
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import LogNorm, Normalize
+from matplotlib.transforms import AffineDeltaTransform
+
+
+class HexAggregate:
+    """
+    Points binned onto a fixed hexagonal grid.
+
+    Build one with ``TennisCourt.hex_aggregate`` (court extent and
+    orientation) or ``HexAggregate.from_points`` (plot coordinates).
+
+    Parameters
+    ----------
+    counts : ndarray
+        Total (count or summed weight) per cell.
+    gridsize : int or (int, int)
+        Number of hexagons along x (and y), as for ``Axes.hexbin``.
+    extent : tuple of float
+        ``(xmin, xmax, ymin, ymax)`` in plot coordinates.
+    cells : ndarray of int, optional
+        Cell index per point (-1 outside the grid); needed by ``subset``.
+    weights : ndarray, optional
+        Per-point weights used for ``counts``.
+
+    Examples
+    --------
+    >>> agg = court.hex_aggregate(shots, gridsize=20)
+    >>> court.hexbin(ax, agg, cmap='bsu_green')               # no re-binning
+    >>> court.hexbin(ax, agg.subset(shots.depth_code == 2))   # deep shots
+    >>> season = sum(court.hex_aggregate(m, gridsize=20) for m in matches)
+    >>> court.hexbin(ax, a.frequency() - b.frequency(), cmap='RdBu_r', mincnt=None)
+    """
+
+    def __init__(self, counts, gridsize, extent, cells=None, weights=None):
+        self.counts = np.asarray(counts, dtype=float)
+        self.gridsize = gridsize
+        self.extent = tuple(float(v) for v in extent)
+        self.cells = cells
+        self.weights = weights
+
+        nx, ny = self.shape
+        if len(self.counts) != (nx + 1) * (ny + 1) + nx * ny:
+            raise ValueError(f"counts has {len(self.counts)} cells, expected "
+                             f"{(nx + 1) * (ny + 1) + nx * ny} for gridsize {gridsize}")
+
+    @classmethod
+    def from_points(cls, x, y, gridsize=20, extent=None, weights=None):
+        """
+        Bin points (in plot coordinates) onto the hex grid.
+
+        Parameters
+        ----------
+        x, y : array-like
+            Point coordinates in plot space.
+        gridsize : int or (int, int), default 20
+            Number of hexagons along x (and y).
+        extent : tuple of float, optional
+            ``(xmin, xmax, ymin, ymax)``. Defaults to the data range.
+        weights : array-like, optional
+            Per-point weights; cells then hold summed weights.
+
+        Returns
+        -------
+        HexAggregate
+        """
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if extent is None:
+            extent = (x.min(), x.max(), y.min(), y.max()) if len(x) else (0, 1, 0, 1)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float)
+            if weights.shape != x.shape:
+                raise ValueError(f"weights has shape {weights.shape}, expected {x.shape}")
+
+        agg = cls(np.zeros(_n_cells(gridsize)), gridsize, extent)
+        agg.cells = agg._assign(x, y)
+        agg.weights = weights
+        agg.counts = agg._bincount(agg.cells, weights)
+        return agg
+
+    # -------------------------------------------------------------------------
+    # Geometry
+    # -------------------------------------------------------------------------
+    @property
+    def shape(self):
+        """Hexagons along x and y, ``(nx, ny)``."""
+        return _grid_shape(self.gridsize)
+
+    def _steps(self):
+        # Same padding as Axes.hexbin so cells line up exactly
+        xmin, xmax, ymin, ymax = self.extent
+        padding = 1.e-9 * (xmax - xmin)
+        nx, ny = self.shape
+        return xmin - padding, ymin, (xmax - xmin + 2 * padding) / nx, (ymax - ymin) / ny
+
+    def _assign(self, x, y):
+        """Cell index per point, -1 outside the grid."""
+        nx, ny = self.shape
+        xmin, ymin, sx, sy = self._steps()
+        ix = (x - xmin) / sx
+        iy = (y - ymin) / sy
+        ix1 = np.round(ix).astype(np.int64)
+        iy1 = np.round(iy).astype(np.int64)
+        ix2 = np.floor(ix).astype(np.int64)
+        iy2 = np.floor(iy).astype(np.int64)
+
+        # Two interleaved lattices; each point goes to the nearer center
+        in1 = (ix1 >= 0) & (ix1 <= nx) & (iy1 >= 0) & (iy1 <= ny)
+        in2 = (ix2 >= 0) & (ix2 < nx) & (iy2 >= 0) & (iy2 < ny)
+        d1 = (ix - ix1) ** 2 + 3.0 * (iy - iy1) ** 2
+        d2 = (ix - ix2 - 0.5) ** 2 + 3.0 * (iy - iy2 - 0.5) ** 2
+        first = d1 < d2
+
+        cells = np.where(first,
+                         np.where(in1, ix1 * (ny + 1) + iy1, -1),
+                         np.where(in2, (nx + 1) * (ny + 1) + ix2 * ny + iy2, -1))
+        return cells.astype(np.int32)
+
+    def _bincount(self, cells, weights=None):
+        inside = cells >= 0
+        if weights is not None:
+            weights = weights[inside]
+        return np.bincount(cells[inside], weights=weights,
+                           minlength=len(self.counts)).astype(float)
+
+    def offsets(self):
+        """Cell centers, shape (n_cells, 2)."""
+        nx, ny = self.shape
+        xmin, ymin, sx, sy = self._steps()
+        n1 = (nx + 1) * (ny + 1)
+        centers = np.zeros((len(self.counts), 2))
+        centers[:n1, 0] = np.repeat(np.arange(nx + 1), ny + 1)
+        centers[:n1, 1] = np.tile(np.arange(ny + 1), nx + 1)
+        centers[n1:, 0] = np.repeat(np.arange(nx) + 0.5, ny)
+        centers[n1:, 1] = np.tile(np.arange(ny), nx) + 0.5
+        return centers * (sx, sy) + (xmin, ymin)
+
+    def same_grid(self, other):
+        """True if ``other`` uses the same gridsize and extent."""
+        return self.shape == other.shape and np.allclose(self.extent, other.extent)
+
+    # -------------------------------------------------------------------------
+    # Aggregation
+    # -------------------------------------------------------------------------
+    def __len__(self):
+        return len(self.counts)
+
+    def __repr__(self):
+        return (f"HexAggregate(gridsize={self.gridsize}, extent={self.extent}, "
+                f"total={self.counts.sum():g})")
+
+    def subset(self, mask):
+        """
+        Aggregate of the points selected by ``mask``, without re-binning.
+
+        Parameters
+        ----------
+        mask : array-like of bool or int
+            Selection over the original points (e.g. a ShotTable filter).
+
+        Returns
+        -------
+        HexAggregate
+        """
+        if self.cells is None:
+            raise ValueError("subset needs per-point cells; this aggregate was combined "
+                             "from others or built from totals")
+        cells = self.cells[mask]
+        weights = None if self.weights is None else self.weights[mask]
+        return HexAggregate(self._bincount(cells, weights), self.gridsize, self.extent,
+                            cells=cells, weights=weights)
+
+    def frequency(self):
+        """Totals as a percentage of the grand total (for comparing volumes)."""
+        total = self.counts.sum()
+        counts = self.counts / total * 100 if total else self.counts.copy()
+        return HexAggregate(counts, self.gridsize, self.extent)
+
+    @classmethod
+    def sum(cls, aggregates):
+        """Cell-wise sum of aggregates on the same grid (e.g. across matches)."""
+        aggregates = list(aggregates)
+        if not aggregates:
+            raise ValueError("No aggregates to sum")
+        total = aggregates[0]
+        for agg in aggregates[1:]:
+            total = total + agg
+        return total
+
+    def _combine(self, other, op):
+        if not isinstance(other, HexAggregate):
+            return NotImplemented
+        if not self.same_grid(other):
+            raise ValueError("HexAggregates must share gridsize and extent")
+        return HexAggregate(op(self.counts, other.counts), self.gridsize, self.extent)
+
+    def __add__(self, other):
+        # 0 + agg lets the builtin sum() work
+        if isinstance(other, (int, float)) and other == 0:
+            return self
+        return self._combine(other, np.add)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._combine(other, np.subtract)
+
+    # -------------------------------------------------------------------------
+    # Plotting
+    # -------------------------------------------------------------------------
+    def plot(self, ax, cmap='Blues', edgecolors='white', mincnt=1, norm=None, vmin=None,
+             vmax=None, bins=None, linewidths=None, **kwargs):
+        """
+        Draw the aggregate as hexagons (like ``Axes.hexbin``).
+
+        Parameters
+        ----------
+        ax : matplotlib.axes.Axes
+            The axes to draw on.
+        cmap : str or Colormap, default 'Blues'
+            Colormap.
+        edgecolors : color, default 'white'
+            Hexagon edge color.
+        mincnt : float or None, default 1
+            Only draw cells with ``|total| >= mincnt``; None draws every cell.
+        norm : Normalize, optional
+            Color normalization. Aggregates with negative cells (differences)
+            default to a scale centered on zero.
+        vmin, vmax : float, optional
+            Color limits.
+        bins : 'log', optional
+            Log color scale.
+        linewidths : float, optional
+            Edge width. Defaults to ``rcParams['patch.linewidth']``.
+        **kwargs : dict
+            Additional PolyCollection properties (e.g. ``alpha``, ``zorder``).
+
+        Returns
+        -------
+        matplotlib.collections.PolyCollection
+        """
+        import matplotlib as mpl
+
+        counts = self.counts
+        shown = np.ones(len(counts), dtype=bool) if mincnt is None else np.abs(counts) >= mincnt
+        counts = counts[shown]
+
+        _, _, sx, sy = self._steps()
+        polygon = [sx, sy / 3] * np.array(
+            [[.5, -.5], [.5, .5], [0., 1.], [-.5, .5], [-.5, -.5], [0., -1.]])
+
+        if bins == 'log':
+            norm = norm or LogNorm(vmin=vmin, vmax=vmax)
+            vmin = vmax = None
+        elif bins is not None:
+            raise ValueError(f"bins must be None or 'log', got {bins!r}")
+        elif norm is None and vmin is None and vmax is None and len(counts) and counts.min() < 0:
+            limit = np.abs(counts).max()
+            norm = Normalize(-limit, limit)
+
+        collection = PolyCollection(
+            [polygon],
+            edgecolors=edgecolors,
+            linewidths=linewidths if linewidths is not None else [mpl.rcParams['patch.linewidth']],
+            offsets=self.offsets()[shown],
+            offset_transform=AffineDeltaTransform(ax.transData),
+            cmap=cmap, norm=norm, **kwargs)
+        collection.set_array(counts)
+        if vmin is not None or vmax is not None:
+            collection.set_clim(vmin, vmax)
+
+        xmin, xmax, ymin, ymax = self.extent
+        ax.update_datalim(((xmin, ymin), (xmax, ymax)))
+        ax.autoscale_view(tight=True)
+        ax.add_collection(collection, autolim=False)
+        return collection
+
+
+def _grid_shape(gridsize):
+    if np.iterable(gridsize):
+        nx, ny = gridsize
+    else:
+        nx = gridsize
+        ny = int(nx / np.sqrt(3))
+    return int(nx), int(ny)
+
+
+def _n_cells(gridsize):
+    nx, ny = _grid_shape(gridsize)
+    return (nx + 1) * (ny + 1) + nx * ny
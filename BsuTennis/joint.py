@@ -3,25 +3,58 @@ Joint Plot with Marginal Distributions for Tennis Court
 Inspired by mplsoccer's joint plot with marginal axes flush to pitch boundaries
 """
 
+import warnings
+
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
 import numpy as np
-from scipy import stats
 from .pitch import TennisCourt
+from .shots import as_plot_xy
+from .kde import joint_density
+
+# Density grid nodes along each court axis
+_DENSITY_GRID = 100
 
 
-def joint_plot(x1, y1, x2=None, y2=None, kind='kde', half=False, 
+def joint_plot(x1, y1=None, x2=None, y2=None, kind='kde', half=False, 
                color1='#92e3da', color2='#9b59b6', 
                label1='Player A', label2='Player B',
-               theme='bsu', figsize=None, grid_bins=(6, 3), **kwargs):
+               theme='bsu', figsize=None, grid_bins=(6, 3), method='exact', cache=True, **kwargs):
     """
     Create a joint plot with marginal distributions for tennis court.
+    
+    ``x1`` / ``x2`` may be ShotTables (with ``y1`` / ``y2`` omitted).
+    ``method`` selects the KDE backend for the surface and marginals:
+    'exact' or 'binned' (FFT, for large samples; see ``BsuTennis.kde``).
+    
+    Each player's density is evaluated once on the court grid; the
+    marginals are that surface integrated across the court. With
+    ``cache=True`` results are memoized by the shot data and parameters,
+    so redrawing the same shots with other colors, labels or ``kind``
+    skips the KDE entirely (``BsuTennis.kde.clear_density_cache`` empties it).
     """
     
     # Smart orientation: Vertical for half court, Horizontal for full court
     orientation = 'vertical' if half else 'horizontal'
     court = TennisCourt(orientation=orientation, half=half, theme=theme)
     
+    plot_x1, plot_y1 = as_plot_xy(x1, y1, orientation)
+    if x2 is not None:
+        plot_x2, plot_y2 = as_plot_xy(x2, y2, orientation)
+    
+    # One density grid per player (court width x length in plot space) feeds
+    # both the surface and the marginals
+    if half:
+        xgrid = np.linspace(court.x_min, court.x_max, _DENSITY_GRID)
+        ygrid = np.linspace(court.y_min, court.y_max, _DENSITY_GRID)
+    else:
+        xgrid = np.linspace(court.y_min, court.y_max, _DENSITY_GRID)
+        ygrid = np.linspace(court.x_min, court.x_max, _DENSITY_GRID)
+    density1 = _player_density(plot_x1, plot_y1, xgrid, ygrid, method, cache, label1)
+    density2 = None
+    if x2 is not None:
+        density2 = _player_density(plot_x2, plot_y2, xgrid, ygrid, method, cache, label2)
+    
     if half:
         # Vertical Half Court Layout
         if figsize is None:
@@ -44,21 +77,11 @@ def joint_plot(x1, y1, x2=None, y2=None, kind='kde', half=False,
         # Draw vertical court
         court.draw(ax=ax_court)
         
-        # For vertical court: x=width, y=length. No swap needed.
-        plot_x1, plot_y1 = np.array(x1), np.array(y1)
-        if x2 is not None:
-            plot_x2, plot_y2 = np.array(x2), np.array(y2)
-            
         # Draw Marginals
-        # Top: Width distribution (x-axis)
-        _draw_marginal_top(ax_top, plot_x1, color1, court, alpha=0.4, vertical=True)
-        if x2 is not None:
-             _draw_marginal_top(ax_top, plot_x2, color2, court, alpha=0.4, vertical=True)
-             
-        # Right: Length distribution (y-axis)
-        _draw_marginal_right(ax_right, plot_y1, color1, court, alpha=0.4, vertical=True)
-        if x2 is not None:
-            _draw_marginal_right(ax_right, plot_y2, color2, court, alpha=0.4, vertical=True)
+        # Top: Width distribution (x-axis); Right: Length distribution (y-axis)
+        for density, color in ((density1, color1), (density2, color2)):
+            _draw_marginal_top(ax_top, density, color, alpha=0.4)
+            _draw_marginal_right(ax_right, density, color, alpha=0.4)
             
         # Style Marginals
         ax_top.set_xlim(court.x_min, court.x_max)
@@ -86,18 +109,11 @@ def joint_plot(x1, y1, x2=None, y2=None, kind='kde', half=False,
         
         court.draw(ax=ax_court)
         
-        # Horizontal: Swap x/y -> plot_x=y, plot_y=x
-        plot_x1, plot_y1 = np.array(y1), np.array(x1)
-        if x2 is not None:
-            plot_x2, plot_y2 = np.array(y2), np.array(x2)
-            
-        # Draw Marginals
-        _draw_marginal_top(ax_top, plot_x1, color1, court, alpha=0.4, vertical=False)
-        if x2 is not None:
-            _draw_marginal_top(ax_top, plot_x2, color2, court, alpha=0.4, vertical=False)
-            
-        _draw_marginal_left(ax_left, plot_y2 if x2 is not None else [], color2, court, alpha=0.4, vertical=False)
-        _draw_marginal_right(ax_right, plot_y1, color1, court, alpha=0.4, vertical=False)
+        # Draw Marginals (Player B on the left, Player A on the right)
+        _draw_marginal_top(ax_top, density1, color1, alpha=0.4)
+        _draw_marginal_top(ax_top, density2, color2, alpha=0.4)
+        _draw_marginal_left(ax_left, density2, color2, alpha=0.4)
+        _draw_marginal_right(ax_right, density1, color1, alpha=0.4)
 
         ax_top.set_xlim(court.y_min, court.y_max)
         ax_top.axis('off')
@@ -118,30 +134,10 @@ def joint_plot(x1, y1, x2=None, y2=None, kind='kde', half=False,
                             edgecolors='white', linewidths=0.5, label=label2)
     
     elif kind == 'kde':
-        if len(plot_x1) > 2:
-            try:
-                kde1 = stats.gaussian_kde([plot_x1, plot_y1])
-                # Grid range based on orientation
-                if half:
-                    xgrid = np.linspace(court.x_min, court.x_max, 100)
-                    ygrid = np.linspace(court.y_min, court.y_max, 100)
-                else:
-                    xgrid = np.linspace(court.y_min, court.y_max, 100)
-                    ygrid = np.linspace(court.x_min, court.x_max, 100)
-                    
-                X, Y = np.meshgrid(xgrid, ygrid)
-                Z1 = kde1([X.ravel(), Y.ravel()]).reshape(X.shape)
-                ax_court.contourf(X, Y, Z1, levels=50, cmap=_create_cmap(color1), alpha=0.6)
-            except:
-                pass
-                
-        if x2 is not None and len(plot_x2) > 2:
-            try:
-                kde2 = stats.gaussian_kde([plot_x2, plot_y2])
-                Z2 = kde2([X.ravel(), Y.ravel()]).reshape(X.shape)
-                ax_court.contourf(X, Y, Z2, levels=50, cmap=_create_cmap(color2), alpha=0.6)
-            except:
-                pass
+        for density, color in ((density1, color1), (density2, color2)):
+            if density is not None:
+                ax_court.contourf(density.xgrid, density.ygrid, density.density.T,
+                                  levels=50, cmap=_create_cmap(color), alpha=0.6)
 
     elif kind == 'grid':
         y_bins, x_bins = grid_bins
@@ -194,41 +190,22 @@ def _create_cmap(color):
     from matplotlib.colors import LinearSegmentedColormap
     return LinearSegmentedColormap.from_list("custom", ['#ffffff', color], N=100)
 
-def _draw_marginal_top(ax, x_data, color, court, alpha=0.4, vertical=False):
-    if len(x_data) < 2: return
-    try:
-        kde = stats.gaussian_kde(x_data)
-        if vertical:
-            x_grid = np.linspace(court.x_min, court.x_max, 200)
-        else:
-            x_grid = np.linspace(court.y_min, court.y_max, 200)
-        density = kde(x_grid)
-        ax.fill_between(x_grid, 0, density, color=color, alpha=alpha, linewidth=0)
-        ax.plot(x_grid, density, color=color, linewidth=1, alpha=0.8)
-    except: pass
-
-def _draw_marginal_left(ax, y_data, color, court, alpha=0.4, vertical=False):
-    if len(y_data) < 2: return
+def _player_density(x, y, xgrid, ygrid, method, cache, label):
     try:
-        kde = stats.gaussian_kde(y_data)
-        if vertical: # usually only right marginal for vertical half court
-             y_grid = np.linspace(court.y_min, court.y_max, 200)
-        else:
-             y_grid = np.linspace(court.x_min, court.x_max, 200)
-        density = kde(y_grid)
-        ax.fill_betweenx(y_grid, 0, density, color=color, alpha=alpha, linewidth=0)
-        ax.plot(density, y_grid, color=color, linewidth=1, alpha=0.8)
-    except: pass
-
-def _draw_marginal_right(ax, y_data, color, court, alpha=0.4, vertical=False):
-    if len(y_data) < 2: return
-    try:
-        kde = stats.gaussian_kde(y_data)
-        if vertical:
-             y_grid = np.linspace(court.y_min, court.y_max, 200)
-        else:
-             y_grid = np.linspace(court.x_min, court.x_max, 200)
-        density = kde(y_grid)
-        ax.fill_betweenx(y_grid, 0, density, color=color, alpha=alpha, linewidth=0)
-        ax.plot(density, y_grid, color=color, linewidth=1, alpha=0.8)
-    except: pass
+        return joint_density(x, y, xgrid, ygrid, method=method, cache=cache)
+    except np.linalg.LinAlgError:
+        warnings.warn(f"{label}: shots lie on a line, density not drawn")
+        return None
+
+def _draw_marginal_top(ax, density, color, alpha=0.4):
+    if density is None: return
+    ax.fill_between(density.xgrid, 0, density.marginal_x, color=color, alpha=alpha, linewidth=0)
+    ax.plot(density.xgrid, density.marginal_x, color=color, linewidth=1, alpha=0.8)
+
+def _draw_marginal_left(ax, density, color, alpha=0.4):
+    if density is None: return
+    ax.fill_betweenx(density.ygrid, 0, density.marginal_y, color=color, alpha=alpha, linewidth=0)
+    ax.plot(density.marginal_y, density.ygrid, color=color, linewidth=1, alpha=0.8)
+
+# Drawn the same way; the left axis is inverted by the caller
+_draw_marginal_right = _draw_marginal_left
@@ -0,0 +1,280 @@
+"""
+Kernel Density Estimation Backends
+
+Two ways to evaluate a Gaussian KDE on a regular grid:
+
+- 'exact': ``scipy.stats.gaussian_kde`` evaluated at every grid node,
+  O(N x grid nodes).
+- 'binned': points are linearly binned onto the grid and convolved with the
+  Gaussian kernel via FFT, O(N + grid log grid). Uses the same bandwidth
+  (Scott/Silverman rule, full covariance) as 'exact'.
+
+Binned results match 'exact' to within 1% of the peak density (typically
+~0.1% on the default 200x200 court grid) when the kernel bandwidth spans at
+least ~2 grid cells along each axis; the error shrinks quadratically with
+the grid spacing. Below that (tight clusters on a coarse grid) 'binned'
+falls back to exact evaluation.
+
+``joint_density`` evaluates the 2-D surface once, derives both marginals
+by integrating it, and memoizes the result by data fingerprint and
+parameters (bounded LRU), so repeated figures of the same shots only pay
+for drawing.
+"""
+
+import hashlib
+import itertools
+from collections import OrderedDict
+
+import numpy as np
+from scipy.integrate import trapezoid
+from scipy.signal import fftconvolve
+from scipy.stats import gaussian_kde
+
+KDE_METHODS = ('exact', 'binned')
+
+# Kernel support in standard deviations; mass beyond this is < 1e-4
+_KERNEL_SIGMAS = 4
+
+# Smallest bandwidth, in grid cells, for which binning stays within 1%
+_MIN_BANDWIDTH_CELLS = 2
+
+
+def binned_kde(data, grids, bw_method=None, weights=None):
+    """
+    Gaussian KDE on a regular grid via linear binning and FFT convolution.
+
+    Parameters
+    ----------
+    data : array-like, shape (d, n) or (n,)
+        Sample points (d = 1 or 2).
+    grids : list of array-like
+        One evenly spaced grid per dimension.
+    bw_method : str, scalar or callable, optional
+        Bandwidth rule, as for ``scipy.stats.gaussian_kde``.
+    weights : array-like, optional
+        Per-point weights.
+
+    Returns
+    -------
+    ndarray
+        Density with shape ``tuple(len(g) for g in grids)`` ('ij' indexing).
+
+    Notes
+    -----
+    If the bandwidth spans fewer than 2 grid cells along any axis, the
+    binning error is no longer bounded and the KDE is evaluated exactly at
+    the grid nodes instead.
+    """
+    data = np.atleast_2d(np.asarray(data, dtype=float))
+    grids = [np.asarray(g, dtype=float) for g in grids]
+    d = len(grids)
+    if data.shape[0] != d:
+        raise ValueError(f"data has {data.shape[0]} dimensions but {d} grids were given")
+
+    # Bandwidth only (no evaluation): identical to the exact backend
+    kde = gaussian_kde(data, bw_method=bw_method, weights=weights)
+    cov = np.atleast_2d(kde.covariance)
+
+    steps = [g[1] - g[0] for g in grids]
+    sigmas = np.sqrt(np.diag(cov))
+    if any(s < _MIN_BANDWIDTH_CELLS * st for s, st in zip(sigmas, steps)):
+        nodes = np.meshgrid(*grids, indexing='ij')
+        return kde(np.vstack([n.ravel() for n in nodes])).reshape(nodes[0].shape)
+    pads = [int(np.ceil(_KERNEL_SIGMAS * s / st)) for s, st in zip(sigmas, steps)]
+
+    # Linear binning onto the grid extended by the kernel support, so points
+    # just outside the grid still contribute
+    shape = tuple(len(g) + 2 * p for g, p in zip(grids, pads))
+    frac = [(data[k] - (grids[k][0] - pads[k] * steps[k])) / steps[k] for k in range(d)]
+    base = [np.floor(f).astype(np.int64) for f in frac]
+    rem = [f - b for f, b in zip(frac, base)]
+
+    counts = np.zeros(int(np.prod(shape)))
+    for corner in itertools.product((0, 1), repeat=d):
+        idx = [b + c for b, c in zip(base, corner)]
+        wt = kde.weights.copy()
+        for r, c in zip(rem, corner):
+            wt *= r if c else 1 - r
+        valid = np.ones(data.shape[1], dtype=bool)
+        for i, n in zip(idx, shape):
+            valid &= (i >= 0) & (i < n)
+        flat = np.ravel_multi_index([i[valid] for i in idx], shape)
+        counts += np.bincount(flat, weights=wt[valid], minlength=counts.size)
+    counts = counts.reshape(shape)
+
+    # Kernel sampled on grid offsets
+    offsets = np.meshgrid(*[np.arange(-p, p + 1) * st for p, st in zip(pads, steps)], indexing='ij')
+    pts = np.stack([o.ravel() for o in offsets])
+    inv_cov = np.linalg.inv(cov)
+    norm = np.sqrt((2 * np.pi) ** d * np.linalg.det(cov))
+    kernel = np.exp(-0.5 * np.sum(pts * (inv_cov @ pts), axis=0)) / norm
+    kernel = kernel.reshape(offsets[0].shape)
+
+    density = fftconvolve(counts, kernel, mode='same')
+    inner = tuple(slice(p, p + len(g)) for p, g in zip(pads, grids))
+    return np.clip(density[inner], 0, None)
+
+
+def density_2d(x, y, xgrid, ygrid, method='exact', bw_method=None, weights=None):
+    """
+    Evaluate a 2-D Gaussian KDE on the grid ``xgrid`` x ``ygrid``.
+
+    Parameters
+    ----------
+    x, y : array-like
+        Sample coordinates.
+    xgrid, ygrid : array-like
+        Evenly spaced grid coordinates.
+    method : str, default 'exact'
+        'exact' or 'binned' (see module docstring).
+    bw_method : str, scalar or callable, optional
+        Bandwidth rule, as for ``scipy.stats.gaussian_kde``.
+    weights : array-like, optional
+        Per-point weights.
+
+    Returns
+    -------
+    ndarray, shape (len(xgrid), len(ygrid))
+        Density, ``f[i, j]`` at ``(xgrid[i], ygrid[j])``.
+    """
+    values = np.vstack([x, y])
+    if method == 'binned':
+        return binned_kde(values, [xgrid, ygrid], bw_method=bw_method, weights=weights)
+    if method != 'exact':
+        raise ValueError(f"method must be one of {KDE_METHODS}, got {method!r}")
+
+    xx, yy = np.meshgrid(xgrid, ygrid, indexing='ij')
+    kernel = gaussian_kde(values, bw_method=bw_method, weights=weights)
+    return kernel(np.vstack([xx.ravel(), yy.ravel()])).reshape(xx.shape)
+
+
+def density_1d(x, grid, method='exact', bw_method=None, weights=None):
+    """
+    Evaluate a 1-D Gaussian KDE on ``grid``.
+
+    Parameters
+    ----------
+    x : array-like
+        Sample values.
+    grid : array-like
+        Evenly spaced evaluation points.
+    method, bw_method, weights
+        See ``density_2d``.
+
+    Returns
+    -------
+    ndarray, shape (len(grid),)
+    """
+    if method == 'binned':
+        return binned_kde(x, [grid], bw_method=bw_method, weights=weights)
+    if method != 'exact':
+        raise ValueError(f"method must be one of {KDE_METHODS}, got {method!r}")
+    return gaussian_kde(x, bw_method=bw_method, weights=weights)(grid)
+
+
+class JointDensity:
+    """
+    2-D density on a grid plus its marginals along each axis.
+
+    Arrays are read-only, since instances are shared through the cache.
+
+    Attributes
+    ----------
+    xgrid, ygrid : ndarray
+        Grid coordinates.
+    density : ndarray, shape (len(xgrid), len(ygrid))
+        ``f[i, j]`` at ``(xgrid[i], ygrid[j])``.
+    marginal_x, marginal_y : ndarray
+        ``density`` integrated over y (resp. x) across the grid.
+    """
+
+    def __init__(self, xgrid, ygrid, density):
+        self.xgrid = _frozen(xgrid)
+        self.ygrid = _frozen(ygrid)
+        self.density = _frozen(density)
+        self.marginal_x = _frozen(trapezoid(density, self.ygrid, axis=1))
+        self.marginal_y = _frozen(trapezoid(density, self.xgrid, axis=0))
+
+    def __repr__(self):
+        return f"JointDensity(grid={len(self.xgrid)}x{len(self.ygrid)})"
+
+
+# Joint densities keyed by data fingerprint and grid/KDE parameters (LRU)
+_DENSITY_CACHE = OrderedDict()
+_DENSITY_CACHE_SIZE = 32
+
+
+def clear_density_cache():
+    """Drop all memoized joint densities."""
+    _DENSITY_CACHE.clear()
+
+
+def data_fingerprint(*arrays):
+    """Content hash of ``arrays`` (values as float64, plus shapes)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for values in arrays:
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        digest.update(str(values.shape).encode())
+        digest.update(values.data)
+    return digest.hexdigest()
+
+
+def joint_density(x, y, xgrid, ygrid, method='exact', bw_method=None, cache=True):
+    """
+    2-D KDE on a grid and its marginals, memoized.
+
+    Parameters
+    ----------
+    x, y : array-like
+        Sample coordinates.
+    xgrid, ygrid : array-like
+        Evenly spaced grid coordinates.
+    method : str, default 'exact'
+        'exact' or 'binned' (see module docstring).
+    bw_method : str or scalar, optional
+        Bandwidth rule, as for ``scipy.stats.gaussian_kde``. Callables are
+        evaluated but not cached.
+    cache : bool, default True
+        Look up and store the result in the density cache.
+
+    Returns
+    -------
+    JointDensity or None
+        None when there are fewer than 3 points (no 2-D bandwidth).
+
+    Raises
+    ------
+    numpy.linalg.LinAlgError
+        If the points are degenerate (e.g. all on one line).
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) < 3:
+        return None
+    if method not in KDE_METHODS:
+        raise ValueError(f"method must be one of {KDE_METHODS}, got {method!r}")
+    xgrid = np.asarray(xgrid, dtype=float)
+    ygrid = np.asarray(ygrid, dtype=float)
+
+    cache = cache and not callable(bw_method)
+    if cache:
+        key = (data_fingerprint(x, y),
+               (xgrid[0], xgrid[-1], len(xgrid)), (ygrid[0], ygrid[-1], len(ygrid)),
+               method, bw_method)
+        if key in _DENSITY_CACHE:
+            _DENSITY_CACHE.move_to_end(key)
+            return _DENSITY_CACHE[key]
+
+    result = JointDensity(xgrid, ygrid,
+                          density_2d(x, y, xgrid, ygrid, method=method, bw_method=bw_method))
+    if cache:
+        _DENSITY_CACHE[key] = result
+        if len(_DENSITY_CACHE) > _DENSITY_CACHE_SIZE:
+            _DENSITY_CACHE.popitem(last=False)
+    return result
+
+
+def _frozen(values):
+    values = np.array(values, dtype=float)
+    values.flags.writeable = False
+    return values
@@ -0,0 +1,236 @@
+"""
+Live Match View
+
+``LiveCourt`` keeps a court on screen during a match and adds bounces as
+points are played. The court is rendered once and saved as a background
+bitmap; each update restores that bitmap and redraws only the dynamic
+artists (latest shots and an optional rolling heatmap) with blitting.
+Shots that leave the recent trail are drawn into the saved background
+once, so the cost of an update does not grow with the number of shots.
+"""
+
+from collections import deque
+
+import numpy as np
+
+from .shots import as_plot_xy
+
+# Default marker styles (ax.scatter keyword arguments)
+LIVE_STYLES = {
+    'history': {'s': 12, 'c': '#ffffff', 'alpha': 0.5, 'edgecolors': 'none'},
+    'trail': {'s': 30, 'c': '#ffd166', 'alpha': 0.9, 'edgecolors': 'none'},
+    'latest': {'s': 140, 'facecolors': 'none', 'edgecolors': '#ef476f', 'linewidths': 2},
+}
+
+
+class LiveCourt:
+    """
+    Blitted live view of shots on a court.
+
+    Parameters
+    ----------
+    court : TennisCourt
+        Court whose geometry and style are used.
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. Defaults to the current axes.
+    trail : int, default 10
+        Number of most recent shots drawn with the 'trail' style. Older
+        shots are merged into the static background.
+    heatmap : bool, default False
+        Show a rolling heatmap of the last ``window`` shots.
+    window : int, default 200
+        Number of shots in the rolling heatmap.
+    bins : (int, int), default (8, 16)
+        Heatmap cells along the court width and length.
+    styles : dict, optional
+        Overrides for ``LIVE_STYLES`` ('history', 'trail', 'latest').
+    heatmap_kws : dict, optional
+        Passed to ``ax.pcolormesh`` for the heatmap (defaults: cmap='Reds', alpha=0.45).
+    draw : bool, default True
+        Draw the court on ``ax`` first. Use False if it is already drawn.
+
+    Examples
+    --------
+    >>> fig, ax = plt.subplots()
+    >>> live = court.live(ax, heatmap=True)
+    >>> plt.show(block=False)
+    >>> for x, y in bounce_feed():
+    ...     live.add(x, y)          # redraws only the dynamic layer
+    """
+
+    def __init__(self, court, ax=None, trail=10, heatmap=False, window=200, bins=(8, 16),
+                 styles=None, heatmap_kws=None, draw=True):
+        import matplotlib.pyplot as plt
+
+        self.court = court
+        self.ax = ax if ax is not None else plt.gca()
+        self.canvas = self.ax.figure.canvas
+        if not self.canvas.supports_blit:
+            raise ValueError(f"{type(self.canvas).__name__} does not support blitting; "
+                             "use an interactive backend such as TkAgg or QtAgg")
+        self.trail = trail
+        self.window = window
+
+        if draw:
+            court.draw(self.ax)
+
+        styles = {name: dict(style, **(styles or {}).get(name, {}))
+                  for name, style in LIVE_STYLES.items()}
+        empty = np.empty((0, 2))
+        # zorder 3 keeps shots above the court lines
+        self._history = self.ax.scatter(empty[:, 0], empty[:, 1], animated=True, zorder=3,
+                                        **styles['history'])
+        self._settling = self.ax.scatter(empty[:, 0], empty[:, 1], animated=True, zorder=3,
+                                         **styles['history'])
+        self._trail = self.ax.scatter(empty[:, 0], empty[:, 1], animated=True, zorder=3,
+                                      **styles['trail'])
+        self._latest = self.ax.scatter(empty[:, 0], empty[:, 1], animated=True, zorder=3,
+                                       **styles['latest'])
+
+        # All shots in plot coordinates; grown by doubling
+        self._points = np.empty((1024, 2))
+        self._n = 0
+        self._n_settled = 0
+
+        self._mesh = None
+        if heatmap:
+            self._init_heatmap(bins, heatmap_kws or {})
+
+        self._background = None
+        self._cid = self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.draw()
+
+    def __len__(self):
+        return self._n
+
+    def __repr__(self):
+        return f"LiveCourt(shots={self._n}, trail={self.trail}, heatmap={self._mesh is not None})"
+
+    @property
+    def points(self):
+        """All shots so far, in plot coordinates (view, shape (n, 2))."""
+        return self._points[:self._n]
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+    def add(self, x, y=None):
+        """
+        Add one or more shots and refresh the display.
+
+        Parameters
+        ----------
+        x, y : float, array-like or ShotTable
+            Bounce location(s) in standard vertical court coords, or a
+            ShotTable passed as ``x``.
+        """
+        px, py = as_plot_xy(x, y, self.court.orientation)
+        new = np.column_stack([np.atleast_1d(px), np.atleast_1d(py)]).astype(float)
+        if not len(new):
+            return
+
+        if self._n + len(new) > len(self._points):
+            grown = np.empty((max(2 * len(self._points), self._n + len(new)), 2))
+            grown[:self._n] = self._points[:self._n]
+            self._points = grown
+        self._points[self._n:self._n + len(new)] = new
+        self._n += len(new)
+
+        if self._mesh is not None:
+            self._update_heatmap(new)
+        self.refresh()
+
+    def reset(self):
+        """Remove all shots (the court itself stays)."""
+        self._n = 0
+        self._n_settled = 0
+        if self._mesh is not None:
+            self._cells.clear()
+            self._counts[:] = 0
+            self._mesh.set_array(np.ma.masked_equal(self._counts, 0))
+        self.canvas.draw()
+
+    def refresh(self):
+        """Redraw the dynamic layer over the saved background."""
+        if self._background is None:
+            self.canvas.draw()
+            return
+
+        # Shots leaving the trail are drawn into the background once
+        settle_to = max(self._n - self.trail, 0)
+        if settle_to > self._n_settled:
+            self.canvas.restore_region(self._background)
+            self._settling.set_offsets(self._points[self._n_settled:settle_to])
+            self.ax.draw_artist(self._settling)
+            self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+            self._n_settled = settle_to
+
+        self.canvas.restore_region(self._background)
+        if self._mesh is not None:
+            self.ax.draw_artist(self._mesh)
+        self._trail.set_offsets(self._points[self._n_settled:self._n])
+        self._latest.set_offsets(self._points[max(self._n - 1, 0):self._n])
+        self.ax.draw_artist(self._trail)
+        self.ax.draw_artist(self._latest)
+        self.canvas.blit(self.ax.bbox)
+        self.canvas.flush_events()
+
+    def _on_draw(self, event):
+        # A full redraw (first show, resize) excludes animated artists:
+        # rebuild the background with every settled shot
+        if event is not None and event.canvas is not self.canvas:
+            return
+        self._history.set_offsets(self._points[:self._n_settled])
+        self.ax.draw_artist(self._history)
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        if self._n:
+            self.refresh()
+
+    def disconnect(self):
+        """Stop listening to canvas redraws."""
+        self.canvas.mpl_disconnect(self._cid)
+
+    # -------------------------------------------------------------------------
+    # Rolling heatmap
+    # -------------------------------------------------------------------------
+    def _init_heatmap(self, bins, heatmap_kws):
+        extent = self.court._get_extent(None)
+        n_width, n_length = bins
+        if self.court.orientation == 'horizontal':
+            self._bins = (n_length, n_width)
+        else:
+            self._bins = (n_width, n_length)
+        self._extent = extent
+        self._counts = np.zeros(self._bins[::-1])  # (rows=y, cols=x)
+        self._cells = deque()
+
+        heatmap_kws = dict(heatmap_kws)
+        heatmap_kws.setdefault('cmap', 'Reds')
+        heatmap_kws.setdefault('alpha', 0.45)
+        heatmap_kws.setdefault('zorder', 1)
+        # A QuadMesh redraws far faster than a resampled image
+        xmin, xmax, ymin, ymax = extent
+        self._mesh = self.ax.pcolormesh(np.linspace(xmin, xmax, self._bins[0] + 1),
+                                        np.linspace(ymin, ymax, self._bins[1] + 1),
+                                        np.ma.masked_equal(self._counts, 0),
+                                        animated=True, **heatmap_kws)
+
+    def _update_heatmap(self, new):
+        nx, ny = self._bins
+        xmin, xmax, ymin, ymax = self._extent
+        ix = np.floor((new[:, 0] - xmin) / (xmax - xmin) * nx).astype(np.int64)
+        iy = np.floor((new[:, 1] - ymin) / (ymax - ymin) * ny).astype(np.int64)
+        cells = np.where((ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny), iy * nx + ix, -1)
+
+        flat = self._counts.reshape(-1)
+        for cell in cells:
+            self._cells.append(cell)
+            if cell >= 0:
+                flat[cell] += 1
+        while len(self._cells) > self.window:
+            cell = self._cells.popleft()
+            if cell >= 0:
+                flat[cell] -= 1
+
+        self._mesh.set_array(np.ma.masked_equal(self._counts, 0))
+        self._mesh.set_clim(0, max(self._counts.max(), 1))
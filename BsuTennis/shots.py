@@ -0,0 +1,227 @@
+"""
+Columnar Shot Container
+
+``ShotTable`` stores shot data as a struct of arrays (float32 coordinates,
+categorical labels) so one season of shots can be handed to many plotting
+functions without converting ``x``/``y`` lists on every call.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .stats import classify_shot_depth
+
+
+class ShotTable:
+    """
+    Struct-of-arrays container for shot data.
+
+    Coordinates are in the standard vertical court system used by
+    ``TennisCourt`` (centered, net at y=0, x across the width).
+
+    Parameters
+    ----------
+    x, y : array-like
+        Shot landing (or contact) coordinates. Stored as float32; float32
+        arrays are kept without copying.
+    x_end, y_end : array-like, optional
+        Shot end coordinates (used for angles, arrows and sonars).
+    shot_type : array-like, optional
+        Shot type labels (e.g. 'fh', 'bh', 'serve'). Stored as a pandas Categorical.
+    outcome : array-like, optional
+        Outcome labels (e.g. 'winner_fh', 'ue'). Stored as a pandas Categorical.
+    **columns : array-like
+        Additional per-shot columns (e.g. speed, point_won), stored as arrays.
+
+    Examples
+    --------
+    >>> shots = ShotTable.from_dataframe(df, x='x', y='y', outcome='event')
+    >>> court.scatter(ax, shots)
+    >>> court.heatmap(ax2, shots[shots.depth_code == 2])
+    """
+
+    def __init__(self, x, y, x_end=None, y_end=None, shot_type=None, outcome=None, **columns):
+        self.x = np.asarray(x, dtype=np.float32)
+        self.y = np.asarray(y, dtype=np.float32)
+        if self.x.shape != self.y.shape or self.x.ndim != 1:
+            raise ValueError("x and y must be 1-D arrays of the same length")
+
+        n = len(self.x)
+        self.x_end = None if x_end is None else self._coord(x_end, n, 'x_end')
+        self.y_end = None if y_end is None else self._coord(y_end, n, 'y_end')
+        self.shot_type = None if shot_type is None else self._categorical(shot_type, n, 'shot_type')
+        self.outcome = None if outcome is None else self._categorical(outcome, n, 'outcome')
+
+        self.columns = {}
+        for name, values in columns.items():
+            values = np.asarray(values)
+            if len(values) != n:
+                raise ValueError(f"Column '{name}' has length {len(values)}, expected {n}")
+            self.columns[name] = values
+
+        # Derived columns, computed on first access
+        self._cache = {}
+
+    @staticmethod
+    def _coord(values, n, name):
+        values = np.asarray(values, dtype=np.float32)
+        if values.shape != (n,):
+            raise ValueError(f"'{name}' must have length {n}")
+        return values
+
+    @staticmethod
+    def _categorical(values, n, name):
+        if not isinstance(values, pd.Categorical):
+            values = pd.Categorical(values)
+        if len(values) != n:
+            raise ValueError(f"'{name}' must have length {n}")
+        return values
+
+    @classmethod
+    def from_dataframe(cls, df, x='x', y='y', x_end=None, y_end=None,
+                       shot_type=None, outcome=None, columns=None):
+        """
+        Build a ShotTable from DataFrame columns.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Source data.
+        x, y, x_end, y_end, shot_type, outcome : str, optional
+            Column names for each field (None to skip).
+        columns : list of str, optional
+            Extra columns to carry along.
+        """
+        def col(name):
+            return None if name is None else df[name].to_numpy()
+
+        def cat(name):
+            if name is None:
+                return None
+            values = df[name]
+            return values.array if isinstance(values.dtype, pd.CategoricalDtype) else values.to_numpy()
+
+        extra = {name: df[name].to_numpy() for name in (columns or [])}
+        return cls(col(x), col(y), x_end=col(x_end), y_end=col(y_end),
+                   shot_type=cat(shot_type), outcome=cat(outcome), **extra)
+
+    def __len__(self):
+        return len(self.x)
+
+    def __repr__(self):
+        fields = ['x', 'y'] + [name for name in ('x_end', 'y_end', 'shot_type', 'outcome')
+                               if getattr(self, name) is not None]
+        return f"ShotTable(n={len(self)}, columns={fields + list(self.columns)})"
+
+    def __getitem__(self, key):
+        """Column by name, or a new ShotTable for a boolean mask / index array."""
+        if isinstance(key, str):
+            if key in ('x', 'y', 'x_end', 'y_end', 'shot_type', 'outcome'):
+                return getattr(self, key)
+            return self.columns[key]
+        return self.subset(key)
+
+    def subset(self, mask):
+        """
+        Return a new ShotTable with the rows selected by ``mask``.
+
+        Parameters
+        ----------
+        mask : array-like of bool or int
+            Boolean mask or integer index array.
+        """
+        def take(values):
+            return None if values is None else values[mask]
+
+        return ShotTable(self.x[mask], self.y[mask],
+                         x_end=take(self.x_end), y_end=take(self.y_end),
+                         shot_type=take(self.shot_type), outcome=take(self.outcome),
+                         **{name: values[mask] for name, values in self.columns.items()})
+
+    def to_dataframe(self):
+        """Return the table as a pandas DataFrame."""
+        data = {'x': self.x, 'y': self.y}
+        for name in ('x_end', 'y_end', 'shot_type', 'outcome'):
+            if getattr(self, name) is not None:
+                data[name] = getattr(self, name)
+        data.update(self.columns)
+        return pd.DataFrame(data)
+
+    # -------------------------------------------------------------------------
+    # Cached derived columns
+    # -------------------------------------------------------------------------
+    def plot_xy(self, orientation='vertical'):
+        """
+        Coordinates in plot space for a court orientation.
+
+        Horizontal courts plot length along X, so the columns are swapped.
+        The returned arrays are the stored columns themselves (no copy).
+
+        Returns
+        -------
+        px, py : ndarray
+        """
+        key = ('plot_xy', orientation)
+        if key not in self._cache:
+            if orientation == 'horizontal':
+                self._cache[key] = (self.y, self.x)
+            else:
+                self._cache[key] = (self.x, self.y)
+        return self._cache[key]
+
+    def plot_end_xy(self, orientation='vertical'):
+        """End coordinates in plot space (see ``plot_xy``)."""
+        if self.x_end is None or self.y_end is None:
+            raise ValueError("ShotTable has no end coordinates (x_end, y_end)")
+        key = ('plot_end_xy', orientation)
+        if key not in self._cache:
+            if orientation == 'horizontal':
+                self._cache[key] = (self.y_end, self.x_end)
+            else:
+                self._cache[key] = (self.x_end, self.y_end)
+        return self._cache[key]
+
+    @property
+    def dx(self):
+        """Shot direction x component (x_end - x)."""
+        if 'dx' not in self._cache:
+            self._cache['dx'] = self.plot_end_xy()[0] - self.x
+        return self._cache['dx']
+
+    @property
+    def dy(self):
+        """Shot direction y component (y_end - y)."""
+        if 'dy' not in self._cache:
+            self._cache['dy'] = self.plot_end_xy()[1] - self.y
+        return self._cache['dy']
+
+    @property
+    def angle(self):
+        """Shot direction in degrees, 0 = up (towards +y), clockwise."""
+        if 'angle' not in self._cache:
+            angles = np.degrees(np.arctan2(self.dy, self.dx))
+            self._cache['angle'] = (90 - angles) % 360
+        return self._cache['angle']
+
+    @property
+    def depth_code(self):
+        """int8 depth codes (see ``classify_shot_depth``) of the distance from the net, |y|."""
+        if 'depth_code' not in self._cache:
+            self._cache['depth_code'] = classify_shot_depth(np.abs(self.y), output='code')
+        return self._cache['depth_code']
+
+
+def as_plot_xy(x, y, orientation):
+    """
+    Resolve plotting inputs to plot-space arrays.
+
+    Accepts either a ShotTable (passed as ``x``) or separate ``x``/``y``
+    array-likes in standard vertical coords. Arrays are not copied.
+    """
+    if isinstance(x, ShotTable):
+        return x.plot_xy(orientation)
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if orientation == 'horizontal':
+        return y, x
+    return x, y
@@ -11,6 +11,9 @@ from matplotlib.patches import Wedge, Circle
 from matplotlib.collections import PatchCollection
 import numpy as np
 
+from .shots import ShotTable
+from ._court_plot import _CellLabels
+
 
 def sonar_chart(ax, zone_data, court=None, 
                 n_directions=6,
@@ -21,6 +24,8 @@ def sonar_chart(ax, zone_data, court=None,
                 center_color='#1a1a2e',
                 edge_color='white',
                 direction_labels=None,
+                label_fmt=None,
+                negative_color='#6c757d',
                 **kwargs):
     """
     Create a sonar chart showing shot direction distributions from court zones.
@@ -29,11 +34,13 @@ def sonar_chart(ax, zone_data, court=None,
     ----------
     ax : matplotlib axes
         The axes to draw on (should already have court drawn).
-    zone_data : list of dict
+    zone_data : list of dict or SonarAggregate
         Each dict contains:
         - 'x', 'y': Zone center coordinates (in court coords)
         - 'directions': list of values (counts or percentages) for each direction
         Example: [{'x': 0, 'y': 5, 'directions': [15, 25, 30, 10, 12, 8]}, ...]
+        A ``SonarAggregate`` is drawn as is (its direction count and
+        statistic are used).
     court : TennisCourt, optional
         Court object for coordinate transformation.
     n_directions : int, default 6
@@ -52,12 +59,27 @@ def sonar_chart(ax, zone_data, court=None,
         Edge color of wedges.
     direction_labels : list of str, optional
         Custom labels for directions (e.g., ['Cross', 'DTL', ...]).
+    label_fmt : str, optional
+        Format spec for labelling the values themselves (e.g. '.1f' for mean
+        speeds) instead of percentages of the zone total. Defaults to '.1f'
+        for a sum/mean ``SonarAggregate``.
+    negative_color : str, default '#6c757d'
+        Fill for wedges whose value is negative (e.g. the mean of a signed
+        score). Wedge length follows the magnitude, scaled by the largest
+        absolute value in the zone, so the sign is carried by this color.
     
     Returns
     -------
     collections : list of PatchCollection
+        Wedges and center circles. Labels are drawn by a single artist.
     """
     
+    if isinstance(zone_data, SonarAggregate):
+        n_directions = zone_data.n_directions
+        if label_fmt is None and zone_data.statistic != 'count':
+            label_fmt = '.1f'
+        zone_data = zone_data.zone_data()
+    
     # Color schemes
     color_schemes = {
         'bsu': ['#92e3da', '#5bc0be', '#3a86ff', '#8338ec', '#ff006e', '#fb5607', '#ffbe0b', '#06d6a0'],
@@ -72,7 +94,9 @@ def sonar_chart(ax, zone_data, court=None,
         colors = colors + colors
     colors = colors[:n_directions]
     
-    all_patches = []
+    angle_step = 360 / n_directions
+    wedges, wedge_colors, centers = [], [], []
+    label_x, label_y, label_text, label_colors = [], [], [], []
     
     for zone in zone_data:
         cx, cy = zone['x'], zone['y']
@@ -84,60 +108,51 @@ def sonar_chart(ax, zone_data, court=None,
         else:
             plot_x, plot_y = cx, cy
         
-        # Normalize directions to get radii (max = zone_size)
-        directions = np.array(directions)
-        if directions.max() > 0:
-            norm_dirs = directions / directions.max()
-        else:
-            norm_dirs = directions
+        # Normalize magnitudes to get radii (max = zone_size); negative
+        # values keep their length and are told apart by color
+        directions = np.array(directions, dtype=float)
+        peak = np.abs(directions).max()
+        norm_dirs = np.abs(directions) / peak if peak > 0 else np.zeros_like(directions)
         
         # Calculate percentages for labels
         total = directions.sum()
         percentages = (directions / total * 100) if total > 0 else directions
         
-        # Create wedges for each direction
-        angle_step = 360 / n_directions
-        patches = []
-        
+        # Wedge i is centered on i * angle_step (0 = up/forward, clockwise)
+        mid = 90 - np.arange(n_directions) * angle_step
+        radii = zone_size * (0.3 + 0.7 * norm_dirs)  # Min radius 30%
         for i in range(n_directions):
-            # Start angle (0 = up/forward)
-            theta1 = 90 - (i * angle_step) - angle_step / 2
-            theta2 = 90 - (i * angle_step) + angle_step / 2
-            
-            # Radius based on value
-            r = zone_size * (0.3 + 0.7 * norm_dirs[i])  # Min radius 30%
-            
-            wedge = Wedge(
-                (plot_x, plot_y), r,
-                theta1, theta2,
-                facecolor=colors[i % len(colors)],
-                edgecolor=edge_color,
-                linewidth=1,
-                alpha=alpha
-            )
-            patches.append(wedge)
-            ax.add_patch(wedge)
-            
-            # Add percentage label
-            if show_labels and percentages[i] >= 5:  # Only show if >= 5%
-                mid_angle = np.radians((theta1 + theta2) / 2)
-                label_r = r * 0.65
-                lx = plot_x + label_r * np.cos(mid_angle)
-                ly = plot_y + label_r * np.sin(mid_angle)
-                ax.text(lx, ly, f'{percentages[i]:.0f}%',
-                       ha='center', va='center',
-                       fontsize=7, fontweight='bold',
-                       color='white' if norm_dirs[i] > 0.5 else '#333333')
+            wedges.append(Wedge((plot_x, plot_y), radii[i],
+                                mid[i] - angle_step / 2, mid[i] + angle_step / 2))
+            wedge_colors.append(negative_color if directions[i] < 0 else colors[i % len(colors)])
         
-        # Draw center circle
-        center = Circle((plot_x, plot_y), zone_size * 0.15,
-                        facecolor=center_color, edgecolor=edge_color,
-                        linewidth=1.5, zorder=10)
-        ax.add_patch(center)
+        # Percentage labels (only shown if >= 5%), or non-zero values
+        if show_labels:
+            if label_fmt is None:
+                shown = np.nonzero(percentages >= 5)[0]
+                label_text.extend(f'{percentages[i]:.0f}%' for i in shown)
+            else:
+                shown = np.nonzero(directions != 0)[0]
+                label_text.extend(format(directions[i], label_fmt) for i in shown)
+            label_r = radii[shown] * 0.65
+            label_x.extend(plot_x + label_r * np.cos(np.radians(mid[shown])))
+            label_y.extend(plot_y + label_r * np.sin(np.radians(mid[shown])))
+            label_colors.extend('white' if norm_dirs[i] > 0.5 else '#333333' for i in shown)
         
-        all_patches.extend(patches)
+        centers.append(Circle((plot_x, plot_y), zone_size * 0.15))
+    
+    # All wedges and all center circles as one collection each
+    wedge_collection = PatchCollection(wedges, facecolors=wedge_colors, edgecolors=edge_color,
+                                       linewidths=1, alpha=alpha)
+    center_collection = PatchCollection(centers, facecolors=center_color, edgecolors=edge_color,
+                                        linewidths=1.5, zorder=10)
+    ax.add_collection(wedge_collection)
+    ax.add_collection(center_collection)
+    if label_text:
+        ax.add_artist(_CellLabels(label_x, label_y, label_text, fontsize=7,
+                                  color=label_colors, fontweight='bold'))
     
-    return all_patches
+    return [wedge_collection, center_collection]
 
 
 def create_zone_grid(court, rows=2, cols=3, half=True):
@@ -181,19 +196,317 @@ def create_zone_grid(court, rows=2, cols=3, half=True):
     return zones
 
 
-def sonar_from_shots(ax, shot_x, shot_y, shot_dx, shot_dy,
+# Per-bin values a SonarAggregate can report
+SONAR_STATISTICS = ('count', 'sum', 'mean')
+
+
+class SonarAggregate:
+    """
+    Shot counts (and optional weight sums) per court zone and direction,
+    computed in one pass.
+
+    Aggregates on the same zone grid can be added (e.g. across matches)
+    and passed straight to ``sonar_chart``. Counts and sums are kept
+    separately, so merged means stay exact.
+
+    Parameters
+    ----------
+    counts : ndarray, shape (n_zones_y, n_zones_x, n_directions)
+        Shots per zone (rows along the court length) and direction.
+    x_edges, y_edges : ndarray
+        Zone boundaries across the court width and along its length
+        (standard vertical court coords).
+    sums : ndarray, optional
+        Sum of the shot weights per bin (same shape as ``counts``).
+    statistic : str, default 'count'
+        Value drawn and reported by ``values``/``zone_data``: 'count',
+        'sum' or 'mean' (sum / count; 0 for empty bins).
+
+    Examples
+    --------
+    >>> agg = SonarAggregate.from_shots(shots, n_zones_x=3, n_zones_y=2)
+    >>> season = sum(SonarAggregate.from_shots(m) for m in matches)
+    >>> sonar_chart(ax, season, court=court)
+    >>> speed = SonarAggregate.from_shots(shots, weights='speed', statistic='mean')
+    """
+
+    def __init__(self, counts, x_edges, y_edges, sums=None, statistic='count'):
+        self.counts = np.asarray(counts)
+        self.x_edges = np.asarray(x_edges, dtype=float)
+        self.y_edges = np.asarray(y_edges, dtype=float)
+        self.sums = None if sums is None else np.asarray(sums, dtype=float)
+        self.statistic = statistic
+        if self.counts.shape[:2] != (len(self.y_edges) - 1, len(self.x_edges) - 1):
+            raise ValueError(f"counts has shape {self.counts.shape}, expected "
+                             f"({len(self.y_edges) - 1}, {len(self.x_edges) - 1}, n_directions)")
+        if self.sums is not None and self.sums.shape != self.counts.shape:
+            raise ValueError(f"sums has shape {self.sums.shape}, expected {self.counts.shape}")
+        _check_statistic(statistic, self.sums is not None)
+
+    @classmethod
+    def empty(cls, n_zones_x=3, n_zones_y=2, n_directions=6, half=True, statistic='count'):
+        """Aggregate with no shots (the starting point for accumulation)."""
+        x_edges, y_edges = _zone_edges(n_zones_x, n_zones_y, half)
+        shape = (n_zones_y, n_zones_x, n_directions)
+        sums = None if statistic == 'count' else np.zeros(shape)
+        return cls(np.zeros(shape, dtype=np.int64), x_edges, y_edges, sums=sums,
+                   statistic=statistic)
+
+    @classmethod
+    def from_shots(cls, shot_x, shot_y=None, shot_dx=None, shot_dy=None,
+                   n_zones_x=3, n_zones_y=2, n_directions=6, half=True,
+                   weights=None, statistic='count'):
+        """
+        Count shots per zone and direction with a single bincount.
+
+        Parameters
+        ----------
+        shot_x, shot_y : array-like
+            Shot origin coordinates. A ShotTable with end coordinates may be
+            passed as ``shot_x`` instead of all four arrays.
+        shot_dx, shot_dy : array-like
+            Shot direction vectors (destination - origin).
+        n_zones_x : int, default 3
+            Number of zones across court width.
+        n_zones_y : int, default 2
+            Number of zones along court length.
+        n_directions : int, default 6
+            Direction segments per zone.
+        half : bool, default True
+            Half court mode.
+        weights : array-like or str, optional
+            Per-shot value (ball speed, 1/0 point won, expected value, ...),
+            or a ShotTable column name. Shots with NaN weights are skipped.
+        statistic : str, default 'count'
+            'count', or with ``weights``, 'sum' or 'mean' per bin.
+
+        Returns
+        -------
+        SonarAggregate
+        """
+        _check_statistic(statistic, weights is not None)
+        if isinstance(weights, str) and isinstance(shot_x, ShotTable):
+            weights = shot_x[weights]
+        x_edges, y_edges = _zone_edges(n_zones_x, n_zones_y, half)
+        bins, valid = _bin_shots(shot_x, shot_y, shot_dx, shot_dy,
+                                 x_edges, y_edges, n_directions)
+        shape = (n_zones_y, n_zones_x, n_directions)
+        n_bins = n_zones_y * n_zones_x * n_directions
+
+        sums = None
+        if weights is not None:
+            weights = np.asarray(weights, dtype=float)[valid]
+            known = ~np.isnan(weights)
+            if not known.all():
+                bins, weights = bins[known], weights[known]
+            sums = np.bincount(bins, weights=weights, minlength=n_bins).reshape(shape)
+        counts = np.bincount(bins, minlength=n_bins).reshape(shape)
+        return cls(counts, x_edges, y_edges, sums=sums, statistic=statistic)
+
+    @property
+    def n_directions(self):
+        return self.counts.shape[2]
+
+    @property
+    def values(self):
+        """Per-bin ``statistic``, shape (n_zones_y, n_zones_x, n_directions)."""
+        _check_statistic(self.statistic, self.sums is not None)
+        if self.statistic == 'count':
+            return self.counts
+        if self.statistic == 'sum':
+            return self.sums
+        return np.divide(self.sums, self.counts, out=np.zeros(self.sums.shape),
+                         where=self.counts > 0)
+
+    def __array__(self, dtype=None, copy=None):
+        return self.values if dtype is None else self.values.astype(dtype)
+
+    def __repr__(self):
+        n_y, n_x, n_d = self.counts.shape
+        return (f"SonarAggregate(zones={n_x}x{n_y}, n_directions={n_d}, "
+                f"statistic={self.statistic!r}, shots={self.counts.sum():g})")
+
+    def same_grid(self, other):
+        """True if ``other`` uses the same zones and directions."""
+        return (self.counts.shape == other.counts.shape
+                and np.allclose(self.x_edges, other.x_edges)
+                and np.allclose(self.y_edges, other.y_edges))
+
+    def __add__(self, other):
+        # 0 + agg lets the builtin sum() work
+        if isinstance(other, (int, float)) and other == 0:
+            return self
+        if not isinstance(other, SonarAggregate):
+            return NotImplemented
+        if not self.same_grid(other):
+            raise ValueError("SonarAggregates must share zones and n_directions")
+        if (self.sums is None) != (other.sums is None):
+            raise ValueError("Cannot add a weighted SonarAggregate to an unweighted one")
+        sums = None if self.sums is None else self.sums + other.sums
+        return SonarAggregate(self.counts + other.counts, self.x_edges, self.y_edges,
+                              sums=sums, statistic=self.statistic)
+
+    __radd__ = __add__
+
+    def zone_data(self):
+        """Zones in the ``sonar_chart`` format (row by row along the court)."""
+        values = self.values
+        x_centers = (self.x_edges[:-1] + self.x_edges[1:]) / 2
+        y_centers = (self.y_edges[:-1] + self.y_edges[1:]) / 2
+        return [{'x': cx, 'y': cy, 'directions': values[i, j].tolist()}
+                for i, cy in enumerate(y_centers)
+                for j, cx in enumerate(x_centers)]
+
+
+class SonarAccumulator:
+    """
+    Streaming sonar: feed shots chunk by chunk and merge partial results.
+
+    Only the per-bin counts and sums are kept, so a full season can be
+    aggregated without holding every shot in memory. Accumulators are
+    small and picklable; build one per worker and ``merge`` them.
+
+    Parameters
+    ----------
+    n_zones_x, n_zones_y, n_directions, half
+        Zone grid, as for ``SonarAggregate.from_shots``.
+    statistic : str, default 'count'
+        'count', 'sum' or 'mean'. 'sum' and 'mean' need ``weights`` in
+        every ``update``.
+
+    Examples
+    --------
+    >>> acc = SonarAccumulator(statistic='mean')
+    >>> for chunk in pd.read_csv('points.csv', chunksize=200_000):
+    ...     acc.update(ShotTable.from_dataframe(chunk, x='x', y='y', x_end='x_end',
+    ...                                         y_end='y_end', speed='speed'),
+    ...                weights='speed')
+    >>> sonar_chart(ax, acc.zone_data(), court=court, n_directions=acc.n_directions)
+    """
+
+    def __init__(self, n_zones_x=3, n_zones_y=2, n_directions=6, half=True, statistic='count'):
+        if statistic not in SONAR_STATISTICS:
+            raise ValueError(f"statistic must be one of {SONAR_STATISTICS}, got {statistic!r}")
+        self.n_zones_x = n_zones_x
+        self.n_zones_y = n_zones_y
+        self.n_directions = n_directions
+        self.half = half
+        self.statistic = statistic
+        self.aggregate = SonarAggregate.empty(n_zones_x, n_zones_y, n_directions, half, statistic)
+        self.n_chunks = 0
+
+    def __repr__(self):
+        return (f"SonarAccumulator(zones={self.n_zones_x}x{self.n_zones_y}, "
+                f"n_directions={self.n_directions}, statistic={self.statistic!r}, "
+                f"chunks={self.n_chunks}, shots={self.aggregate.counts.sum():g})")
+
+    def update(self, shot_x, shot_y=None, shot_dx=None, shot_dy=None, weights=None):
+        """
+        Add a chunk of shots (same arguments as ``SonarAggregate.from_shots``).
+
+        Returns
+        -------
+        SonarAccumulator
+            self, so updates can be chained.
+        """
+        if self.statistic != 'count' and weights is None:
+            raise ValueError(f"statistic={self.statistic!r} needs weights")
+        chunk = SonarAggregate.from_shots(
+            shot_x, shot_y, shot_dx, shot_dy, n_zones_x=self.n_zones_x,
+            n_zones_y=self.n_zones_y, n_directions=self.n_directions, half=self.half,
+            weights=weights if self.statistic != 'count' else None, statistic=self.statistic)
+        self.aggregate = self.aggregate + chunk
+        self.n_chunks += 1
+        return self
+
+    def merge(self, other):
+        """
+        Fold in another accumulator (e.g. from a worker process).
+
+        Returns
+        -------
+        SonarAccumulator
+            self.
+        """
+        if self.statistic != other.statistic:
+            raise ValueError(f"Cannot merge statistic={other.statistic!r} "
+                             f"into statistic={self.statistic!r}")
+        self.aggregate = self.aggregate + other.aggregate
+        self.n_chunks += other.n_chunks
+        return self
+
+    def zone_data(self):
+        """Current result in the ``sonar_chart`` ``zone_data`` format."""
+        return self.aggregate.zone_data()
+
+
+def _check_statistic(statistic, weighted):
+    if statistic not in SONAR_STATISTICS:
+        raise ValueError(f"statistic must be one of {SONAR_STATISTICS}, got {statistic!r}")
+    if statistic != 'count' and not weighted:
+        raise ValueError(f"statistic={statistic!r} needs weights")
+
+
+def _zone_edges(n_zones_x, n_zones_y, half):
+    # Define zone boundaries
+    if half:
+        x_min, x_max = -4.115, 4.115
+        y_min, y_max = 0, 11.89
+    else:
+        x_min, x_max = -4.115, 4.115
+        y_min, y_max = -11.89, 11.89
+    return np.linspace(x_min, x_max, n_zones_x + 1), np.linspace(y_min, y_max, n_zones_y + 1)
+
+
+def _bin_shots(shot_x, shot_y, shot_dx, shot_dy, x_edges, y_edges, n_directions):
+    """
+    Flat (zone, direction) bin of every shot that falls in a zone, and
+    the mask of those shots.
+    
+    Zones are half-open ``[edge, next edge)``; direction ``d`` covers angles
+    ``[d * step, (d + 1) * step)`` with 0 = up, clockwise. Bins are computed
+    arithmetically (edges are evenly spaced) in a handful of array passes.
+    """
+    if isinstance(shot_x, ShotTable):
+        # Cached on the table, so repeated sonars reuse the angles
+        turns = shot_x.angle * (n_directions / 360)
+        shot_x, shot_y = shot_x.x, shot_x.y
+    else:
+        shot_x = np.asarray(shot_x)
+        shot_y = np.asarray(shot_y)
+        # Angle 0 = up, clockwise: 90 deg - atan2(dy, dx), in units of wedges
+        turns = np.arctan2(np.asarray(shot_dy), np.asarray(shot_dx))
+        turns = (np.pi / 2 - turns) * (n_directions / (2 * np.pi))
+    
+    n_zones_x, n_zones_y = len(x_edges) - 1, len(y_edges) - 1
+    col = np.floor((shot_x - x_edges[0]) * (n_zones_x / (x_edges[-1] - x_edges[0])))
+    row = np.floor((shot_y - y_edges[0]) * (n_zones_y / (y_edges[-1] - y_edges[0])))
+    direction = np.floor(turns) % n_directions
+    
+    # NaN coordinates or angles fail every comparison and are dropped
+    valid = ((col >= 0) & (col < n_zones_x) & (row >= 0) & (row < n_zones_y)
+             & (direction >= 0))
+    bins = ((row * n_zones_x + col) * n_directions + direction)[valid].astype(np.intp)
+    return bins, valid
+
+
+def sonar_from_shots(ax, shot_x, shot_y=None, shot_dx=None, shot_dy=None,
                      court=None, n_zones_x=3, n_zones_y=2,
                      n_directions=6, zone_size=1.5, half=True,
-                     cmap='bsu', **kwargs):
+                     cmap='bsu', weights=None, statistic='count', **kwargs):
     """
     Create sonar chart from raw shot data.
     
+    Shots are counted with ``SonarAggregate.from_shots``; build the
+    aggregate directly to reuse or merge the counts.
+    
     Parameters
     ----------
     ax : matplotlib axes
         Axes to draw on.
     shot_x, shot_y : array-like
-        Shot origin coordinates.
+        Shot origin coordinates. A ShotTable with end coordinates may be
+        passed as ``shot_x`` instead of all four arrays.
     shot_dx, shot_dy : array-like
         Shot direction vectors (destination - origin).
     court : TennisCourt, optional
@@ -210,62 +523,19 @@ def sonar_from_shots(ax, shot_x, shot_y, shot_dx, shot_dy,
         Half court mode.
     cmap : str, default 'bsu'
         Color scheme.
+    weights : array-like or str, optional
+        Per-shot value (or ShotTable column name) for ``statistic``.
+    statistic : str, default 'count'
+        'count', or with ``weights``, 'sum' or 'mean' per wedge.
     
     Returns
     -------
     patches : list
     """
-    shot_x = np.array(shot_x)
-    shot_y = np.array(shot_y)
-    shot_dx = np.array(shot_dx)
-    shot_dy = np.array(shot_dy)
-    
-    # Calculate shot angles
-    angles = np.degrees(np.arctan2(shot_dy, shot_dx))  # -180 to 180
-    angles = (90 - angles) % 360  # Convert to 0=up, clockwise
-    
-    # Define zone boundaries
-    if half:
-        x_min, x_max = -4.115, 4.115
-        y_min, y_max = 0, 11.89
-    else:
-        x_min, x_max = -4.115, 4.115
-        y_min, y_max = -11.89, 11.89
-    
-    x_edges = np.linspace(x_min, x_max, n_zones_x + 1)
-    y_edges = np.linspace(y_min, y_max, n_zones_y + 1)
-    
-    # Build zone data
-    zone_data = []
-    angle_step = 360 / n_directions
-    
-    for i in range(n_zones_y):
-        for j in range(n_zones_x):
-            # Zone center
-            cx = (x_edges[j] + x_edges[j+1]) / 2
-            cy = (y_edges[i] + y_edges[i+1]) / 2
-            
-            # Find shots in this zone
-            in_zone = (
-                (shot_x >= x_edges[j]) & (shot_x < x_edges[j+1]) &
-                (shot_y >= y_edges[i]) & (shot_y < y_edges[i+1])
-            )
-            zone_angles = angles[in_zone]
-            
-            # Count shots in each direction bin
-            directions = []
-            for d in range(n_directions):
-                angle_start = (d * angle_step) % 360
-                angle_end = ((d + 1) * angle_step) % 360
-                
-                if angle_start < angle_end:
-                    count = np.sum((zone_angles >= angle_start) & (zone_angles < angle_end))
-                else:  # Wrap around 360
-                    count = np.sum((zone_angles >= angle_start) | (zone_angles < angle_end))
-                directions.append(count)
-            
-            zone_data.append({'x': cx, 'y': cy, 'directions': directions})
-    
-    return sonar_chart(ax, zone_data, court=court, 
+    aggregate = SonarAggregate.from_shots(shot_x, shot_y, shot_dx, shot_dy,
+                                          n_zones_x=n_zones_x, n_zones_y=n_zones_y,
+                                          n_directions=n_directions, half=half,
+                                          weights=weights, statistic=statistic)
+    return sonar_chart(ax, aggregate, court=court, 
                        n_directions=n_directions, zone_size=zone_size,
                        cmap=cmap, **kwargs)
@@ -2,28 +2,69 @@
 import pandas as pd
 import numpy as np
 
-def transform_coordinate(x, y):
+def transform_coordinate(x, y, out=None):
     """
     Transform raw coordinates (Assuming Top-Left origin or similar) 
     to centered Tennis Court coordinates (Net=0,0).
     Based on 'serve_point.py' logic:
     new_x = x - 5.485
     new_y = 11.885 - y
+    
+    Points that land on the far side (new_y < 0) are mirrored through the
+    net centre so everything is folded onto the upper court.
+    
+    Parameters
+    ----------
+    x, y : float or array-like
+        Raw coordinates. Scalars, NumPy arrays and pandas Series
+        (e.g. DataFrame columns) are accepted.
+    out : tuple of ndarray, optional
+        ``(out_x, out_y)`` arrays to write the result into. Passing the
+        input arrays themselves (``out=(x, y)``) transforms them in place,
+        which avoids copying large float32 buffers.
+    
+    Returns
+    -------
+    new_x, new_y : float or ndarray
+        Scalars for scalar input, otherwise arrays (``out`` if given).
     """
-    new_x = x - 5.485
-    new_y = 11.885 - y
+    x_arr = np.asarray(x)
+    y_arr = np.asarray(y)
     
-    # Logic from serve_point.py suggests it flips if y < 0?
-    # "if new_y < 0: return -new_x, -new_y"
-    # This logic seems to map everything to one side of the court for served points?
-    # Yes, for serving visualization, you usually map everything to the "upper" court.
+    if out is None and x_arr.ndim == 0 and y_arr.ndim == 0:
+        new_x = x - 5.485
+        new_y = 11.885 - y
+        
+        # Logic from serve_point.py suggests it flips if y < 0?
+        # "if new_y < 0: return -new_x, -new_y"
+        # This logic seems to map everything to one side of the court for served points?
+        # Yes, for serving visualization, you usually map everything to the "upper" court.
+        if new_y < 0:
+            return -new_x, -new_y
+        else:
+            return new_x, new_y
     
-    if new_y < 0:
-        return -new_x, -new_y
+    # Array path: same fold as above, done with a mask instead of a branch
+    if out is None:
+        new_x = np.subtract(x_arr, 5.485)
+        new_y = np.subtract(11.885, y_arr)
     else:
-        return new_x, new_y
+        new_x, new_y = out
+        np.subtract(x_arr, 5.485, out=new_x)
+        np.subtract(11.885, y_arr, out=new_y)
+    
+    flip = new_y < 0
+    np.negative(new_x, out=new_x, where=flip)
+    np.negative(new_y, out=new_y, where=flip)
+    
+    return new_x, new_y
+
+# Category order for the compact serve-zone codes (code == index)
+SERVE_ZONES = ('Out', 'Wide', 'Body', 'T')
+SERVE_SIDES = ('Deuce', 'Ad')
+SHOT_DEPTHS = ('Short', 'Medium', 'Deep')
 
-def classify_serve_zone(x, y):
+def classify_serve_zone(x, y, output='label', side=False):
     """
     Classify serve landing zone based on coordinates.
     Returns: 1 (Wide), 2 (Body), 3 (T) or combined strings.
@@ -32,6 +73,24 @@ def classify_serve_zone(x, y):
     x ranges:
     Left: -4.115 to 0. Divided by 3.
     Right: 0 to 4.115. Divided by 3.
+    
+    Parameters
+    ----------
+    x, y : float or array-like
+        Landing coordinates (in centered court coords, y > 0).
+    output : str, default 'label'
+        'label': 'Wide', 'Body', 'T' or 'Out' (object array for arrays).
+        'code': int8 codes indexing ``SERVE_ZONES`` (0 Out, 1 Wide, 2 Body, 3 T).
+        'category': pandas Categorical with ``SERVE_ZONES`` categories.
+    side : bool, default False
+        If True, also return the service box side. Codes index
+        ``SERVE_SIDES`` (0 Deuce for x <= 0, 1 Ad); 'Out' serves get
+        -1 (None / NaN for labels / categoricals).
+    
+    Returns
+    -------
+    zone or (zone, side)
+        Scalars for scalar input, otherwise arrays.
     """
     
     # Constants
@@ -40,6 +99,29 @@ def classify_serve_zone(x, y):
     SERVICE_LENGTH = 6.4
     THIRD_WIDTH = HALF_WIDTH / 3 # ~1.37
     
+    scalar_input = np.ndim(x) == 0 and np.ndim(y) == 0
+    if output != 'label' or side or not scalar_input:
+        # Vectorized path: bin x against the service box edges in one pass
+        edges = np.array([-HALF_WIDTH, -2 * THIRD_WIDTH, -THIRD_WIDTH, 0,
+                          THIRD_WIDTH, 2 * THIRD_WIDTH, HALF_WIDTH])
+        x_arr = np.atleast_1d(np.asarray(x, dtype=float))
+        y_arr = np.atleast_1d(np.asarray(y, dtype=float))
+        
+        # digitize bin -> zone: <-W | Wide Body T | T Body Wide | >=W
+        bins = np.digitize(x_arr, edges)
+        bins[x_arr == HALF_WIDTH] = 6  # Outer sideline counts as Wide
+        zone_lut = np.array([0, 1, 2, 3, 3, 2, 1, 0], dtype=np.int8)
+        zones = zone_lut[bins]
+        zones[~((y_arr > 0) & (y_arr <= SERVICE_LENGTH))] = 0
+        
+        sides = np.where(x_arr <= 0, 0, 1).astype(np.int8)
+        sides[zones == 0] = -1
+        
+        zones = _format_codes(zones, SERVE_ZONES, output, scalar_input)
+        if not side:
+            return zones
+        return zones, _format_codes(sides, SERVE_SIDES, output, scalar_input)
+    
     # Check bounds (must be in service box depth)
     # The user logic uses 0 < y <= 6.4.
     # Note: transformed coordinates assume y > 0 is correct for this.
@@ -83,7 +165,22 @@ def classify_serve_zone(x, y):
     else:
         return 'Out' # Too wide
 
-def classify_shot_depth(y, max_length=11.885):
+def _format_codes(codes, categories, output, scalar_input):
+    """Convert int8 category codes to the requested output type (-1 = missing)."""
+    if output == 'code':
+        result = codes
+    elif output == 'category':
+        result = pd.Categorical.from_codes(codes, categories=list(categories))
+    elif output == 'label':
+        result = np.array(list(categories) + [None], dtype=object)[codes]
+    else:
+        raise ValueError(f"output must be 'label', 'code' or 'category', got {output!r}")
+    
+    if scalar_input:
+        return result[0]
+    return result
+
+def classify_shot_depth(y, max_length=11.885, output='label', thresholds=(6.4, 9.0)):
     """
     Classify shot depth based on y-coordinate.
     
@@ -93,11 +190,18 @@ def classify_shot_depth(y, max_length=11.885):
         Shot landing y-coordinate (in centered court coords, y > 0).
     max_length : float, default 11.885
         Half court length.
+    output : str, default 'label'
+        'label': 'Short', 'Medium' or 'Deep' (object array for arrays).
+        'code': int8 codes indexing ``SHOT_DEPTHS`` (0 Short, 1 Medium, 2 Deep).
+        'category': pandas Categorical with ``SHOT_DEPTHS`` categories.
+    thresholds : tuple of float, default (6.4, 9.0)
+        Upper bounds (inclusive) of the Short and Medium bands.
     
     Returns
     -------
     str or array-like
         Depth category: 'Short', 'Medium', or 'Deep'.
+        NaN coordinates map to None / -1 / NaN.
         
     Notes
     -----
@@ -106,20 +210,15 @@ def classify_shot_depth(y, max_length=11.885):
     - Medium: Service line to no-man's land (6.4-9.0m)
     - Deep: Near baseline (9.0-11.89m)
     """
-    import numpy as np
+    SERVICE_LINE, DEEP_THRESHOLD = thresholds
+    if SERVICE_LINE > DEEP_THRESHOLD:
+        raise ValueError("thresholds must be increasing")
     
-    SERVICE_LINE = 6.4
-    DEEP_THRESHOLD = 9.0
-    
-    y = np.asarray(y)
+    y = np.asarray(y, dtype=float)
     scalar_input = y.ndim == 0
     y = np.atleast_1d(y)
     
-    result = np.empty(y.shape, dtype=object)
-    result[y <= SERVICE_LINE] = 'Short'
-    result[(y > SERVICE_LINE) & (y <= DEEP_THRESHOLD)] = 'Medium'
-    result[y > DEEP_THRESHOLD] = 'Deep'
+    codes = np.digitize(y, [SERVICE_LINE, DEEP_THRESHOLD], right=True).astype(np.int8)
+    codes[np.isnan(y)] = -1
     
-    if scalar_input:
-        return result[0]
-    return result
+    return _format_codes(codes, SHOT_DEPTHS, output, scalar_input)
@@ -0,0 +1,81 @@
+import io
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from BsuTennis import TennisCourt
+
+
+@pytest.fixture
+def court_ax():
+    court = TennisCourt()
+    fig, ax = plt.subplots()
+    court.draw(ax)
+    yield court, ax
+    plt.close(fig)
+
+
+@pytest.mark.parametrize('how', ['log', 'linear'])
+def test_density_scatter_with_no_points_draws(court_ax, how):
+    court, ax = court_ax
+    image = court.scatter(ax, np.array([]), np.array([]), mode='density', how=how)
+    ax.figure.canvas.draw()
+    assert image.get_array().count() == 0
+
+
+def test_density_scatter_rejects_unknown_how(court_ax):
+    court, ax = court_ax
+    with pytest.raises(ValueError, match='how'):
+        court.scatter(ax, [0.0], [1.0], mode='density', how='sqrt')
+
+
+def test_heatmap_sum_keeps_cells_that_total_zero(court_ax):
+    court, ax = court_ax
+    # Two shots in the same cell whose values cancel, one shot elsewhere
+    x = np.array([1.0, 1.0, -3.0])
+    y = np.array([5.0, 5.0, -8.0])
+    values = np.array([1.0, -1.0, 2.0])
+    mesh = court.heatmap(ax, x, y, statistic='sum', values=values, annot=True)
+    H = mesh.get_array()
+    assert H.count() == 2
+    assert sorted(H.compressed()) == [0.0, 2.0]
+
+
+def test_heatmap_labels_are_text_in_vector_output(court_ax):
+    court, ax = court_ax
+    court.heatmap(ax, [1.0, 1.0, -3.0], [5.0, 5.0, -8.0], annot=True)
+    buffer = io.BytesIO()
+    with matplotlib.rc_context({'svg.fonttype': 'none'}):
+        ax.figure.savefig(buffer, format='svg')
+    svg = buffer.getvalue().decode()
+    assert svg.count('<text') == 2
+    assert '>2</text>' in svg and '>1</text>' in svg
+
+
+def test_heatmap_label_extent_matches_text(court_ax):
+    court, ax = court_ax
+    court.heatmap(ax, [1.0], [5.0], annot=True, annot_kws={'fontsize': 12})
+    labels = ax.artists[-1]
+    x, y = labels._xy[0]
+    reference = ax.text(x, y, '1', ha='center', va='center', fontsize=12)
+    renderer = ax.figure.canvas.get_renderer()
+
+    np.testing.assert_allclose(labels.get_window_extent(renderer).extents,
+                               reference.get_window_extent(renderer).extents, atol=1)
+
+
+def test_arrow_heads_default_to_court_scale(court_ax):
+    court, ax = court_ax
+    x0, y0, x1, y1 = np.zeros(3), np.zeros(3), np.zeros(3), np.array([4.0, 6.0, 8.0])
+    _, thin = court.arrows(ax, x0, y0, x1, y1, method='collection', linewidth=0.5)
+    _, thick = court.arrows(ax, x0, y0, x1, y1, method='collection', linewidth=[1, 4, 8])
+
+    thin_heads = np.array([path.vertices[:3] for path in thin.get_paths()])
+    thick_heads = np.array([path.vertices[:3] for path in thick.get_paths()])
+    np.testing.assert_allclose(thin_heads, thick_heads)
+    # Tip to base along the arrow: 5% of the singles width
+    length = np.abs(thin_heads[:, 0] - (thin_heads[:, 1] + thin_heads[:, 2]) / 2).max(axis=1)
+    np.testing.assert_allclose(length, 0.05 * 8.23)
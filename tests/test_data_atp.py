@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+
+from BsuTennis.data import load_atp
+from BsuTennis.data.atp import ATP_DTYPES
+
+
+def _write_season(path, dates, entry):
+    pd.DataFrame({
+        'tourney_id': ['2023-580'] * len(dates),
+        'surface': ['Hard'] * len(dates),
+        'tourney_date': dates,
+        'winner_id': range(len(dates)),
+        'winner_entry': entry,
+        'winner_name': ['A'] * len(dates),
+        'loser_name': ['B'] * len(dates),
+        'w_ace': [3] * len(dates),
+    }).to_csv(path, index=False)
+
+
+@pytest.mark.parametrize('cache_format', ['parquet', 'feather'])
+def test_load_atp_keeps_schema_for_all_missing_column(tmp_path, cache_format):
+    _write_season(tmp_path / 'atp_matches_2023.csv', ['20230105', '20230601'], [None, None])
+    _write_season(tmp_path / 'atp_matches_2024.csv', ['20240110'], ['WC'])
+
+    df = load_atp(str(tmp_path), cache_format=cache_format)
+    again = load_atp(str(tmp_path / 'atp_matches_2023.csv'), cache_format=cache_format)
+
+    assert len(df) == 3
+    assert df['winner_entry'].dtype == ATP_DTYPES['winner_entry']
+    assert again['winner_entry'].dtype == ATP_DTYPES['winner_entry']
+    assert again['winner_id'].dtype == ATP_DTYPES['winner_id']
+
+
+def test_load_atp_parquet_cache_has_one_row_group_per_year(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    csv_path = tmp_path / 'atp_matches_2023.csv'
+    _write_season(csv_path, ['20221230', '20230105', '20230601'], ['Q', None, 'WC'])
+
+    df = load_atp(str(csv_path), years=2023)
+
+    cache = pq.ParquetFile(tmp_path / '_cache' / 'atp_matches_2023.parquet')
+    assert cache.num_row_groups == 2
+    assert df['year'].tolist() == [2023, 2023]
@@ -0,0 +1,74 @@
+import pandas as pd
+
+from BsuTennis.data import load_many, iter_ao_points
+from BsuTennis.data.ao import AO_POINT_DTYPES
+
+
+def _write_event(folder):
+    points = folder / '2019-ausopen-points.csv'
+    pd.DataFrame({
+        'match_id': ['2019-ausopen-1101', '2019-ausopen-1101', '2019-ausopen-1102'],
+        'SetNo': [1, 1, 1],
+        'PointWinner': [1, 2, 1],
+        'Speed_KMH': [190, 0, 201],
+        'ServeWidth': ['W', '', 'C'],
+    }).to_csv(points, index=False)
+    pd.DataFrame({
+        'match_id': ['2019-ausopen-1101', '2019-ausopen-1102'],
+        'player1': ['Novak Djokovic', 'Rafael Nadal'],
+        'player2': ['Mitchell Krueger', 'James Duckworth'],
+        'round': [1, 1],
+    }).to_csv(folder / '2019-ausopen-matches.csv', index=False)
+    return points
+
+
+def test_load_many_ao_filter_matching_nothing(tmp_path):
+    points = _write_event(tmp_path)
+    assert list(iter_ao_points(str(points), players='Nobody')) == []
+
+    df = load_many([points], loader='ao', workers=1, players='Nobody')
+
+    assert len(df) == 0
+    assert list(df.columns) == ['match_id', 'SetNo', 'PointWinner', 'Speed_KMH',
+                                'ServeWidth', 'source']
+    for col in ('SetNo', 'PointWinner', 'Speed_KMH'):
+        assert df[col].dtype == AO_POINT_DTYPES[col]
+
+
+def test_load_many_ao_mixes_empty_and_matching_files(tmp_path):
+    first = tmp_path / 'a'
+    second = tmp_path / 'b'
+    first.mkdir()
+    second.mkdir()
+    _write_event(first)
+    points = _write_event(second)
+    pd.DataFrame({'match_id': ['2019-ausopen-1101'], 'player1': ['Someone Else'],
+                  'player2': ['Another'], 'round': [1]}).to_csv(
+        second / '2019-ausopen-matches.csv', index=False)
+
+    df = load_many([first / '2019-ausopen-points.csv', points], loader='ao', workers=1,
+                   players='Novak Djokovic')
+
+    assert len(df) == 2
+    assert (df['match_id'] == '2019-ausopen-1101').all()
+
+
+def test_load_many_atp_season_with_empty_categorical(tmp_path):
+    paths = []
+    for year, entries in [(2022, ['Q']), (2023, [None, None]), (2024, ['WC'])]:
+        path = tmp_path / f'atp_matches_{year}.csv'
+        pd.DataFrame({
+            'tourney_id': [f'{year}-580'] * len(entries),
+            'tourney_date': [f'{year}0105'] * len(entries),
+            'winner_id': range(len(entries)),
+            'winner_entry': entries,
+            'winner_name': ['A'] * len(entries),
+        }).to_csv(path, index=False)
+        paths.append(path)
+
+    df = load_many(paths, workers=1)
+
+    assert len(df) == 4
+    assert isinstance(df['winner_entry'].dtype, pd.CategoricalDtype)
+    assert df['winner_entry'].isna().tolist() == [False, True, True, False]
+    assert set(df['winner_entry'].cat.categories) == {'Q', 'WC'}
@@ -0,0 +1,109 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from BsuTennis.data import (DatasetCache, iter_ao_points, load_atp, load_many,
+                            load_rg_tracking, read_atp_csv)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DatasetCache(str(tmp_path / 'cache'))
+
+
+def _no_parse(cache, monkeypatch):
+    """Make any cache miss fail from here on."""
+    def put(*args, **kwargs):
+        raise AssertionError('expected a cache hit')
+    monkeypatch.setattr(cache, 'put', put)
+
+
+def _write_season(path, year=2023):
+    pd.DataFrame({
+        'tourney_id': [f'{year}-580', f'{year}-580'],
+        'tourney_date': [f'{year}0105', f'{year}0601'],
+        'winner_id': [1, 2],
+        'winner_entry': [None, None],
+        'winner_name': ['A', 'B'],
+        'w_ace': [3, 5],
+    }).to_csv(path, index=False)
+    return path
+
+
+def test_load_atp_second_load_is_cache_hit(tmp_path, cache, monkeypatch):
+    csv_path = str(_write_season(tmp_path / 'atp_matches_2023.csv'))
+    first = load_atp(csv_path, cache=cache)
+    _no_parse(cache, monkeypatch)
+
+    again = load_atp(csv_path, cache=cache)
+    subset = load_atp(csv_path, cache=cache, years=2023, columns=['w_ace'])
+
+    pd.testing.assert_frame_equal(first, again)
+    assert first['winner_entry'].dtype == 'category'
+    assert list(subset.columns) == ['tourney_date', 'year', 'w_ace']
+    assert not os.path.exists(tmp_path / '_cache')
+
+
+def test_load_many_second_load_is_cache_hit(tmp_path, cache, monkeypatch):
+    paths = [str(_write_season(tmp_path / f'atp_matches_{year}.csv', year)) for year in (2022, 2023)]
+    first = load_many(paths, workers=1, cache=cache)
+    _no_parse(cache, monkeypatch)
+
+    again = load_many(paths, workers=1, cache=cache)
+
+    pd.testing.assert_frame_equal(first, again)
+    assert again['source'].tolist() == ['atp_matches_2022.csv'] * 2 + ['atp_matches_2023.csv'] * 2
+    assert len(cache.info()) == 2
+
+
+def test_iter_ao_points_second_pass_is_cache_hit(tmp_path, cache, monkeypatch):
+    points = tmp_path / '2019-ausopen-points.csv'
+    pd.DataFrame({'match_id': ['m1', 'm1', 'm2'], 'SetNo': [1, 1, 2],
+                  'Speed_KMH': [190, None, 201]}).to_csv(points, index=False)
+    pd.DataFrame({'match_id': ['m1', 'm2'], 'player1': ['A', 'C'], 'player2': ['B', 'D'],
+                  'round': [1, 2]}).to_csv(tmp_path / '2019-ausopen-matches.csv', index=False)
+
+    first = pd.concat(iter_ao_points(str(points), players='A', cache=cache))
+    _no_parse(cache, monkeypatch)
+    chunks = list(iter_ao_points(str(points), players='A', chunksize=1, cache=cache))
+
+    assert len(chunks) == 2
+    pd.testing.assert_frame_equal(pd.concat(chunks).reset_index(drop=True),
+                                  first.reset_index(drop=True))
+
+
+def test_load_rg_tracking_second_load_is_cache_hit(tmp_path, cache, monkeypatch):
+    path = tmp_path / 'match.jsonl'
+    frames = [{'t': i / 25, 'ball': {'x': i, 'y': -i, 'z': 1.0},
+               'players': [{'x': 0, 'y': 1}, {'x': 2, 'y': None}]} for i in range(5)]
+    path.write_text('\n'.join(json.dumps(frame) for frame in frames))
+    first = load_rg_tracking(str(path), cache=cache)
+    _no_parse(cache, monkeypatch)
+
+    again = load_rg_tracking(str(path), cache=cache)
+    mapped = load_rg_tracking(str(path), out=str(tmp_path / 'match.npy'), cache=cache)
+
+    assert again.dtype == first.dtype
+    for name in first.dtype.names:
+        np.testing.assert_array_equal(again[name], first[name])
+        np.testing.assert_array_equal(mapped[name], first[name])
+
+
+def test_cache_index_forgets_removed_entries(tmp_path, cache):
+    path = str(_write_season(tmp_path / 'atp_matches_2023.csv'))
+    cache.load(path, read_atp_csv)
+    assert len(cache._index['sources']) == 1
+
+    cache.evict(0)
+    assert cache._index['sources'] == {} and cache._index['entries'] == {}
+
+    cache.load(path, read_atp_csv)
+    key = cache.info()['key'][0]
+    os.remove(cache._entry_path(key))
+    assert cache.get(key) is None
+
+    reopened = DatasetCache(cache.cache_dir)
+    assert reopened._index['entries'] == {} and reopened._index['sources'] == {}
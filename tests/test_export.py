@@ -0,0 +1,100 @@
+import os
+import time
+from unittest import mock
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from BsuTennis import export_figures
+from BsuTennis.export import _render
+
+
+def _line_plot(data, color='k'):
+    fig, ax = plt.subplots(figsize=(2, 2))
+    ax.plot(data, color=color)
+    return fig
+
+
+def _draw_on_current(data):
+    plt.figure(figsize=(2, 2))
+    plt.plot(data)
+
+
+def _slow_plot(delay):
+    time.sleep(delay)
+    return _line_plot([0, delay])
+
+
+def _fail(data):
+    raise RuntimeError('boom')
+
+
+def test_render_closes_only_its_own_figures(tmp_path):
+    user_fig = plt.figure()
+    try:
+        record = _render(_line_plot, np.arange(3), {}, str(tmp_path / 'a.png'), {}, False)
+        assert record['error'] is None
+        record = _render(_draw_on_current, np.arange(3), {}, str(tmp_path / 'b.png'), {}, False)
+        assert record['error'] is None
+        record = _render(_fail, None, {}, str(tmp_path / 'c.png'), {}, True)
+        assert record['error'] == 'RuntimeError: boom'
+        assert plt.get_fignums() == [user_fig.number]
+    finally:
+        plt.close(user_fig)
+
+
+def test_export_single_worker_leaves_caller_figures(tmp_path):
+    user_fig = plt.figure()
+    try:
+        specs = [(_line_plot, np.arange(5), {'color': 'r'}, str(tmp_path / 'out' / f'{i}.png'))
+                 for i in range(3)]
+        specs.append({'func': _fail, 'path': str(tmp_path / 'bad.png')})
+
+        timings = export_figures(specs, workers=1, on_error='record', dpi=50)
+
+        assert plt.fignum_exists(user_fig.number)
+        assert list(timings['path']) == [spec[3] for spec in specs[:3]] + [specs[3]['path']]
+        assert sorted(os.listdir(tmp_path / 'out')) == ['0.png', '1.png', '2.png']
+        assert (timings['pid'] != os.getpid()).all()
+        assert timings['error'].iloc[-1] == 'RuntimeError: boom'
+        assert (timings['seconds'].iloc[:3] > 0).all()
+    finally:
+        plt.close(user_fig)
+
+
+def test_export_rejects_memory_limit_above_hard_limit(tmp_path):
+    resource = pytest.importorskip('resource')
+    with mock.patch.object(resource, 'getrlimit', return_value=(2 ** 40, 2 ** 40)):
+        with pytest.raises(ValueError, match='memory_limit'):
+            export_figures([(_line_plot, np.arange(3), {}, str(tmp_path / 'a.png'))],
+                           workers=1, memory_limit=2 ** 41)
+
+
+def test_init_worker_clamps_memory_limit_to_hard_limit():
+    resource = pytest.importorskip('resource')
+    from BsuTennis.export import _init_worker
+    limits = resource.getrlimit(resource.RLIMIT_AS)
+    calls = []
+    with mock.patch.object(resource, 'getrlimit', return_value=(2 ** 40, 2 ** 40)), \
+            mock.patch.object(resource, 'setrlimit', side_effect=lambda *a: calls.append(a)):
+        _init_worker(2 ** 41)
+    assert calls == [(resource.RLIMIT_AS, (2 ** 40, 2 ** 40))]
+    assert resource.getrlimit(resource.RLIMIT_AS) == limits
+
+
+def test_export_recycling_does_not_wait_for_slow_figure(tmp_path):
+    # One figure per worker generation: under a batch barrier the fast
+    # figures of later generations would all finish after the slow one
+    delays = [2.0, 0, 0, 0, 0]
+    specs = [(_slow_plot, delay, {}, str(tmp_path / f'{i}.png')) for i, delay in enumerate(delays)]
+    order = []
+
+    timings = export_figures(specs, workers=2, max_tasks_per_child=1,
+                             progress=lambda record: order.append(record['path']))
+
+    assert order[-1] == specs[0][3]
+    assert timings['error'].isna().all()
+    assert all(os.path.exists(spec[3]) for spec in specs)
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from BsuTennis.kde import density_1d, density_2d
+
+
+@pytest.fixture
+def shots():
+    rng = np.random.default_rng(7)
+    return rng.normal(0, 2.0, 2000), rng.normal(5, 3.0, 2000)
+
+
+def test_binned_matches_exact_within_tolerance(shots):
+    x, y = shots
+    xgrid, ygrid = np.linspace(-8, 8, 200), np.linspace(-8, 18, 200)
+    exact = density_2d(x, y, xgrid, ygrid, method='exact')
+    binned = density_2d(x, y, xgrid, ygrid, method='binned')
+    assert np.abs(binned - exact).max() < 0.01 * exact.max()
+
+    grid = np.linspace(-8, 8, 200)
+    exact = density_1d(x, grid, method='exact')
+    assert np.abs(density_1d(x, grid, method='binned') - exact).max() < 0.01 * exact.max()
+
+
+def test_binned_narrow_bandwidth_falls_back_to_exact():
+    # A tight cluster on a coarse grid: bandwidth well under 2 cells
+    rng = np.random.default_rng(3)
+    x, y = rng.normal(0, 0.2, 500), rng.normal(0, 0.2, 500)
+    xgrid = ygrid = np.linspace(-10, 10, 40)
+    exact = density_2d(x, y, xgrid, ygrid, method='exact')
+    binned = density_2d(x, y, xgrid, ygrid, method='binned')
+    np.testing.assert_allclose(binned, exact)
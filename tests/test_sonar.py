@@ -0,0 +1,25 @@
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.colors import to_rgba
+
+from BsuTennis import sonar_chart
+
+
+def test_sonar_negative_values_scale_by_magnitude():
+    fig, ax = plt.subplots()
+    try:
+        zone = {'x': 0, 'y': 5, 'directions': [2.0, -4.0, 1.0, 0.0]}
+        wedges, _ = sonar_chart(ax, [zone], n_directions=4, zone_size=1.0,
+                                label_fmt='.1f', negative_color='k')
+        radii = [np.hypot(*(path.vertices - [0, 5]).T).max() for path in wedges.get_paths()]
+        # The negative wedge is the longest and every radius is positive
+        assert np.argmax(radii) == 1
+        assert min(radii) > 0
+        faces = wedges.get_facecolors()
+        assert np.allclose(faces[1][:3], to_rgba('k')[:3])
+        assert not np.allclose(faces[0][:3], to_rgba('k')[:3])
+        fig.canvas.draw()
+    finally:
+        plt.close(fig)
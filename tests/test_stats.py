@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from BsuTennis import classify_serve_zone, classify_shot_depth, transform_coordinate
+from BsuTennis.stats import SERVE_SIDES, SERVE_ZONES, SHOT_DEPTHS
+
+HALF_WIDTH = 8.23 / 2
+THIRD_WIDTH = HALF_WIDTH / 3
+
+# Every service box edge, just either side of it, and past the sidelines
+_EDGES = [-HALF_WIDTH, -2 * THIRD_WIDTH, -THIRD_WIDTH, 0.0,
+          THIRD_WIDTH, 2 * THIRD_WIDTH, HALF_WIDTH]
+SERVE_X = np.array(sorted(set(_EDGES + [np.nextafter(e, -np.inf) for e in _EDGES]
+                              + [np.nextafter(e, np.inf) for e in _EDGES])) + [np.nan])
+SERVE_Y = np.array([-1.0, 0.0, 1e-9, 3.0, 6.4, np.nextafter(6.4, np.inf), np.nan])
+
+
+def _grid(xs, ys):
+    xx, yy = np.meshgrid(xs, ys)
+    return xx.ravel(), yy.ravel()
+
+
+def test_transform_coordinate_array_matches_scalar():
+    x, y = _grid([0.0, 5.485, 10.97, np.nan], [-2.0, 0.0, 11.885, 23.77, 30.0, np.nan])
+    new_x, new_y = transform_coordinate(x, y)
+    expected = np.array([transform_coordinate(a, b) for a, b in zip(x, y)])
+
+    np.testing.assert_array_equal(new_x, expected[:, 0])
+    np.testing.assert_array_equal(new_y, expected[:, 1])
+    # The net line itself (new_y == 0) is not mirrored
+    assert transform_coordinate(1.0, 11.885) == (1.0 - 5.485, 0.0)
+
+
+def test_transform_coordinate_in_place_matches_copy():
+    x, y = _grid([0.0, 5.485, 10.97], [0.0, 11.885, 23.77])
+    expected = transform_coordinate(x, y)
+    buf_x, buf_y = x.copy(), y.copy()
+
+    result = transform_coordinate(buf_x, buf_y, out=(buf_x, buf_y))
+
+    assert result[0] is buf_x and result[1] is buf_y
+    np.testing.assert_array_equal(buf_x, expected[0])
+    np.testing.assert_array_equal(buf_y, expected[1])
+
+
+def test_classify_serve_zone_array_matches_scalar():
+    x, y = _grid(SERVE_X, SERVE_Y)
+    labels = classify_serve_zone(x, y)
+    expected = [classify_serve_zone(float(a), float(b)) for a, b in zip(x, y)]
+
+    assert list(labels) == expected
+    codes = classify_serve_zone(x, y, output='code')
+    assert codes.dtype == np.int8
+    assert [SERVE_ZONES[c] for c in codes] == expected
+    categories = classify_serve_zone(x, y, output='category')
+    assert list(categories.astype(object)) == expected
+
+
+def _side_labels(sides, output):
+    if output == 'code':
+        return [SERVE_SIDES[s] if s >= 0 else None for s in sides]
+    return [None if pd.isna(s) else s for s in sides]
+
+
+@pytest.mark.parametrize('output', ['label', 'code', 'category'])
+def test_classify_serve_zone_side(output):
+    x, y = _grid(SERVE_X, SERVE_Y)
+    zones, sides = classify_serve_zone(x, y, output=output, side=True)
+    zone_labels = [classify_serve_zone(float(a), float(b)) for a, b in zip(x, y)]
+    expected = [None if zone == 'Out' else SERVE_SIDES[int(a > 0)]
+                for zone, a in zip(zone_labels, x)]
+
+    assert _side_labels(sides, output) == expected
+    assert list(zones) == list(classify_serve_zone(x, y, output=output))
+
+    # Scalar input with side=True matches the array result element-wise
+    scalar = [classify_serve_zone(float(a), float(b), output=output, side=True)
+              for a, b in zip(x, y)]
+    assert [zone for zone, _ in scalar] == list(zones)
+    assert _side_labels([side for _, side in scalar], output) == expected
+
+
+def test_classify_shot_depth_array_matches_scalar():
+    y = np.array([0.0, 6.4, np.nextafter(6.4, np.inf), 9.0, np.nextafter(9.0, np.inf),
+                  11.885, np.nan])
+    labels = classify_shot_depth(y)
+    expected = ['Short', 'Short', 'Medium', 'Medium', 'Deep', 'Deep', None]
+
+    assert list(labels) == expected
+    assert [classify_shot_depth(v) for v in y] == expected
+    codes = classify_shot_depth(y, output='code')
+    assert codes.dtype == np.int8
+    assert list(codes) == [0, 0, 1, 1, 2, 2, -1]
+    assert [classify_shot_depth(v, output='code') for v in y] == list(codes)
+    categories = classify_shot_depth(y, output='category')
+    assert list(categories.codes) == list(codes)
+    assert list(categories.categories) == list(SHOT_DEPTHS)
+
+
+def test_classify_shot_depth_custom_thresholds():
+    y = np.array([5.0, 5.5, 8.0, 8.5])
+    assert list(classify_shot_depth(y, thresholds=(5.0, 8.0))) == \
+        ['Short', 'Medium', 'Medium', 'Deep']
+    with pytest.raises(ValueError):
+        classify_shot_depth(y, thresholds=(9.0, 6.4))